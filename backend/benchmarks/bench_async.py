@@ -0,0 +1,73 @@
+"""Compare the sync and async history read paths under concurrent load.
+
+The sync path is what the routes used to do: ``HandRepository`` called from
+Starlette's threadpool (40 workers by default). The async path awaits
+``AsyncHandRepository`` directly on the event loop. Both pools use the same
+DB_POOL_* settings, so the difference is the request-side concurrency limit.
+
+    DATABASE_URL=... python -m benchmarks.bench_async --requests 5000 --concurrency 200
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from starlette.concurrency import run_in_threadpool
+
+from src.db import close_async_pool, close_pool, get_async_pool, get_pool
+from src.repositories.async_hand_repo import AsyncHandRepository
+from src.repositories.hand_repo import HandRepository
+
+
+async def run(call: Callable[[], Awaitable], requests: int, concurrency: int) -> dict:
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+
+    async def client():
+        for _ in remaining:
+            started = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": requests,
+        "seconds": round(elapsed, 3),
+        "requests_per_sec": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 2),
+    }
+
+
+async def main_async(args):
+    get_pool().wait()
+    await (await get_async_pool()).wait()
+    results = {}
+    try:
+        results["sync_threadpool"] = await run(
+            lambda: run_in_threadpool(HandRepository.list_page, args.limit), args.requests, args.concurrency
+        )
+        results["async"] = await run(
+            lambda: AsyncHandRepository.list_page(args.limit), args.requests, args.concurrency
+        )
+    finally:
+        close_pool()
+        await close_async_pool()
+    print(json.dumps(results, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync vs async hand history reads")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=50, help="page size per request")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
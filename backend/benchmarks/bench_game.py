@@ -0,0 +1,152 @@
+"""Timings for the game service hot paths, without Postgres.
+
+Hand histories go to the in-memory hand store and every source of
+randomness (table seeds, and through them deck shuffles and bot rolls, plus
+equity sampling) is seeded, so
+two runs on the same machine play the same hands.
+
+    python -m benchmarks.bench_game --output baseline.json
+    python -m benchmarks.bench_game --compare baseline.json --threshold 0.15
+
+Compare mode exits with status 1 when any case's median got slower than
+the baseline by more than the threshold.
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.models.game_state import GameState
+from src.repositories.hand_repo import HandRepository
+from src.repositories.memory_hand_repo import MemoryHandStore
+from src.services import game
+from src.services.bots import EquityPolicy, RandomPolicy
+from src.services.tables import registry
+
+
+def play_full_hand(gs: GameState):
+    while not game.is_hand_finished(gs):
+        game.bots_act_until_user_turn(gs, user_index=None)
+        if game.actor_indices(gs.poker_state):
+            raise Exception("Bot has no valid action")
+        game.deal_next_street(gs)
+    game.finalize_hand(gs)
+    gs.run_after_save()
+
+
+def act(game_id: str):
+    game.apply_action(game_id, "call")  # unknown tokens check or call
+    registry.remove(game_id)
+
+
+def start(num_players: int):
+    registry.remove(game.start_hand(num_players, 0, random.getrandbits(63)).id)
+
+
+def deal(num_players: int) -> GameState:
+    return game.deal_hand(num_players, random.randrange(num_players), seed=random.getrandbits(63))
+
+
+def live_table(num_players: int) -> str:
+    return game.start_hand(num_players, random.randrange(num_players), random.getrandbits(63)).id
+
+
+# name -> (untimed setup taking the player count, timed operation taking its result)
+CASES: Dict[str, Tuple[Callable[[int], Any], Callable[[Any], None]]] = {
+    "create_state": (lambda n: n, game.create_state),
+    "start_hand": (lambda n: n, start),
+    "apply_action": (live_table, act),
+    "full_hand": (deal, play_full_hand),
+}
+
+
+def time_case(case, num_players: int, iterations: int, warmup: int) -> dict:
+    setup, op = case
+    for _ in range(warmup):
+        op(setup(num_players))
+    samples = []
+    for _ in range(iterations):
+        arg = setup(num_players)
+        started = time.perf_counter()
+        op(arg)
+        samples.append((time.perf_counter() - started) * 1e6)
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "mean_us": round(statistics.fmean(samples), 1),
+        "p50_us": round(samples[len(samples) // 2], 1),
+        "p95_us": round(samples[max(0, int(len(samples) * 0.95) - 1)], 1),
+        "ops_per_sec": round(1e6 / statistics.fmean(samples), 1),
+    }
+
+
+def run(cases: List[str], iterations: int, warmup: int, num_players: int, seed: int, policy: str) -> dict:
+    random.seed(seed)
+    if policy == "equity":
+        # Every table is seeded, so the bots sample a fixed count from the table seed.
+        game.bot_policy = EquityPolicy()
+    else:
+        game.bot_policy = RandomPolicy()
+    HandRepository.use(MemoryHandStore())
+    game.WRITE_BEHIND = False
+
+    results = {name: time_case(CASES[name], num_players, iterations, warmup) for name in cases}
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "seed": seed,
+            "players": num_players,
+            "policy": policy,
+        },
+        "cases": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    regressions = []
+    for name, result in current["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if not base:
+            continue
+        change = result["p50_us"] / base["p50_us"] - 1
+        result["change"] = round(change, 3)
+        if change > threshold:
+            regressions.append(f"{name}: p50 {base['p50_us']}us -> {result['p50_us']}us (+{change:.0%})")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark the game service hot paths")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy", choices=["equity", "random"], default="equity")
+    parser.add_argument("--output", help="write results as JSON here (e.g. a new baseline)")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed p50 slowdown, as a fraction")
+    args = parser.parse_args(argv)
+
+    result = run(args.cases, args.iterations, args.warmup, args.players, args.seed, args.policy)
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(result, json.load(f), args.threshold)
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
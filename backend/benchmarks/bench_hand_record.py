@@ -0,0 +1,83 @@
+"""Size and speed of binary hand records against the text they replace.
+
+Plays seeded bot-only hands, then reports the average stored size of the
+four text fields (raw and zlib-compressed, for reference) and of the
+record. It also times packing from the action log (the live path),
+packing parsed text (the migration path), decoding, and rendering the
+text back for the UI.
+
+    python -m benchmarks.bench_hand_record --hands 2000 --players 6
+"""
+import argparse
+import json
+import random
+import time
+import zlib
+from dataclasses import replace
+from typing import List, Optional
+
+from src.models.hand import HandHistory
+from src.services.game import (
+    actor_indices, bots_act_until_user_turn, build_hand_history, deal_hand, deal_next_street, is_hand_finished,
+)
+from src.services.hand_record import decode_record, encode_hand, render_record
+
+
+def _rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds else 0.0
+
+
+def _timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def _texts(hand: HandHistory) -> str:
+    return hand.mainInfo + hand.dealt + hand.actions + hand.result
+
+
+def run(count: int, num_players: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    tables = []
+    for i in range(count):
+        gs = deal_hand(num_players, i % num_players, seed=rng.getrandbits(63))
+        while not is_hand_finished(gs):
+            bots_act_until_user_turn(gs, None)
+            if not actor_indices(gs.poker_state):
+                deal_next_street(gs)
+        tables.append(gs)
+    hands = [build_hand_history(gs) for gs in tables]
+    unpacked = [replace(hand, record=None) for hand in hands]
+    records = [hand.record for hand in hands]
+
+    text_bytes = sum(len(_texts(hand).encode()) for hand in hands)
+    return {
+        "meta": {"hands": count, "players": num_players, "seed": seed},
+        "bytes_per_hand": {
+            "text": round(text_bytes / count, 1),
+            "text_zlib": round(sum(len(zlib.compress(_texts(hand).encode())) for hand in hands) / count, 1),
+            "record": round(sum(len(record) for record in records) / count, 1),
+        },
+        "per_sec": {
+            "encode_from_log": _rate(count, _timed(
+                lambda: [encode_hand(hand, gs.actions_log.events) for hand, gs in zip(hands, tables)]
+            )),
+            "encode_from_text": _rate(count, _timed(lambda: [encode_hand(hand) for hand in unpacked])),
+            "decode": _rate(count, _timed(lambda: [decode_record(record) for record in records])),
+            "decode_and_render": _rate(count, _timed(lambda: [render_record(record) for record in records])),
+        },
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark binary hand records")
+    parser.add_argument("--hands", type=int, default=2000)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.hands, args.players, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Save/get/list throughput for each hand store backend.
+
+Plays seeded bot-only hands once, then for each backend times single-hand
+saves, batched saves (the hand writer's path), lookups by id and
+newest-first pages walked with the cursor. Postgres is included when
+``DATABASE_URL`` is set. Its ``hands`` table is written to, so point it at
+a scratch database.
+
+    python -m benchmarks.bench_hand_store --hands 2000
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from dataclasses import replace
+from typing import Dict, List, Optional
+
+from src.models.hand import HandHistory
+from src.repositories.hand_repo import HandStore, PostgresHandStore
+from src.repositories.memory_hand_repo import MemoryHandStore
+from src.repositories.sqlite_hand_repo import SQLiteHandStore
+from src.services.simulator import play_hand
+
+
+def _rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds else 0.0
+
+
+def _timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def bench(store: HandStore, hands: List[HandHistory], batch: int, page: int) -> Dict[str, float]:
+    half = len(hands) // 2
+    singles, batched = hands[:half], hands[half:]
+    ids = [hand.id for hand in hands]
+    random.Random(0).shuffle(ids)
+
+    def walk():
+        before = None
+        while True:
+            rows = store.list_page(page, before)
+            if len(rows) < page:
+                return
+            before = (rows[-1].created_at, rows[-1].id)
+
+    return {
+        "save_hand_per_sec": _rate(len(singles), _timed(lambda: [store.save_hand(h) for h in singles])),
+        "save_hands_per_sec": _rate(len(batched), _timed(
+            lambda: [store.save_hands(batched[i:i + batch]) for i in range(0, len(batched), batch)]
+        )),
+        "get_per_sec": _rate(len(ids), _timed(lambda: [store.get(hand_id) for hand_id in ids])),
+        "list_rows_per_sec": _rate(len(hands), _timed(walk)),
+    }
+
+
+def run(count: int, num_players: int, seed: int, batch: int, page: int) -> dict:
+    rng = random.Random(seed)
+    template = [play_hand(num_players, i % num_players, seed=rng.getrandbits(63)) for i in range(min(count, 500))]
+    tag = f"bench-{seed}-{time.time_ns()}"
+    hands = [replace(template[i % len(template)], id=f"{tag}-{i}", seats=list(template[i % len(template)].seats))
+             for i in range(count)]
+
+    tmp = tempfile.mkdtemp()
+    stores: Dict[str, HandStore] = {
+        "memory": MemoryHandStore(),
+        "sqlite": SQLiteHandStore(os.path.join(tmp, "bench.sqlite3")),
+    }
+    if os.getenv("DATABASE_URL"):
+        stores["postgres"] = PostgresHandStore()
+        stores["postgres"].init()
+
+    results = {}
+    for name, store in stores.items():
+        results[name] = bench(store, [replace(h, created_at=None) for h in hands], batch, page)
+        store.close()
+    return {
+        "meta": {"hands": count, "players": num_players, "seed": seed, "batch": batch, "page": page},
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark hand store backends")
+    parser.add_argument("--hands", type=int, default=2000)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch", type=int, default=500, help="hands per save_hands call")
+    parser.add_argument("--page", type=int, default=50, help="rows per list page")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.hands, args.players, args.seed, args.batch, args.page), indent=2))
+
+
+if __name__ == "__main__":
+    main()
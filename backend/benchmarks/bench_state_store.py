@@ -0,0 +1,86 @@
+"""Cost of externalizing a table: serialize/deserialize per action, and store round trips.
+
+Plays seeded bot-only hands and, after every bot action, times
+``serialize``/``deserialize`` of the whole ``GameState`` and a save plus
+version check and load through each store.
+
+    python -m benchmarks.bench_state_store --hands 50
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from src.services import game
+from src.services.bots import RandomPolicy
+from src.services.state_store import MemoryStateStore, SQLiteStateStore, deserialize, serialize
+
+
+def _summary(samples: List[float]) -> dict:
+    samples = sorted(samples)
+    return {
+        "mean": round(statistics.fmean(samples), 1),
+        "p50": round(samples[len(samples) // 2], 1),
+        "p95": round(samples[max(0, int(len(samples) * 0.95) - 1)], 1),
+    }
+
+
+def _timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1e6
+
+
+def run(hands: int, num_players: int, seed: int, level: int) -> dict:
+    random.seed(seed)
+    game.bot_policy = RandomPolicy()
+    tmp = tempfile.mkdtemp()
+    stores = {"memory": MemoryStateStore(), "sqlite": SQLiteStateStore(os.path.join(tmp, "bench.sqlite3"))}
+    timings: Dict[str, List[float]] = {"serialize_us": [], "deserialize_us": [], "bytes": []}
+    for name in stores:
+        timings[f"{name}_save_us"] = []
+        timings[f"{name}_load_us"] = []
+
+    for _ in range(hands):
+        gs = game.deal_hand(num_players, random.randrange(num_players), seed=random.getrandbits(63))
+        versions = {name: store.create(gs) for name, store in stores.items()}
+        while not game.is_hand_finished(gs):
+            while game.actor_indices(gs.poker_state):
+                game.apply_bot_decision(gs, gs.poker_state.actor_indices[0], game.bot_policy.decide(gs, gs.poker_state.actor_indices[0]))
+                blob = serialize(gs, level)
+                timings["bytes"].append(len(blob))
+                timings["serialize_us"].append(_timed(lambda: serialize(gs, level)))
+                timings["deserialize_us"].append(_timed(lambda: deserialize(blob)))
+                for name, store in stores.items():
+                    version = versions[name]
+                    timings[f"{name}_save_us"].append(_timed(lambda: store.save(gs, version)))
+                    versions[name] = version + 1
+                    timings[f"{name}_load_us"].append(_timed(lambda: (store.version(gs.id), store.load(gs.id))))
+            game.deal_next_street(gs)
+        for store in stores.values():
+            store.delete(gs.id)
+
+    stores["sqlite"].close()
+    return {
+        "meta": {"hands": hands, "players": num_players, "seed": seed, "zlib_level": level,
+                 "actions": len(timings["bytes"])},
+        "results": {name: _summary(samples) for name, samples in timings.items()},
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark table serialization and state stores")
+    parser.add_argument("--hands", type=int, default=50)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--level", type=int, default=1, help="zlib compression level")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.hands, args.players, args.seed, args.level), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Drive the HTTP API the way the frontend does and report latency percentiles.
+
+Each simulated player starts a hand, acts until it finishes (mostly
+check/call, sometimes fold or all-in, sending ``since`` like the page
+does) and then refreshes the history with ``If-None-Match``. Latency is
+recorded per endpoint.
+
+By default the app runs in-process through httpx's ASGI transport with
+``HAND_STORE=memory`` (or ``--store sqlite``), so no Postgres is needed.
+Everything then shares one process and one GIL, so use it to compare
+builds. To size a deployment, start a real server and pass ``--url``:
+
+    python -m benchmarks.load_test --players 50 --duration 30
+    HAND_STORE=sqlite uvicorn src.main:app --workers 4 &
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --ramp --max-players 512
+
+Ramp mode doubles the number of players every ``--step`` seconds. It stops
+at the first level where throughput grows less than ``--min-gain``, p99
+goes over ``--slo-ms`` or more than 1% of requests fail. The level before
+it, the last one that still scaled, is reported as the saturation point.
+If the first level already breaks the SLO or the error limit, there is
+no such level: ``saturated_at_players`` is null and
+``saturated_below_first_level`` is true, so rerun with fewer ``--players``.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import httpx
+
+ACTIONS = ["call"] * 16 + ["f"] * 3 + ["allin"]  # tokens the engine does not know check or call
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.hands = 0
+
+    async def call(self, name: str, request) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await request
+        except httpx.HTTPError:
+            self.errors[name] += 1
+            return None
+        self.latencies[name].append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 400:
+            self.errors[name] += 1
+        return response
+
+    def report(self, seconds: float) -> dict:
+        endpoints = {}
+        for name in sorted(set(self.latencies) | set(self.errors)):
+            samples = sorted(self.latencies[name])
+            endpoints[name] = {
+                "requests": len(samples),
+                "errors": self.errors[name],
+                "requests_per_sec": round(len(samples) / seconds, 1),
+                "p50_ms": _percentile(samples, 50),
+                "p95_ms": _percentile(samples, 95),
+                "p99_ms": _percentile(samples, 99),
+            }
+        every = sorted(x for samples in self.latencies.values() for x in samples)
+        requests = len(every)
+        errors = sum(self.errors.values())
+        return {
+            "seconds": round(seconds, 2),
+            "hands": self.hands,
+            "hands_per_sec": round(self.hands / seconds, 1),
+            "requests_per_sec": round(requests / seconds, 1),
+            "error_rate": round(errors / max(1, requests + errors), 4),
+            "p50_ms": _percentile(every, 50),
+            "p95_ms": _percentile(every, 95),
+            "p99_ms": _percentile(every, 99),
+            "endpoints": endpoints,
+        }
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    return round(samples[min(len(samples) - 1, max(0, int(len(samples) * pct / 100 + 0.5) - 1))], 2)
+
+
+def _finished_meanwhile(response: httpx.Response) -> bool:
+    # With the table scheduler on, bots and the action clock can end the hand between two requests.
+    return response.status_code == 400 and "already finished" in response.text
+
+
+async def player(client: httpx.AsyncClient, recorder: Recorder, deadline: float, rng: random.Random):
+    etag = None
+    while time.perf_counter() < deadline:
+        response = await recorder.call("POST /hands/start", client.post("/hands/start", json={"num_players": 6}))
+        if response is None or response.status_code != 200:
+            await asyncio.sleep(0.1)
+            continue
+        start = response.json()
+        game_id, seq = start["game_id"], len(start["log"])
+        for _ in range(40):
+            body = {"game_id": game_id, "action": rng.choice(ACTIONS), "since": seq}
+            response = await recorder.call("POST /hands/action", client.post("/hands/action", json=body))
+            if response is not None and _finished_meanwhile(response):
+                recorder.errors["POST /hands/action"] -= 1
+                recorder.hands += 1
+                break
+            if response is None or response.status_code != 200:
+                break
+            data = response.json()
+            seq = data["seq"]
+            if data["status"] == "FINISHED":
+                recorder.hands += 1
+                break
+
+        headers = {"If-None-Match": etag} if etag else {}
+        response = await recorder.call("GET /hands/", client.get("/hands/", headers=headers))
+        if response is not None and "etag" in response.headers:
+            etag = response.headers["etag"]
+
+
+async def run_level(client: httpx.AsyncClient, players: int, seconds: float, seed: int) -> dict:
+    recorder = Recorder()
+    started = time.perf_counter()
+    deadline = started + seconds
+    await asyncio.gather(*(
+        player(client, recorder, deadline, random.Random(seed * 100003 + i)) for i in range(players)
+    ))
+    result = recorder.report(time.perf_counter() - started)
+    result["players"] = players
+    return result
+
+
+async def ramp(client: httpx.AsyncClient, args) -> dict:
+    levels = []
+    players = args.players
+    best = None
+    saturated = False
+    while players <= args.max_players:
+        level = await run_level(client, players, args.step, args.seed)
+        levels.append(level)
+        print(f"{players:>5} players: {level['requests_per_sec']:>8} req/s  p99 {level['p99_ms']} ms", flush=True)
+        gain = (level["requests_per_sec"] / best["requests_per_sec"] - 1) if best else 1.0
+        if level["error_rate"] > 0.01 or (args.slo_ms and level["p99_ms"] > args.slo_ms) or gain < args.min_gain:
+            saturated = True
+            break
+        best = level
+        players *= 2
+    return {
+        "saturated_at_players": best["players"] if saturated and best else None,
+        "saturated_below_first_level": saturated and best is None,
+        "peak_requests_per_sec": max(level["requests_per_sec"] for level in levels),
+        "levels": levels,
+    }
+
+
+async def main_async(args) -> dict:
+    app = None
+    if args.url:
+        transport, base_url = None, args.url
+    else:
+        os.environ.setdefault("HAND_STORE", args.store)
+        os.environ.setdefault("LOG_LEVEL", "WARNING")
+        if args.store == "sqlite":
+            os.environ.setdefault("HAND_STORE_PATH", os.path.join(os.getcwd(), "loadtest.sqlite3"))
+        from src.main import app
+        await app.router.startup()
+        transport, base_url = httpx.ASGITransport(app=app), "http://loadtest"
+
+    limits = httpx.Limits(max_connections=args.max_players if args.ramp else args.players)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=args.timeout, limits=limits) as client:
+            if args.ramp:
+                return await ramp(client, args)
+            return await run_level(client, args.players, args.duration, args.seed)
+    finally:
+        if app is not None:
+            await app.router.shutdown()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Concurrent load test for the poker API")
+    parser.add_argument("--url", default=None, help="server to load; in-process ASGI when omitted")
+    parser.add_argument("--store", choices=["memory", "sqlite"], default="memory", help="in-process HAND_STORE")
+    parser.add_argument("--players", type=int, default=20, help="concurrent players (first level when ramping)")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds to run")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ramp", action="store_true", help="double players until the service saturates")
+    parser.add_argument("--max-players", type=int, default=1024)
+    parser.add_argument("--step", type=float, default=10.0, help="seconds per ramp level")
+    parser.add_argument("--min-gain", type=float, default=0.1, help="throughput growth below this ends the ramp")
+    parser.add_argument("--slo-ms", type=float, default=None, help="p99 above this ends the ramp")
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(main_async(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
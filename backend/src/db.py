@@ -1,23 +1,207 @@
+import asyncio
+import logging
 import psycopg
 import os
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 from psycopg import sql
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+from src import partitions
 
-def get_db_connection():
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "5"))
+DB_POOL_MAX_IDLE = float(os.getenv("DB_POOL_MAX_IDLE", "300"))
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+_async_pool: Optional[AsyncConnectionPool] = None
+_async_pool_lock = asyncio.Lock()
+
+def get_database_url() -> str:
     database_url = os.getenv("DATABASE_URL")
     if not database_url:
         raise ValueError("DATABASE_URL environment variable not set")
-    return psycopg.connect(database_url)
+    return database_url
+
+def get_pool() -> ConnectionPool:
+    """Process-wide pool, created on first use.
+
+    Connections are checked before being handed out, so a connection the
+    server dropped while idle is replaced instead of failing the request.
+    Borrowing waits at most DB_POOL_TIMEOUT seconds and then raises
+    psycopg_pool.PoolTimeout.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    get_database_url(),
+                    min_size=DB_POOL_MIN_SIZE,
+                    max_size=DB_POOL_MAX_SIZE,
+                    timeout=DB_POOL_TIMEOUT,
+                    max_idle=DB_POOL_MAX_IDLE,
+                    check=ConnectionPool.check_connection,
+                    name="hands",
+                    open=True,
+                )
+    return _pool
+
+def get_db_connection():
+    """Borrow a pooled connection; use as ``with get_db_connection() as conn``."""
+    return get_pool().connection()
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+async def get_async_pool() -> AsyncConnectionPool:
+    """Async counterpart of ``get_pool`` for the event-loop request path.
+
+    It uses the same size and timeout settings, so each process may hold up
+    to two DB_POOL_MAX_SIZE sets of connections.
+    """
+    global _async_pool
+    if _async_pool is None:
+        async with _async_pool_lock:
+            if _async_pool is None:
+                pool = AsyncConnectionPool(
+                    get_database_url(),
+                    min_size=DB_POOL_MIN_SIZE,
+                    max_size=DB_POOL_MAX_SIZE,
+                    timeout=DB_POOL_TIMEOUT,
+                    max_idle=DB_POOL_MAX_IDLE,
+                    check=AsyncConnectionPool.check_connection,
+                    name="hands-async",
+                    open=False,
+                )
+                await pool.open()
+                _async_pool = pool
+    return _async_pool
+
+@asynccontextmanager
+async def get_async_db_connection() -> AsyncIterator[psycopg.AsyncConnection]:
+    """Borrow an async pooled connection; use as ``async with get_async_db_connection() as conn``."""
+    pool = await get_async_pool()
+    async with pool.connection() as conn:
+        yield conn
+
+async def close_async_pool():
+    global _async_pool
+    if _async_pool is not None:
+        await _async_pool.close()
+        _async_pool = None
+
+def pool_stats() -> dict:
+    return {"sync": _stats(_pool), "async": _stats(_async_pool)}
+
+def _stats(pool) -> dict:
+    if pool is None:
+        return {"open": False}
+    stats = pool.get_stats()
+    requests = stats.get("requests_num", 0)
+    return {
+        "open": True,
+        "min_size": stats.get("pool_min"),
+        "max_size": stats.get("pool_max"),
+        "size": stats.get("pool_size", 0),
+        "in_use": stats.get("pool_size", 0) - stats.get("pool_available", 0),
+        "waiting": stats.get("requests_waiting", 0),
+        "requests": requests,
+        "requests_errors": stats.get("requests_errors", 0),
+        "acquire_ms_total": stats.get("requests_wait_ms", 0),
+        "acquire_ms_avg": stats.get("requests_wait_ms", 0) / requests if requests else 0.0,
+        "connections_lost": stats.get("connections_lost", 0),
+    }
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS hands (
+        id TEXT NOT NULL,
+        stack TEXT NOT NULL,
+        hands TEXT NOT NULL,
+        actions TEXT NOT NULL,
+        result TEXT NOT NULL,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        starting_stack INTEGER,
+        dealer_seat SMALLINT,
+        board TEXT[] NOT NULL DEFAULT '{}',
+        seed BIGINT,
+        operations TEXT[] NOT NULL DEFAULT '{}',
+        record BYTEA,
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at)
+    """,
+    "CREATE INDEX IF NOT EXISTS hands_created_at_id_idx ON hands (created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS hands_board_idx ON hands USING GIN (board)",
+    "CREATE INDEX IF NOT EXISTS hands_unpacked_idx ON hands (id) WHERE record IS NULL",
+    """
+    CREATE TABLE IF NOT EXISTS hand_seats (
+        hand_id TEXT NOT NULL,
+        seat SMALLINT NOT NULL,
+        hole_cards TEXT NOT NULL,
+        hand_class TEXT NOT NULL,
+        net INTEGER NOT NULL,
+        created_at TIMESTAMPTZ NOT NULL,
+        PRIMARY KEY (hand_id, seat, created_at)
+    ) PARTITION BY RANGE (created_at)
+    """,
+    "CREATE INDEX IF NOT EXISTS hand_seats_seat_net_idx ON hand_seats (seat, net)",
+    "CREATE INDEX IF NOT EXISTS hand_seats_class_idx ON hand_seats (hand_class, seat)",
+    "CREATE INDEX IF NOT EXISTS hand_seats_cards_idx ON hand_seats (hole_cards, seat)",
+    """
+    CREATE TABLE IF NOT EXISTS player_stats (
+        seat SMALLINT PRIMARY KEY,
+        hands BIGINT NOT NULL DEFAULT 0,
+        net BIGINT NOT NULL DEFAULT 0,
+        vpip BIGINT NOT NULL DEFAULT 0,
+        pfr BIGINT NOT NULL DEFAULT 0,
+        faced_bet BIGINT NOT NULL DEFAULT 0,
+        folded_to_bet BIGINT NOT NULL DEFAULT 0,
+        showdowns BIGINT NOT NULL DEFAULT 0,
+        showdowns_won BIGINT NOT NULL DEFAULT 0
+    )
+    """,
+]
+
+# Columns an unpartitioned ``hands`` table from an older build may lack.
+LEGACY_COLUMNS = [
+    "ALTER TABLE hands ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ NOT NULL DEFAULT now()",
+    "ALTER TABLE hands ADD COLUMN IF NOT EXISTS starting_stack INTEGER",
+    "ALTER TABLE hands ADD COLUMN IF NOT EXISTS dealer_seat SMALLINT",
+    "ALTER TABLE hands ADD COLUMN IF NOT EXISTS board TEXT[] NOT NULL DEFAULT '{}'",
+    "ALTER TABLE hands ADD COLUMN IF NOT EXISTS seed BIGINT",
+    "ALTER TABLE hands ADD COLUMN IF NOT EXISTS operations TEXT[] NOT NULL DEFAULT '{}'",
+    "ALTER TABLE hands ADD COLUMN IF NOT EXISTS record BYTEA",
+]
 
 def init_db():
+    """Create the schema and the partitions ``hands`` needs for the next few days.
+
+    Workers starting together serialize on an advisory lock and check the
+    schema only once they hold it. An unpartitioned ``hands`` table from an
+    older build is brought up to date and renamed aside, which is quick.
+    Its rows stay out of the API until ``python -m src.jobs.migrate_hands``
+    has moved them into partitions.
+    """
     with get_db_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute("""
-            CREATE TABLE IF NOT EXISTS hands (
-                id TEXT PRIMARY KEY,
-                stack TEXT NOT NULL,
-                hands TEXT NOT NULL,
-                actions TEXT NOT NULL,
-                result TEXT NOT NULL
-            )
-            """)
-        conn.commit()
\ No newline at end of file
+            partitions.lock_schema(cur)
+            if partitions.is_partitioned(cur, "hands") is False:
+                for statement in LEGACY_COLUMNS:
+                    cur.execute(statement)
+                partitions.rename_unpartitioned(cur)
+            for statement in SCHEMA:
+                cur.execute(statement)
+            partitions.ensure_ahead(cur)
+            pending = partitions.has_unpartitioned(cur)
+        conn.commit()
+    if pending:
+        logger.warning("Hands from before partitioning are not served yet; run python -m src.jobs.migrate_hands")
@@ -0,0 +1,101 @@
+"""Detach old ``hands`` partitions and archive them as gzipped NDJSON.
+
+    python -m src.jobs.archive_hands --keep-days 90 --dir archive
+    python -m src.jobs.archive_hands --keep-days 90 --dry-run
+
+Partitions that ended more than ``--keep-days`` days ago are detached from
+``hands`` and ``hand_seats``; from then on the API no longer sees them.
+Each one is streamed to ``<dir>/<partition>.ndjson.gz`` in the export
+format and dropped once the file is synced to disk. If a run stops
+halfway, the next run picks up the detached tables it left behind. An
+archive loads back with ``python -m src.jobs.import_hands <file>``.
+"""
+import argparse
+import gzip
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from psycopg import sql
+
+from src.db import close_pool, get_db_connection
+from src.partitions import detach, detached_partitions, list_partitions
+from src.repositories.hand_repo import EXPORT_TYPES, _export_query, _export_row_to_hand
+from src.services.hand_export import Throughput, to_ndjson
+
+DETACH_LOCK_TIMEOUT = os.getenv("DETACH_LOCK_TIMEOUT", "5s")
+
+
+def expired_partitions(keep_days: int, now: Optional[datetime] = None) -> List[str]:
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=keep_days)
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            return [name for name, _, end in list_partitions(cur) if end <= cutoff]
+
+
+def detach_expired(names: List[str]):
+    for name in names:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                # DETACH locks the parent tables; give up rather than queue behind long reads.
+                cur.execute("SELECT set_config('lock_timeout', %s, true)", (DETACH_LOCK_TIMEOUT,))
+                detach(cur, name)
+            conn.commit()
+        print(f"Detached {name}", file=sys.stderr)
+
+
+def archive(name: str, directory: str) -> Throughput:
+    """Write a detached partition to ``<directory>/<name>.ndjson.gz``, then drop it."""
+    seats = "hand_seats" + name[len("hands"):]
+    path = os.path.join(directory, f"{name}.ndjson.gz")
+    written = Throughput()
+    query, params = _export_query(None, sql.Identifier(name).as_string(), sql.Identifier(seats).as_string())
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            with gzip.open(path + ".part", "wt", encoding="utf-8") as out:
+                with cur.copy(query, params) as copy:
+                    copy.set_types(EXPORT_TYPES)
+                    for row in copy.rows():
+                        out.write(to_ndjson(_export_row_to_hand(row)))
+                        written.add()
+            with open(path + ".part", "rb") as part:
+                os.fsync(part.fileno())
+            os.replace(path + ".part", path)
+            cur.execute(sql.SQL("DROP TABLE IF EXISTS {}, {}").format(sql.Identifier(seats), sql.Identifier(name)))
+        conn.commit()
+    print(f"Archived {name}: {written} to {path}", file=sys.stderr)
+    return written
+
+
+def run(keep_days: int, directory: str, dry_run: bool = False) -> List[str]:
+    expired = expired_partitions(keep_days)
+    if dry_run:
+        for name in expired:
+            print(f"Would archive {name}", file=sys.stderr)
+        return expired
+    detach_expired(expired)
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            pending = detached_partitions(cur)
+    os.makedirs(directory, exist_ok=True)
+    for name in pending:
+        archive(name, directory)
+    return pending
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Archive and drop old hand partitions")
+    parser.add_argument("--keep-days", type=int, required=True, help="keep partitions newer than this")
+    parser.add_argument("--dir", default="archive", help="where the .ndjson.gz files go")
+    parser.add_argument("--dry-run", action="store_true", help="only list the partitions that would go")
+    args = parser.parse_args(argv)
+
+    try:
+        run(args.keep_days, args.dir, args.dry_run)
+    finally:
+        close_pool()
+
+
+if __name__ == "__main__":
+    main()
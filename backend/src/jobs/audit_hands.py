@@ -0,0 +1,90 @@
+"""Replay every stored hand and report the ones that no longer add up.
+
+    python -m src.jobs.audit_hands --workers 8 --chunk 2000
+
+Hands are read through a server-side cursor and replayed in chunks across
+a process pool. At most two chunks per worker are in flight, so memory
+stays flat however large the table is. Hands stored before seeds were
+recorded are counted as skipped. Exits with status 1 on any mismatch.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, List, Optional
+
+from src.models.hand import HandHistory
+from src.repositories.hand_repo import HandRepository
+from src.services.replay import ReplayResult, replay_batch
+
+
+@dataclass
+class AuditReport:
+    checked: int = 0
+    skipped: int = 0
+    mismatches: List[ReplayResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def add(self, results: List[ReplayResult]):
+        for result in results:
+            if result.ok:
+                self.checked += 1
+            elif result.error == "no seed or operations recorded":
+                self.skipped += 1
+            else:
+                self.checked += 1
+                self.mismatches.append(result)
+
+
+def _chunks(hands: Iterable[HandHistory], size: int) -> Iterable[List[HandHistory]]:
+    hands = iter(hands)
+    while chunk := list(islice(hands, size)):
+        yield chunk
+
+
+def audit(hands: Iterable[HandHistory], workers: Optional[int] = None, chunk_size: int = 2000) -> AuditReport:
+    workers = workers or os.cpu_count() or 1
+    report = AuditReport()
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in _chunks(hands, chunk_size):
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report.add(future.result())
+            pending.add(pool.submit(replay_batch, chunk))
+        for future in pending:
+            report.add(future.result())
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay stored hands and verify their results")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=2000, help="hands per task")
+    parser.add_argument("--batch", type=int, default=5000, help="rows fetched per cursor round trip")
+    parser.add_argument("--show", type=int, default=20, help="mismatches to print")
+    args = parser.parse_args(argv)
+
+    try:
+        report = audit(HandRepository.iter_all(args.batch), args.workers, args.chunk)
+    finally:
+        HandRepository.close()
+
+    rate = report.checked / report.seconds if report.seconds else 0.0
+    print(
+        f"Checked {report.checked} hands in {report.seconds:.1f}s ({rate:.0f} hands/sec), "
+        f"{len(report.mismatches)} mismatches, {report.skipped} without seeds"
+    )
+    for result in report.mismatches[:args.show]:
+        print(f"  {result.hand_id}: {result.error}")
+    return 1 if report.mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
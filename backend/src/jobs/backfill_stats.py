@@ -0,0 +1,40 @@
+"""Rebuild ``player_stats`` from every stored hand, in whichever ``HAND_STORE`` is configured.
+
+    python -m src.jobs.backfill_stats
+
+Packed hands give their seat actions straight from the record's log; hands
+that only carry the English ``actions`` and ``result`` strings are parsed
+back into seat actions. The rollup table is replaced in one
+transaction, so run it while no server is recording hands.
+"""
+import time
+from typing import Dict
+
+from src.repositories.hand_repo import HandRepository
+from src.services.stats import PlayerStats, totals_from_hands
+
+
+def backfill() -> Dict[int, PlayerStats]:
+    started = time.perf_counter()
+    count = 0
+
+    def hands():
+        nonlocal count
+        for hand in HandRepository.iter_all():
+            count += 1
+            yield hand
+
+    totals = totals_from_hands(hands())
+
+    HandRepository.replace_stats([(p.seat, *(getattr(p, c) for c in PlayerStats.COUNTERS)) for p in totals.values()])
+
+    elapsed = time.perf_counter() - started
+    print(f"Backfilled stats for {len(totals)} seats from {count} hands in {elapsed:.1f}s")
+    return totals
+
+
+if __name__ == "__main__":
+    try:
+        backfill()
+    finally:
+        HandRepository.close()
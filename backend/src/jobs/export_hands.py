@@ -0,0 +1,61 @@
+"""Stream the ``hands`` table to NDJSON or PokerStars text.
+
+    python -m src.jobs.export_hands --format ndjson --out hands.ndjson
+    python -m src.jobs.export_hands --format pokerstars --out hands.txt --cursor <cursor>
+
+Rows are streamed from the hand store (``COPY ... TO STDOUT`` on
+Postgres) and written as they arrive, so memory stays flat. Every
+``--progress`` rows the file is flushed and the throughput is printed
+with a cursor; passing that cursor back appends to the same file from
+the next hand on.
+"""
+import argparse
+import sys
+from typing import List, Optional
+
+from src.repositories.hand_repo import HandRepository
+from src.services.hand_export import FORMATS, Throughput, decode_cursor, encode_cursor, export_hands
+
+
+def export(fmt: str, out, cursor: Optional[str] = None, progress: int = 10000) -> Throughput:
+    after = decode_cursor(cursor) if cursor else None
+    written = Throughput()
+    skipped = 0
+    last = None
+    for hand, text in export_hands(fmt, after):
+        last = hand
+        if text is None:
+            skipped += 1
+            continue
+        out.write(text)
+        written.add()
+        if written.rows % progress == 0:
+            out.flush()
+            print(f"Exported {written}, resume with --cursor {encode_cursor(last)}", file=sys.stderr)
+    out.flush()
+    resume = f", resume with --cursor {encode_cursor(last)}" if last else ""
+    note = f", {skipped} hands without operations skipped" if skipped else ""
+    print(f"Exported {written}{note}{resume}", file=sys.stderr)
+    return written
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Export stored hands")
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--out", default="-", help="output file, '-' for stdout")
+    parser.add_argument("--cursor", default=None, help="resume after the hand this cursor points at")
+    parser.add_argument("--progress", type=int, default=10000, help="rows between progress lines")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.out == "-":
+            export(args.format, sys.stdout, args.cursor, args.progress)
+        else:
+            with open(args.out, "a" if args.cursor else "w", encoding="utf-8") as out:
+                export(args.format, out, args.cursor, args.progress)
+    finally:
+        HandRepository.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Bulk-load an NDJSON export back into ``hands`` and ``hand_seats``.
+
+    python -m src.jobs.import_hands hands.ndjson --batch 5000
+    python -m src.jobs.import_hands hands.ndjson --skip 120000
+    python -m src.jobs.import_hands archive/hands_p20260101.ndjson.gz
+
+Each batch goes in as one transaction (``COPY FROM`` on Postgres). After
+every batch the number of lines consumed is printed; ``--skip`` resumes
+from there. Hands that already exist are left alone, so overlapping a
+batch on resume is safe.
+"""
+import argparse
+import gzip
+import sys
+from itertools import islice
+from typing import List, Optional
+
+from src.repositories.hand_repo import HandRepository
+from src.services.hand_export import Throughput, import_hands
+
+
+def load(lines, batch_size: int = 5000, skip: int = 0) -> Throughput:
+    imported = Throughput()
+    read = Throughput()
+    consumed = 0
+    for consumed, inserted in import_hands(islice(lines, skip, None), batch_size):
+        imported.add(inserted)
+        read.rows = consumed
+        print(f"Read {read}, inserted {imported.rows}, resume with --skip {skip + consumed}", file=sys.stderr)
+    print(f"Imported {imported} from {consumed} lines", file=sys.stderr)
+    return imported
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Import hands from an NDJSON export")
+    parser.add_argument("path", help="NDJSON file (gzipped if it ends in .gz), '-' for stdin")
+    parser.add_argument("--batch", type=int, default=5000, help="hands per transaction")
+    parser.add_argument("--skip", type=int, default=0, help="lines already imported")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.path == "-":
+            load(sys.stdin, args.batch, args.skip)
+        else:
+            opener = gzip.open if args.path.endswith(".gz") else open
+            with opener(args.path, "rt", encoding="utf-8") as lines:
+                load(lines, args.batch, args.skip)
+    finally:
+        HandRepository.close()
+
+
+if __name__ == "__main__":
+    main()
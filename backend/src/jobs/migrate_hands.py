@@ -0,0 +1,54 @@
+"""Move hands from before partitioning into the partitioned tables.
+
+    python -m src.jobs.migrate_hands --batch 1000
+
+On the first start after upgrading, ``init_db`` renames the old tables to
+``hands_unpartitioned`` and ``hand_seats_unpartitioned``. This job moves
+their rows over in batches, one transaction per batch, while the API keeps
+serving. It can be stopped and rerun at any time, and it drops the old
+tables once they are empty.
+"""
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+from src.db import close_pool, get_db_connection
+from src.partitions import has_unpartitioned, move_unpartitioned
+from src.repositories.hand_repo import HAND_COLUMNS, SEAT_COLUMNS
+from src.services.hand_export import Throughput
+
+
+def migrate(batch_size: int = 1000) -> Throughput:
+    moved = Throughput()
+    while True:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                count = move_unpartitioned(cur, HAND_COLUMNS, SEAT_COLUMNS, batch_size)
+                pending = has_unpartitioned(cur)
+            conn.commit()
+        if count:
+            moved.add(count)
+            print(f"Moved {moved}", file=sys.stderr)
+        elif not pending:
+            break
+        else:
+            # The rows left are locked by another mover; wait for it to finish them.
+            time.sleep(1)
+    print(f"Moved {moved} in total", file=sys.stderr)
+    return moved
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Move pre-partitioning hands into partitions")
+    parser.add_argument("--batch", type=int, default=1000, help="hands per transaction")
+    args = parser.parse_args(argv)
+
+    try:
+        migrate(args.batch)
+    finally:
+        close_pool()
+
+
+if __name__ == "__main__":
+    main()
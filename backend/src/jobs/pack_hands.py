@@ -0,0 +1,45 @@
+"""Move hands stored as English text into the binary ``record`` column.
+
+    python -m src.jobs.pack_hands --batch 1000
+
+Rows written before records existed keep their text in ``stack``,
+``hands``, ``actions`` and ``result``. Each batch parses that text, packs
+it (see ``services.hand_record``), stores the record and empties the text
+columns in one transaction, so the job can be stopped and rerun at any
+time. Text the renderer would not reproduce exactly is stored verbatim
+inside the record. On Postgres, run ``VACUUM hands`` afterwards to reuse
+the space the text took.
+"""
+import argparse
+import sys
+from typing import List, Optional
+
+from src.repositories.hand_repo import HandRepository
+from src.services.hand_export import Throughput
+
+
+def pack(batch_size: int = 1000) -> Throughput:
+    packed = Throughput()
+    while True:
+        count = HandRepository.pack_records(batch_size)
+        if not count:
+            break
+        packed.add(count)
+        print(f"Packed {packed}", file=sys.stderr)
+    print(f"Packed {packed} in total", file=sys.stderr)
+    return packed
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Pack text-only hand rows into binary records")
+    parser.add_argument("--batch", type=int, default=1000, help="rows per transaction")
+    args = parser.parse_args(argv)
+
+    try:
+        pack(args.batch)
+    finally:
+        HandRepository.close()
+
+
+if __name__ == "__main__":
+    main()
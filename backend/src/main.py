@@ -1,8 +1,24 @@
-from fastapi import FastAPI, HTTPException
-from src.db import init_db
+from typing import Optional
+
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import FileResponse, PlainTextResponse
+from src.log import configure_logging
+from src.db import close_async_pool, pool_stats
+from src.repositories.hand_repo import HandRepository
 from src.routers.hands import router as hands_router
+from src.routers.stats import router as stats_router
+from src.routers.tables import router as tables_router
+from src.services.game import hand_pool
+from src.services.hand_writer import WRITE_BEHIND, hand_writer
+from src.services.metrics import metrics
+from src.services.profiler import ProfileMiddleware, profile_store
+from src.services.response_cache import history_cache
+from src.services.scheduler import TABLE_SCHEDULER, table_scheduler
+from src.services.stats import stats_aggregator
 from fastapi.middleware.cors import CORSMiddleware
 
+configure_logging()
+
 app = FastAPI()
 
 app.add_middleware(
@@ -13,9 +29,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if profile_store.enabled:
+    app.add_middleware(ProfileMiddleware, store=profile_store)
+
 @app.on_event("startup")
 def startup():
-    init_db()
+    HandRepository.init()
+    if WRITE_BEHIND:
+        hand_writer.start()
+    stats_aggregator.load()
+    stats_aggregator.start()
+    hand_pool.start()
+
+@app.on_event("startup")
+async def startup_async():
+    if TABLE_SCHEDULER:
+        table_scheduler.start()
+
+@app.on_event("shutdown")
+def shutdown():
+    table_scheduler.stop()
+    hand_pool.stop()
+    hand_writer.stop()
+    stats_aggregator.stop()
+    HandRepository.close()
+
+@app.on_event("shutdown")
+async def shutdown_async():
+    await close_async_pool()
 
 @app.get("/")
 def root():
@@ -25,4 +66,41 @@ def root():
 def health():
     return {"status": "ok", "message": "Service is healthy"}
 
-app.include_router(hands_router)
\ No newline at end of file
+@app.get("/health/db")
+def health_db():
+    return {"pool": pool_stats(), "writer": hand_writer.stats(), "history_cache": history_cache.stats()}
+
+@app.get("/health/pool")
+def health_pool():
+    return hand_pool.stats()
+
+@app.get("/health/scheduler")
+def health_scheduler():
+    return table_scheduler.stats()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def api_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+def _check_profile_access(token: Optional[str]):
+    if not profile_store.token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not profile_store.authorized(token):
+        raise HTTPException(status_code=403, detail="Missing or wrong X-Profile token")
+
+@app.get("/debug/profiles")
+def list_profiles(x_profile: Optional[str] = Header(None)):
+    _check_profile_access(x_profile)
+    return {"profiles": profile_store.list()}
+
+@app.get("/debug/profiles/{name}")
+def get_profile(name: str, x_profile: Optional[str] = Header(None)):
+    _check_profile_access(x_profile)
+    path = profile_store.path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="text/plain", filename=name)
+
+app.include_router(hands_router)
+app.include_router(stats_router)
+app.include_router(tables_router)
\ No newline at end of file
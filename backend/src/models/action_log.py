@@ -0,0 +1,134 @@
+from enum import IntEnum
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple, Union
+
+from pokerkit import Card
+
+
+class ActionCode(IntEnum):
+    DEALT = 0
+    SEPARATOR = 1
+    DEALER = 2
+    SMALL_BLIND = 3
+    BIG_BLIND = 4
+    BOARD = 5
+    FOLD = 6
+    FOLD_NO_CHIPS = 7
+    CHECK = 8
+    CALL = 9
+    CALL_ALL_IN = 10
+    BET = 11
+    BET_ALL_IN = 12
+    RAISE = 13
+    RAISE_ALL_IN = 14
+    ALL_IN = 15
+    TIMEOUT = 16
+
+
+_TEMPLATES = {
+    ActionCode.SEPARATOR: "---",
+    ActionCode.DEALER: "Player {seat} is the dealer",
+    ActionCode.SMALL_BLIND: "Player {seat} posts small blind - {amount} chips",
+    ActionCode.BIG_BLIND: "Player {seat} posts big blind - {amount} chips",
+    ActionCode.FOLD: "Player {seat} folds",
+    ActionCode.FOLD_NO_CHIPS: "Player {seat} folds (no chips)",
+    ActionCode.CHECK: "Player {seat} checks",
+    ActionCode.CALL: "Player {seat} calls {amount} chips",
+    ActionCode.CALL_ALL_IN: "Player {seat} calls all-in for {amount} chips",
+    ActionCode.BET: "Player {seat} bets {amount} chips",
+    ActionCode.BET_ALL_IN: "Player {seat} bets all-in for {amount} chips",
+    ActionCode.RAISE: "Player {seat} raises to {amount} chips",
+    ActionCode.RAISE_ALL_IN: "Player {seat} raises all-in to {amount} chips",
+    ActionCode.ALL_IN: "Player {seat} goes all-in for {amount} chips",
+    ActionCode.TIMEOUT: "Player {seat} ran out of time",
+}
+
+# Verb used by stats.compute_hand_stats for each seat action.
+_STAT_ACTIONS = {
+    ActionCode.FOLD: "fold",
+    ActionCode.FOLD_NO_CHIPS: "fold",
+    ActionCode.CHECK: "check",
+    ActionCode.CALL: "call",
+    ActionCode.CALL_ALL_IN: "call",
+    ActionCode.BET: "raise",
+    ActionCode.BET_ALL_IN: "raise",
+    ActionCode.RAISE: "raise",
+    ActionCode.RAISE_ALL_IN: "raise",
+    ActionCode.ALL_IN: "raise",
+}
+
+
+@lru_cache(maxsize=None)
+def _card_name(code: str) -> str:
+    return str(next(iter(Card.parse(code))))
+
+
+class ActionEvent:
+    """One log entry. ``street`` is 0 preflop and counts up with each board deal;
+    ``cards`` holds card codes for deals and board tokens."""
+
+    __slots__ = ("code", "seat", "amount", "street", "cards")
+
+    def __init__(self, code: ActionCode, seat: int = 0, amount: int = 0, street: int = 0, cards: Tuple[str, ...] = ()):
+        self.code = code
+        self.seat = seat
+        self.amount = amount
+        self.street = street
+        self.cards = cards
+
+    def render(self) -> str:
+        if self.code == ActionCode.DEALT:
+            return f"Player {self.seat} is dealt " + ", ".join(_card_name(c) for c in self.cards)
+        if self.code == ActionCode.BOARD:
+            return "".join(self.cards)
+        return _TEMPLATES[self.code].format(seat=self.seat, amount=self.amount)
+
+    def to_dict(self) -> dict:
+        return {
+            "code": self.code.name.lower(),
+            "seat": self.seat,
+            "amount": self.amount,
+            "street": self.street,
+            "cards": list(self.cards),
+        }
+
+    def __repr__(self) -> str:
+        return f"ActionEvent({self.code.name}, seat={self.seat}, amount={self.amount}, street={self.street})"
+
+
+class ActionLog:
+    """Append-only list of ``ActionEvent`` that renders text only on demand.
+
+    Indexing, slicing and iteration yield the rendered English lines, so it
+    reads like the ``List[str]`` it replaces; ``events`` is the structured
+    view. Sequence numbers are 1-based positions in the log.
+    """
+
+    __slots__ = ("events", "street")
+
+    def __init__(self):
+        self.events: List[ActionEvent] = []
+        self.street = 0
+
+    def add(self, code: ActionCode, seat: int = 0, amount: int = 0, cards: Tuple[str, ...] = ()):
+        if code == ActionCode.BOARD:
+            self.street += 1
+        self.events.append(ActionEvent(code, seat, amount, self.street, cards))
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [event.render() for event in self.events[index]]
+        return self.events[index].render()
+
+    def __iter__(self) -> Iterator[str]:
+        return (event.render() for event in self.events)
+
+    def render(self, since: Optional[int] = None) -> List[str]:
+        return self[since or 0:]
+
+    def seat_actions(self) -> List[Tuple[int, int, str]]:
+        """``(seat, street, action)`` tuples in the shape ``compute_hand_stats`` takes."""
+        return [(e.seat, e.street, _STAT_ACTIONS[e.code]) for e in self.events if e.code in _STAT_ACTIONS]
@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 from src.models.player import Player
+from src.models.hand import HandHistory
+from src.models.action_log import ActionLog
+import random
 import uuid
 
 @dataclass
@@ -12,5 +15,31 @@ class GameState:
     poker_state: Any
     board: List[str] = field(default_factory=list)
     hole_cards: Dict[int, str] = field(default_factory=dict)
-    actions_log: List[str] = field(default_factory=list)
-    status: str = "RUNNING"
\ No newline at end of file
+    actions_log: ActionLog = field(default_factory=ActionLog)
+    status: str = "RUNNING"
+    starting_stack: int = 10000
+    hand: Optional[HandHistory] = None
+    seed: Optional[int] = None
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+    # Side effects of the current transition (storing a finished hand,
+    # counting its stats). The registry runs them once the transition is
+    # saved, and drops them if it fails or loses a version race.
+    after_save: List[Callable[[], None]] = field(default_factory=list, repr=False, compare=False)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["rng"]
+        del state["after_save"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.after_save = []
+        # Reseed from the seed and log position instead of pickling the
+        # 2.5 KB Mersenne Twister state; a restored table stays deterministic.
+        self.rng = random.Random(f"{self.seed}/{len(self.actions_log)}") if self.seed is not None else random.Random()
+
+    def run_after_save(self):
+        effects, self.after_save = self.after_save, []
+        for effect in effects:
+            effect()
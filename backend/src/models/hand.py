@@ -1,7 +1,36 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import MISSING, dataclass, field, fields
+from datetime import datetime, timezone
+from typing import List, Optional
+import os
+import time
 import uuid
 
+# Rendered from ``HandHistory.record`` on first access for hands read back packed.
+TEXT_FIELDS = ("mainInfo", "dealt", "actions", "result")
+
+def new_hand_id() -> str:
+    """A version 7 UUID: Unix milliseconds first, then random bits, so ids sort by time."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version
+    value = value & ~(0x3 << 62) | 0x2 << 62  # variant
+    return str(uuid.UUID(int=value))
+
+def hand_id_time(hand_id: str) -> Optional[datetime]:
+    """When a ``new_hand_id`` id was made; ``None`` for other ids (older hands use version 4)."""
+    try:
+        value = uuid.UUID(hand_id)
+    except ValueError:
+        return None
+    if value.version != 7:
+        return None
+    return datetime.fromtimestamp((value.int >> 80) / 1000, tz=timezone.utc)
+
+@dataclass
+class SeatResult:
+    seat: int
+    hole_cards: str
+    net: int
+
 @dataclass
 class HandHistory:
     id: str
@@ -9,13 +38,46 @@ class HandHistory:
     dealt: str
     actions: str
     result: str
+    created_at: Optional[datetime] = None
+    starting_stack: Optional[int] = None
+    dealer_seat: Optional[int] = None
+    board: List[str] = field(default_factory=list)
+    seats: List[SeatResult] = field(default_factory=list)
+    seed: Optional[int] = None
+    operations: List[str] = field(default_factory=list)
+    record: Optional[bytes] = field(default=None, repr=False, compare=False)  # see services.hand_record
 
     @classmethod
     def create(cls, mainInfo: str, dealt: str, actions: str, result: str) -> 'HandHistory':
         return cls(
-            id=str(uuid.uuid4()),
+            id=new_hand_id(),
             mainInfo=mainInfo,
             dealt=dealt,
             actions=actions,
             result=result
         )
+
+    @classmethod
+    def from_record(cls, id: str, record: bytes, **values) -> 'HandHistory':
+        """A hand whose text fields are rendered from ``record`` only when first read."""
+        values.update(id=id, record=record)
+        hand = cls.__new__(cls)
+        for f in fields(cls):
+            if f.name in TEXT_FIELDS:
+                continue
+            if f.name in values:
+                value = values[f.name]
+            elif f.default_factory is not MISSING:
+                value = f.default_factory()
+            else:
+                value = f.default
+            setattr(hand, f.name, value)
+        return hand
+
+    def __getattr__(self, name):
+        record = self.__dict__.get("record")
+        if name not in TEXT_FIELDS or record is None:
+            raise AttributeError(name)
+        from src.services.hand_record import render_record
+        self.__dict__.update(zip(TEXT_FIELDS, render_record(record)))
+        return self.__dict__[name]
@@ -0,0 +1,289 @@
+"""Range partitions of ``hands`` and ``hand_seats`` on ``created_at``.
+
+Both tables are partitioned the same way, so a hand and its seats sit in
+partitions with the same bounds and can be detached together. Partitions
+cover whole UTC days or months (``HAND_PARTITION``). Each is named after
+its first day: ``hands_p20261018`` for a day, ``hands_p202610`` for a
+month. ``ensure_partitions`` creates them ahead of time. It skips ranges
+that are already covered, so changing the unit later fills the gap with
+day partitions instead of failing on overlaps.
+
+Tables from before partitioning are renamed to ``*_unpartitioned`` at
+startup and moved over in batches by ``python -m src.jobs.migrate_hands``.
+"""
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional, Tuple
+
+from psycopg import sql
+
+HAND_PARTITION = os.getenv("HAND_PARTITION", "day").lower()
+HAND_PARTITIONS_AHEAD = int(os.getenv("HAND_PARTITIONS_AHEAD", "7"))
+HAND_PARTITION_CHECK_INTERVAL = float(os.getenv("HAND_PARTITION_CHECK_INTERVAL", "3600"))
+
+PARTITIONED_TABLES = ("hands", "hand_seats")
+# Advisory lock key for schema changes: init_db, partition creation and the legacy move.
+SCHEMA_LOCK_ID = 0x68616E6473
+
+logger = logging.getLogger(__name__)
+
+Bounds = Tuple[datetime, datetime]
+
+
+def period_start(ts: datetime, unit: str = HAND_PARTITION) -> datetime:
+    ts = ts.astimezone(timezone.utc)
+    if unit == "month":
+        return datetime(ts.year, ts.month, 1, tzinfo=timezone.utc)
+    if unit == "day":
+        return datetime(ts.year, ts.month, ts.day, tzinfo=timezone.utc)
+    raise ValueError(f"Unknown partition unit: {unit}")
+
+
+def period_end(start: datetime, unit: str = HAND_PARTITION) -> datetime:
+    if unit == "month":
+        return datetime(start.year + start.month // 12, start.month % 12 + 1, 1, tzinfo=timezone.utc)
+    return start + timedelta(days=1)
+
+
+def partition_name(table: str, start: datetime, unit: str = HAND_PARTITION) -> str:
+    return f"{table}_p{start:%Y%m}" if unit == "month" else f"{table}_p{start:%Y%m%d}"
+
+
+def partition_bounds(table: str, name: str) -> Optional[Bounds]:
+    """The ``[start, end)`` a partition named by ``partition_name`` covers."""
+    match = re.fullmatch(rf"{table}_p(\d{{6}}|\d{{8}})", name)
+    if match is None:
+        return None
+    digits = match.group(1)
+    unit = "month" if len(digits) == 6 else "day"
+    start = datetime.strptime(digits, "%Y%m" if unit == "month" else "%Y%m%d").replace(tzinfo=timezone.utc)
+    return start, period_end(start, unit)
+
+
+def list_partitions(cur, table: str = "hands") -> List[Tuple[str, datetime, datetime]]:
+    """Attached partitions of ``table`` as ``(name, start, end)``, oldest first."""
+    cur.execute(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass(%s)",
+        (table,)
+    )
+    found = []
+    for (name,) in cur.fetchall():
+        bounds = partition_bounds(table, name)
+        if bounds is not None:
+            found.append((name, *bounds))
+    return sorted(found, key=lambda p: p[1])
+
+
+def detached_partitions(cur, table: str = "hands") -> List[str]:
+    """Former partitions of ``table`` that were detached but not yet archived and dropped."""
+    cur.execute(
+        "SELECT c.relname FROM pg_class c WHERE c.relkind = 'r' AND c.relname ~ %s "
+        "AND c.relnamespace = to_regnamespace(current_schema()) "
+        "AND NOT EXISTS (SELECT 1 FROM pg_inherits i WHERE i.inhrelid = c.oid) ORDER BY c.relname",
+        (rf"^{table}_p(\d{{6}}|\d{{8}})$",)
+    )
+    return [name for (name,) in cur.fetchall()]
+
+
+def _create(cur, start: datetime, end: datetime, unit: str):
+    for table in PARTITIONED_TABLES:
+        # DDL takes no bind parameters, so the bounds are inlined as literals.
+        cur.execute(sql.SQL("CREATE TABLE IF NOT EXISTS {} PARTITION OF {} FOR VALUES FROM ({}) TO ({})").format(
+            sql.Identifier(partition_name(table, start, unit)), sql.Identifier(table), sql.Literal(start), sql.Literal(end)
+        ))
+
+
+def lock_schema(cur):
+    """Serialize schema changes across workers until the transaction ends."""
+    cur.execute("SELECT pg_advisory_xact_lock(%s)", (SCHEMA_LOCK_ID,))
+
+
+def ensure_partitions(cur, since: datetime, until: datetime, unit: str = HAND_PARTITION) -> List[str]:
+    """Create the partitions that rows with ``since <= created_at <= until`` need; return the new names.
+
+    When something is missing, the schema lock is taken and the check is
+    repeated under it, so workers starting together do not race to create
+    the same partition. The lock is held until the caller commits.
+    """
+    if _missing(cur, since, until, unit):
+        lock_schema(cur)
+        return _create_missing(cur, since, until, unit)
+    return []
+
+
+def _missing(cur, since: datetime, until: datetime, unit: str) -> bool:
+    covered = [(start, end) for _, start, end in list_partitions(cur)]
+    start = period_start(since, unit)
+    while start <= until:
+        day = start
+        end = period_end(start, unit)
+        while day < end:
+            if not any(s <= day and day < e for s, e in covered):
+                return True
+            day += timedelta(days=1)
+        start = end
+    return False
+
+
+def _create_missing(cur, since: datetime, until: datetime, unit: str) -> List[str]:
+    attached = list_partitions(cur)
+    covered = [(start, end) for _, start, end in attached]
+    taken = {name for name, _, _ in attached} | set(detached_partitions(cur))
+
+    def free(start: datetime, end: datetime) -> bool:
+        return not any(s < end and start < e for s, e in covered)
+
+    created = []
+    start = period_start(since, unit)
+    while start <= until:
+        end = period_end(start, unit)
+        if free(start, end):
+            wanted = [(start, end, unit)]
+        else:
+            # Part of the period is already covered by partitions of another unit.
+            days = []
+            day = start
+            while day < end:
+                days.append((day, day + timedelta(days=1), "day"))
+                day += timedelta(days=1)
+            wanted = [d for d in days if free(d[0], d[1])]
+        for s, e, u in wanted:
+            name = partition_name("hands", s, u)
+            if name in taken:
+                continue
+            _create(cur, s, e, u)
+            covered.append((s, e))
+            created.append(name)
+        start = end
+    if created:
+        logger.info("Created hand partitions %s", ", ".join(created))
+    return created
+
+
+def ensure_ahead(cur, now: Optional[datetime] = None, unit: str = HAND_PARTITION) -> List[str]:
+    now = now or datetime.now(timezone.utc)
+    ahead = now + (timedelta(days=31 * HAND_PARTITIONS_AHEAD) if unit == "month" else timedelta(days=HAND_PARTITIONS_AHEAD))
+    return ensure_partitions(cur, now, ahead, unit)
+
+
+def detach(cur, name: str):
+    """Detach a ``hands`` partition and the ``hand_seats`` partition with the same bounds."""
+    seats = "hand_seats" + name[len("hands"):]
+    cur.execute(sql.SQL("ALTER TABLE hand_seats DETACH PARTITION {}").format(sql.Identifier(seats)))
+    cur.execute(sql.SQL("ALTER TABLE hands DETACH PARTITION {}").format(sql.Identifier(name)))
+
+
+def is_partitioned(cur, table: str) -> Optional[bool]:
+    """``None`` if the table does not exist yet."""
+    cur.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", (table,))
+    row = cur.fetchone()
+    return None if row is None else row[0] == "p"
+
+
+def rename_unpartitioned(cur) -> bool:
+    """Move pre-partitioning ``hands``/``hand_seats`` aside so the partitioned ones can be created.
+
+    Renaming only touches the catalog, so it is quick even for a large
+    table. Indexes are renamed or dropped as well, since index names are
+    shared across the schema. ``move_unpartitioned`` then moves the rows.
+    """
+    if is_partitioned(cur, "hands") is not False:
+        return False
+    for table in PARTITIONED_TABLES:
+        if is_partitioned(cur, table) is None:
+            continue
+        cur.execute(sql.SQL("ALTER TABLE {} RENAME TO {}").format(
+            sql.Identifier(table), sql.Identifier(f"{table}_unpartitioned")
+        ))
+        cur.execute(sql.SQL("ALTER INDEX IF EXISTS {} RENAME TO {}").format(
+            sql.Identifier(f"{table}_pkey"), sql.Identifier(f"{table}_unpartitioned_pkey")
+        ))
+    for index in ("hands_created_at_id_idx", "hands_board_idx", "hands_unpacked_idx",
+                  "hand_seats_seat_net_idx", "hand_seats_class_idx", "hand_seats_cards_idx"):
+        cur.execute(sql.SQL("DROP INDEX IF EXISTS {}").format(sql.Identifier(index)))
+    return True
+
+
+def has_unpartitioned(cur) -> bool:
+    return is_partitioned(cur, "hands_unpartitioned") is not None
+
+
+def move_unpartitioned(cur, hand_columns: str, seat_columns: str, batch_size: int = 1000) -> int:
+    """Move up to ``batch_size`` hands and their seats from the renamed tables into partitions.
+
+    Rows are locked with ``SKIP LOCKED``, so several movers can share the
+    work. Once both old tables are empty they are dropped. Returns how
+    many hands were moved.
+    """
+    if not has_unpartitioned(cur):
+        return 0
+    cur.execute(
+        "SELECT id, created_at FROM hands_unpartitioned ORDER BY created_at LIMIT %s FOR UPDATE SKIP LOCKED",
+        (batch_size,)
+    )
+    rows = cur.fetchall()
+    if not rows:
+        cur.execute("SELECT EXISTS (SELECT 1 FROM hands_unpartitioned)")
+        if not cur.fetchone()[0]:
+            cur.execute("DROP TABLE IF EXISTS hand_seats_unpartitioned, hands_unpartitioned")
+            logger.info("Dropped the emptied unpartitioned hand tables")
+        return 0
+    ids = [hand_id for hand_id, _ in rows]
+    ensure_partitions(cur, rows[0][1], rows[-1][1])
+    cur.execute(
+        f"INSERT INTO hands ({hand_columns}) SELECT {hand_columns} FROM hands_unpartitioned "
+        "WHERE id = ANY(%s) ON CONFLICT DO NOTHING",
+        (ids,)
+    )
+    if is_partitioned(cur, "hand_seats_unpartitioned") is not None:
+        columns = ", ".join(f"s.{c.strip()}" for c in seat_columns.split(","))
+        cur.execute(
+            f"INSERT INTO hand_seats ({seat_columns}, created_at) SELECT {columns}, h.created_at "
+            "FROM hand_seats_unpartitioned s JOIN hands_unpartitioned h ON h.id = s.hand_id "
+            "WHERE s.hand_id = ANY(%s) ON CONFLICT DO NOTHING",
+            (ids,)
+        )
+        cur.execute("DELETE FROM hand_seats_unpartitioned WHERE hand_id = ANY(%s)", (ids,))
+    cur.execute("DELETE FROM hands_unpartitioned WHERE id = ANY(%s)", (ids,))
+    return len(ids)
+
+
+class PartitionMaintainer:
+    """Background thread that keeps ``HAND_PARTITIONS_AHEAD`` partitions ready."""
+
+    def __init__(self, connection: Callable, interval: float = HAND_PARTITION_CHECK_INTERVAL):
+        self.connection = connection
+        self.interval = interval
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> List[str]:
+        with self.connection() as conn:
+            with conn.cursor() as cur:
+                created = ensure_ahead(cur)
+            conn.commit()
+        return created
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="hand-partitions", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stopping.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error("Failed to create hand partitions: %s", e)
@@ -0,0 +1,91 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+from src.models.hand import HandHistory
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+from src.db import get_async_db_connection
+from src.repositories.hand_repo import (
+    HAND_COLUMNS, HAND_PLACEHOLDERS, PG_SEAT_COLUMNS, PG_SEAT_PLACEHOLDERS, SEATS_QUERY, HandRepository, HandSearch,
+    HandStore, PostgresHandStore, _add_seats, _get_query, _hand_to_row, _page_query, _pg_seat_rows, _row_to_hand,
+    _search_query, _seats_params,
+)
+
+def _local_store() -> Optional[HandStore]:
+    store = HandRepository.store()
+    return None if isinstance(store, PostgresHandStore) else store
+
+async def _attach_seats(cur, hands: List[HandHistory]) -> List[HandHistory]:
+    if not hands:
+        return hands
+    await cur.execute(SEATS_QUERY, _seats_params(hands))
+    return _add_seats(hands, await cur.fetchall())
+
+class AsyncHandRepository:
+    """``HandRepository`` on ``psycopg.AsyncConnection`` for the async routes.
+
+    Same SQL and row mapping as the sync repository; a request waiting on
+    Postgres yields the event loop instead of holding a threadpool worker.
+    With another ``HAND_STORE`` backend the calls go to it in the threadpool.
+    """
+
+    @staticmethod
+    async def save_hand(hand: HandHistory):
+        if (store := _local_store()) is not None:
+            return await run_in_threadpool(store.save_hand, hand)
+        async with get_async_db_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    f"INSERT INTO hands ({HAND_COLUMNS}) VALUES ({HAND_PLACEHOLDERS})",
+                    _hand_to_row(hand)
+                )
+                seat_rows = _pg_seat_rows(hand)
+                if seat_rows:
+                    await cur.executemany(
+                        f"INSERT INTO hand_seats ({PG_SEAT_COLUMNS}) VALUES ({PG_SEAT_PLACEHOLDERS})",
+                        seat_rows
+                    )
+            await conn.commit()
+
+    @staticmethod
+    async def get(hand_id: str) -> Optional[HandHistory]:
+        if (store := _local_store()) is not None:
+            return await run_in_threadpool(store.get, hand_id)
+        async with get_async_db_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(*_get_query(hand_id))
+                row = await cur.fetchone()
+                if row:
+                    return (await _attach_seats(cur, [_row_to_hand(row)]))[0]
+                return None
+
+    @staticmethod
+    async def list_page(limit: int, before: Optional[Tuple[datetime, str]] = None) -> List[HandHistory]:
+        if (store := _local_store()) is not None:
+            return await run_in_threadpool(store.list_page, limit, before)
+        async with get_async_db_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(*_page_query(limit, before))
+                return [_row_to_hand(row) for row in await cur.fetchall()]
+
+    @staticmethod
+    async def search(criteria: HandSearch, limit: int, before: Optional[Tuple[datetime, str]] = None) -> List[HandHistory]:
+        if (store := _local_store()) is not None:
+            return await run_in_threadpool(store.search, criteria, limit, before)
+        query, params = _search_query(criteria, limit, before)
+        async with get_async_db_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(query, params)
+                hands = [_row_to_hand(row) for row in await cur.fetchall()]
+                return await _attach_seats(cur, hands)
+
+    @staticmethod
+    async def iter_all(batch_size: int = 1000) -> AsyncIterator[HandHistory]:
+        if (store := _local_store()) is not None:
+            async for hand in iterate_in_threadpool(store.iter_all(batch_size)):
+                yield hand
+            return
+        async with get_async_db_connection() as conn:
+            async with conn.cursor(name="hands_stream") as cur:
+                cur.itersize = batch_size
+                await cur.execute(f"SELECT {HAND_COLUMNS} FROM hands ORDER BY created_at DESC, id DESC")
+                async for row in cur:
+                    yield _row_to_hand(row)
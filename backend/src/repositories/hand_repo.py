@@ -1,50 +1,603 @@
-from typing import List, Optional
-from src.models import hand
-from src.models.hand import HandHistory
-from src.db import get_db_connection
+import os
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Optional, Tuple
+from src.models.hand import HandHistory, SeatResult, hand_id_time
+from src.db import close_pool, get_db_connection, init_db
+from src.partitions import PartitionMaintainer, ensure_partitions
+from src.services.cards import RANKS, canonical_hole, hand_class, parse_cards
+from src.services.hand_record import encode_hand
 
-class HandRepository:
+HAND_STORE = os.getenv("HAND_STORE", "postgres").lower()
+HAND_STORE_PATH = os.getenv("HAND_STORE_PATH", "hands.sqlite3")
 
-    @staticmethod
-    def save_hand(hand: HandHistory):
+HAND_COLUMNS = "id, stack, hands, actions, result, created_at, starting_stack, dealer_seat, board, seed, operations, record"
+HAND_PLACEHOLDERS = ", ".join(["%s"] * len(HAND_COLUMNS.split(",")))
+SEAT_COLUMNS = "hand_id, seat, hole_cards, hand_class, net"
+# Per-seat counters of the ``player_stats`` rollup, in column order. A
+# stats row is ``(seat, *STATS_COUNTERS)``.
+STATS_COUNTERS = ("hands", "net", "vpip", "pfr", "faced_bet", "folded_to_bet", "showdowns", "showdowns_won")
+StatsRow = Tuple[int, ...]
+
+# On Postgres hand_seats also carries its hand's created_at, the partition key.
+PG_SEAT_COLUMNS = SEAT_COLUMNS + ", created_at"
+PG_SEAT_PLACEHOLDERS = ", ".join(["%s"] * len(PG_SEAT_COLUMNS.split(",")))
+
+@dataclass
+class HandSearch:
+    """Filters for ``HandRepository.search``; every field is optional.
+
+    ``cards`` is either two exact hole cards (``"AsAh"``) or a starting-hand
+    class (``"AA"``, ``"AKs"``, ``"AKo"``, or ``"AK"`` for both). Seat, card
+    and net filters apply to the same seat of a hand. ``since`` and
+    ``until`` are converted to UTC, and a naive bound is taken as UTC, so
+    every store compares the same instant.
+    """
+    seat: Optional[int] = None
+    cards: Optional[str] = None
+    board: Optional[List[str]] = None
+    net_min: Optional[int] = None
+    net_max: Optional[int] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+
+    def __post_init__(self):
+        self.since = _as_utc(self.since)
+        self.until = _as_utc(self.until)
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def _row_to_hand(row) -> HandHistory:
+    if row[11] is not None:
+        return HandHistory.from_record(
+            str(row[0]), bytes(row[11]),
+            created_at=row[5],
+            starting_stack=row[6],
+            dealer_seat=row[7],
+            board=list(row[8] or []),
+            seed=row[9],
+            operations=list(row[10] or []),
+        )
+    return HandHistory(
+        id=str(row[0]),
+        mainInfo=row[1],
+        dealt=row[2],
+        actions=row[3],
+        result=row[4],
+        created_at=row[5],
+        starting_stack=row[6],
+        dealer_seat=row[7],
+        board=list(row[8] or []),
+        seed=row[9],
+        operations=list(row[10] or []),
+    )
+
+def _hand_to_row(hand: HandHistory) -> tuple:
+    # The text columns stay empty; the UI text is rendered from ``record``.
+    if hand.created_at is None:
+        hand.created_at = datetime.now(timezone.utc)
+    return (
+        hand.id, "", "", "", "",
+        hand.created_at, hand.starting_stack, hand.dealer_seat, hand.board,
+        hand.seed, hand.operations, hand.record or encode_hand(hand),
+    )
+
+def _seat_rows(hand: HandHistory) -> List[tuple]:
+    rows = []
+    for seat in hand.seats:
+        cards = parse_cards(seat.hole_cards)
+        rows.append((hand.id, seat.seat, canonical_hole(cards), hand_class(cards), seat.net))
+    return rows
+
+def _pg_seat_rows(hand: HandHistory) -> List[tuple]:
+    return [row + (hand.created_at,) for row in _seat_rows(hand)]
+
+def _get_query(hand_id: str) -> Tuple[str, tuple]:
+    # Time-ordered ids give a lower bound on created_at: a hand is saved after it is
+    # dealt. The slack covers clock skew between the workers that deal and save it.
+    dealt_at = hand_id_time(hand_id)
+    if dealt_at is None:
+        return f"SELECT {HAND_COLUMNS} FROM hands WHERE id = %s", (hand_id,)
+    return f"SELECT {HAND_COLUMNS} FROM hands WHERE id = %s AND created_at >= %s", (hand_id, dealt_at - timedelta(minutes=5))
+
+SEATS_QUERY = (
+    "SELECT hand_id, seat, hole_cards, net FROM hand_seats "
+    "WHERE hand_id = ANY(%s) AND created_at = ANY(%s) ORDER BY hand_id, seat"
+)
+
+def _seats_params(hands: List[HandHistory]) -> tuple:
+    # The created_at list lets Postgres skip hand_seats partitions these hands are not in.
+    return [h.id for h in hands], list({h.created_at for h in hands})
+
+def _add_seats(hands: List[HandHistory], rows) -> List[HandHistory]:
+    by_id = {h.id: h for h in hands}
+    for hand_id, seat, hole_cards, net in rows:
+        by_id[hand_id].seats.append(SeatResult(seat=seat, hole_cards=hole_cards, net=net))
+    return hands
+
+def _attach_seats(cur, hands: List[HandHistory]) -> List[HandHistory]:
+    if not hands:
+        return hands
+    cur.execute(SEATS_QUERY, _seats_params(hands))
+    return _add_seats(hands, cur.fetchall())
+
+def _page_query(limit: int, before: Optional[Tuple[datetime, str]]) -> Tuple[str, tuple]:
+    if before is None:
+        return f"SELECT {HAND_COLUMNS} FROM hands ORDER BY created_at DESC, id DESC LIMIT %s", (limit,)
+    # The plain created_at bound is what partition pruning can use; the row comparison is not.
+    return (
+        f"SELECT {HAND_COLUMNS} FROM hands WHERE created_at <= %s AND (created_at, id) < (%s, %s) "
+        "ORDER BY created_at DESC, id DESC LIMIT %s",
+        (before[0], before[0], before[1], limit),
+    )
+
+def _cards_filter(cards: str) -> Tuple[str, List[str]]:
+    """The ``hand_seats`` column a cards filter applies to and the values it accepts.
+
+    Classes are stored higher rank first (``AKs``), so ``KA`` is read as ``AK``.
+    """
+    cards = cards.replace(" ", "")
+    if len(cards) == 4 and cards[1].islower() and cards[3].islower():
+        hole = parse_cards(cards)
+        if hole[0] == hole[1]:
+            raise ValueError(f"Invalid cards filter: {cards}")
+        return "hole_cards", [canonical_hole(hole)]
+    ranks, kind = cards[:2].upper(), cards[2:].lower()
+    if len(cards) not in (2, 3) or any(rank not in RANKS for rank in ranks) or kind not in ("", "s", "o"):
+        raise ValueError(f"Invalid cards filter: {cards}")
+    high, low = sorted(ranks, key=RANKS.index, reverse=True)
+    if high == low:
+        if kind:
+            raise ValueError(f"Invalid cards filter: {cards} (a pair is neither suited nor offsuit)")
+        return "hand_class", [high + low]
+    if kind:
+        return "hand_class", [high + low + kind]
+    return "hand_class", [high + low + "s", high + low + "o"]
+
+def _cards_condition(cards: str) -> Tuple[str, list]:
+    column, values = _cards_filter(cards)
+    if len(values) == 1:
+        return f"s.{column} = %s", values
+    return f"s.{column} = ANY(%s)", [values]
+
+def _search_query(criteria: HandSearch, limit: int, before: Optional[Tuple[datetime, str]]) -> Tuple[str, list]:
+    conditions, params = [], []
+    seat_conditions, seat_params = [], []
+    if criteria.seat is not None:
+        seat_conditions.append("s.seat = %s")
+        seat_params.append(criteria.seat)
+    if criteria.cards:
+        condition, values = _cards_condition(criteria.cards)
+        seat_conditions.append(condition)
+        seat_params.extend(values)
+    if criteria.net_min is not None:
+        seat_conditions.append("s.net >= %s")
+        seat_params.append(criteria.net_min)
+    if criteria.net_max is not None:
+        seat_conditions.append("s.net <= %s")
+        seat_params.append(criteria.net_max)
+    if seat_conditions:
+        for bound, op in ((criteria.since, ">="), (criteria.until, "<")):
+            if bound is not None:
+                seat_conditions.append(f"s.created_at {op} %s")
+                seat_params.append(bound)
+        conditions.append(
+            "EXISTS (SELECT 1 FROM hand_seats s WHERE s.hand_id = h.id AND s.created_at = h.created_at AND "
+            + " AND ".join(seat_conditions) + ")"
+        )
+        params.extend(seat_params)
+    if criteria.board:
+        conditions.append("h.board @> %s")
+        params.append(list(criteria.board))
+    if criteria.since is not None:
+        conditions.append("h.created_at >= %s")
+        params.append(criteria.since)
+    if criteria.until is not None:
+        conditions.append("h.created_at < %s")
+        params.append(criteria.until)
+    if before is not None:
+        conditions.append("h.created_at <= %s AND (h.created_at, h.id) < (%s, %s)")
+        params.extend([before[0], *before])
+
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    columns = ", ".join(f"h.{c.strip()}" for c in HAND_COLUMNS.split(","))
+    query = f"SELECT {columns} FROM hands h{where} ORDER BY h.created_at DESC, h.id DESC LIMIT %s"
+    params.append(limit)
+    return query, params
+
+EXPORT_TYPES = [
+    "text", "text", "text", "text", "text", "timestamptz", "int4", "int2", "text[]", "int8", "text[]", "bytea",
+    "int2[]", "text[]", "int4[]",
+]
+
+def _export_query(after: Optional[Tuple[datetime, str]], hands: str = "hands", hand_seats: str = "hand_seats") -> Tuple[str, tuple]:
+    """``COPY`` of hands with their seats; ``hands`` and ``hand_seats`` may name detached partitions."""
+    columns = ", ".join(f"h.{c.strip()}" for c in HAND_COLUMNS.split(","))
+    seats = ", ".join(
+        f"ARRAY(SELECT s.{c} FROM {hand_seats} s WHERE s.hand_id = h.id AND s.created_at = h.created_at ORDER BY s.seat)"
+        for c in ("seat", "hole_cards", "net")
+    )
+    where, params = "", ()
+    if after is not None:
+        where, params = " WHERE h.created_at >= %s AND (h.created_at, h.id) > (%s, %s)", (after[0], after[0], after[1])
+    return f"COPY (SELECT {columns}, {seats} FROM {hands} h{where} ORDER BY h.created_at, h.id) TO STDOUT", params
+
+def _stats_upsert(placeholder: str) -> str:
+    """Add a stats row to ``player_stats`` as increments (Postgres and SQLite share the syntax)."""
+    columns = ", ".join(STATS_COUNTERS)
+    placeholders = ", ".join([placeholder] * (len(STATS_COUNTERS) + 1))
+    updates = ", ".join(f"{c} = player_stats.{c} + EXCLUDED.{c}" for c in STATS_COUNTERS)
+    return f"INSERT INTO player_stats (seat, {columns}) VALUES ({placeholders}) ON CONFLICT (seat) DO UPDATE SET {updates}"
+
+def _export_row_to_hand(row) -> HandHistory:
+    hand = _row_to_hand(row)
+    hand.seats = [SeatResult(seat=seat, hole_cards=cards, net=net) for seat, cards, net in zip(*row[12:15])]
+    return hand
+
+class HandStore(ABC):
+    """Interface for hand-history storage.
+
+    Pages are newest first and ``before`` is the ``(created_at, id)`` of
+    the last hand already returned. ``iter_after`` goes oldest first, for
+    exports, and ``bulk_insert`` skips hands that already exist. The
+    ``player_stats`` rollup lives next to the hands, so every worker
+    sharing a store sees the same totals.
+    """
+
+    def init(self):
+        pass
+
+    def close(self):
+        pass
+
+    @abstractmethod
+    def save_hand(self, hand: HandHistory):
+        ...
+
+    @abstractmethod
+    def save_hands(self, hands: List[HandHistory]):
+        ...
+
+    @abstractmethod
+    def get(self, hand_id: str) -> Optional[HandHistory]:
+        ...
+
+    def list_all(self) -> List[HandHistory]:
+        return list(self.iter_all())
+
+    @abstractmethod
+    def list_page(self, limit: int, before: Optional[Tuple[datetime, str]] = None) -> List[HandHistory]:
+        ...
+
+    @abstractmethod
+    def search(self, criteria: HandSearch, limit: int, before: Optional[Tuple[datetime, str]] = None) -> List[HandHistory]:
+        ...
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> Iterator[HandHistory]:
+        ...
+
+    @abstractmethod
+    def iter_after(self, after: Optional[Tuple[datetime, str]] = None) -> Iterator[HandHistory]:
+        ...
+
+    @abstractmethod
+    def bulk_insert(self, hands: List[HandHistory]) -> int:
+        ...
+
+    @abstractmethod
+    def load_stats(self) -> List[StatsRow]:
+        ...
+
+    @abstractmethod
+    def add_stats(self, rows: List[StatsRow]):
+        """Add per-seat deltas to the rollup."""
+
+    @abstractmethod
+    def replace_stats(self, rows: List[StatsRow]):
+        """Replace the whole rollup in one transaction (for backfills)."""
+
+    def pack_records(self, batch_size: int = 1000) -> int:
+        """Pack up to ``batch_size`` hands still stored as text and return how many were packed."""
+        return 0
+
+class PostgresHandStore(HandStore):
+    """Hands in Postgres, range-partitioned by ``created_at`` (see ``src.partitions``).
+
+    ``init`` creates the schema and starts a thread that keeps partitions
+    ready ahead of time. Lookups carry a ``created_at`` bound wherever one
+    is known, so Postgres only touches the partitions that can match.
+    """
+
+    def __init__(self):
+        self._maintainer = PartitionMaintainer(get_db_connection)
+
+    def init(self):
+        init_db()
+        self._maintainer.start()
+
+    def close(self):
+        self._maintainer.stop()
+        close_pool()
+
+    def save_hand(self, hand: HandHistory):
         with get_db_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    "INSERT INTO hands (id, stack, hands, actions, result) VALUES (%s, %s, %s, %s, %s)",
-                    (hand.id, hand.mainInfo, hand.dealt, hand.actions, hand.result)
+                    f"INSERT INTO hands ({HAND_COLUMNS}) VALUES ({HAND_PLACEHOLDERS})",
+                    _hand_to_row(hand)
                 )
+                seat_rows = _pg_seat_rows(hand)
+                if seat_rows:
+                    cur.executemany(
+                        f"INSERT INTO hand_seats ({PG_SEAT_COLUMNS}) VALUES ({PG_SEAT_PLACEHOLDERS})",
+                        seat_rows
+                    )
+                conn.commit()
+
+    def save_hands(self, hands: List[HandHistory]):
+        if not hands:
+            return
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                with cur.copy(f"COPY hands ({HAND_COLUMNS}) FROM STDIN") as copy:
+                    for hand in hands:
+                        copy.write_row(_hand_to_row(hand))
+                with cur.copy(f"COPY hand_seats ({PG_SEAT_COLUMNS}) FROM STDIN") as copy:
+                    for hand in hands:
+                        for row in _pg_seat_rows(hand):
+                            copy.write_row(row)
                 conn.commit()
     
-    @staticmethod
-    def get(hand_id: str):
+    def get(self, hand_id: str):
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("SELECT id, stack, hands, actions, result FROM hands WHERE id = %s", (hand_id,))
+                cur.execute(*_get_query(hand_id))
                 row = cur.fetchone()
                 if row:
-                    return HandHistory(
-                        id=str(row[0]),
-                        mainInfo=row[1],
-                        dealt=row[2],
-                        actions=row[3],
-                        result=row[4]
-                    )
+                    return _attach_seats(cur, [_row_to_hand(row)])[0]
                 return None 
             
-    @staticmethod
-    def list_all():
+    def list_all(self):
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("SELECT id, stack, hands, actions, result FROM hands")
+                cur.execute(f"SELECT {HAND_COLUMNS} FROM hands ORDER BY created_at DESC, id DESC")
+                return [_row_to_hand(row) for row in cur.fetchall()]
+
+    def list_page(self, limit: int, before: Optional[Tuple[datetime, str]] = None) -> List[HandHistory]:
+        """Newest-first page of hands strictly older than the ``(created_at, id)`` cursor."""
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(*_page_query(limit, before))
+                return [_row_to_hand(row) for row in cur.fetchall()]
+
+    def search(self, criteria: HandSearch, limit: int, before: Optional[Tuple[datetime, str]] = None) -> List[HandHistory]:
+        """Newest-first hands matching ``criteria``, with their seats attached.
+
+        Per-seat filters become one EXISTS probe into ``hand_seats`` so the
+        (seat, net), (hand_class, seat) and (hole_cards, seat) indexes can
+        drive it; the board filter uses the GIN index on ``hands.board``.
+        """
+        query, params = _search_query(criteria, limit, before)
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                hands = [_row_to_hand(row) for row in cur.fetchall()]
+                return _attach_seats(cur, hands)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[HandHistory]:
+        """Stream every hand, newest first, through a server-side cursor.
+
+        Only ``batch_size`` rows are held in memory at a time. The pooled
+        connection stays borrowed until the iterator is exhausted or closed.
+        """
+        with get_db_connection() as conn:
+            with conn.cursor(name="hands_stream") as cur:
+                cur.itersize = batch_size
+                cur.execute(f"SELECT {HAND_COLUMNS} FROM hands ORDER BY created_at DESC, id DESC")
+                for row in cur:
+                    yield _row_to_hand(row)
+
+    def iter_after(self, after: Optional[Tuple[datetime, str]] = None) -> Iterator[HandHistory]:
+        """Stream hands oldest first, seats included, with ``COPY ... TO STDOUT``.
+
+        Rows are parsed as they arrive from the wire, so memory does not grow
+        with the table. ``after`` is the ``(created_at, id)`` of the last hand
+        already exported.
+        """
+        query, params = _export_query(after)
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                with cur.copy(query, params) as copy:
+                    copy.set_types(EXPORT_TYPES)
+                    for row in copy.rows():
+                        yield _export_row_to_hand(row)
+
+    def bulk_insert(self, hands: List[HandHistory]) -> int:
+        """Bulk-load hands through ``COPY FROM`` and return how many were new.
+
+        Rows are copied into temporary tables first and moved over with
+        ``ON CONFLICT DO NOTHING``, so re-importing a batch is harmless.
+        """
+        if not hands:
+            return 0
+        for hand in hands:
+            if hand.created_at is None:
+                hand.created_at = datetime.now(timezone.utc)
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                ensure_partitions(cur, min(h.created_at for h in hands), max(h.created_at for h in hands))
+                cur.execute("CREATE TEMP TABLE hands_import (LIKE hands INCLUDING DEFAULTS) ON COMMIT DROP")
+                cur.execute("CREATE TEMP TABLE hand_seats_import (LIKE hand_seats) ON COMMIT DROP")
+                with cur.copy(f"COPY hands_import ({HAND_COLUMNS}) FROM STDIN") as copy:
+                    for hand in hands:
+                        copy.write_row(_hand_to_row(hand))
+                with cur.copy(f"COPY hand_seats_import ({PG_SEAT_COLUMNS}) FROM STDIN") as copy:
+                    for hand in hands:
+                        for row in _pg_seat_rows(hand):
+                            copy.write_row(row)
+                cur.execute(
+                    f"INSERT INTO hands ({HAND_COLUMNS}) SELECT {HAND_COLUMNS} FROM hands_import "
+                    "ON CONFLICT (id, created_at) DO NOTHING"
+                )
+                inserted = cur.rowcount
+                cur.execute(
+                    f"INSERT INTO hand_seats ({PG_SEAT_COLUMNS}) SELECT {PG_SEAT_COLUMNS} FROM hand_seats_import "
+                    "ON CONFLICT (hand_id, seat, created_at) DO NOTHING"
+                )
+            conn.commit()
+        return inserted
+
+    def load_stats(self) -> List[StatsRow]:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"SELECT seat, {', '.join(STATS_COUNTERS)} FROM player_stats ORDER BY seat")
+                return cur.fetchall()
+
+    def add_stats(self, rows: List[StatsRow]):
+        if not rows:
+            return
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(_stats_upsert("%s"), rows)
+            conn.commit()
+
+    def replace_stats(self, rows: List[StatsRow]):
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM player_stats")
+                cur.executemany(_stats_upsert("%s"), rows)
+            conn.commit()
+
+    def pack_records(self, batch_size: int = 1000) -> int:
+        """Move up to ``batch_size`` text-only rows to ``record`` and empty their text columns.
+
+        Rows are locked with ``SKIP LOCKED`` so several migrations can run
+        side by side; the partial ``hands_unpacked_idx`` finds them without
+        rescanning rows that are already packed.
+        """
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT id, stack, hands, actions, result, created_at FROM hands WHERE record IS NULL "
+                    "LIMIT %s FOR UPDATE SKIP LOCKED",
+                    (batch_size,)
+                )
                 rows = cur.fetchall()
-                hands = []
-                for row in rows:
-                    hand = HandHistory(
-                        id=str(row[0]),
-                        mainInfo=row[1],
-                        dealt=row[2], 
-                        actions=row[3],
-                        result=row[4]
+                if rows:
+                    # created_at pins each update to the one partition its row is in.
+                    cur.executemany(
+                        "UPDATE hands SET record = %s, stack = '', hands = '', actions = '', result = '' "
+                        "WHERE id = %s AND created_at = %s",
+                        [(_pack_text_row(row[:5]), row[0], row[5]) for row in rows]
                     )
-                    hands.append(hand)
-                return hands
+            conn.commit()
+        return len(rows)
+
+def _pack_text_row(row) -> bytes:
+    hand_id, main_info, dealt, actions, result = row
+    return encode_hand(HandHistory(id=hand_id, mainInfo=main_info, dealt=dealt, actions=actions, result=result))
+
+def create_hand_store(name: str = HAND_STORE) -> HandStore:
+    if name == "postgres":
+        return PostgresHandStore()
+    if name == "sqlite":
+        from src.repositories.sqlite_hand_repo import SQLiteHandStore
+        return SQLiteHandStore(HAND_STORE_PATH)
+    if name == "memory":
+        from src.repositories.memory_hand_repo import MemoryHandStore
+        return MemoryHandStore()
+    raise ValueError(f"Unknown hand store: {name}")
+
+class HandRepository:
+    """Hand storage for the rest of the app; every call goes to the ``HAND_STORE`` backend.
+
+    The backend is created on first use. ``use`` swaps it for tests and
+    benchmarks and returns the one it replaced.
+    """
+    _store: Optional[HandStore] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def store() -> HandStore:
+        if HandRepository._store is None:
+            with HandRepository._lock:
+                if HandRepository._store is None:
+                    HandRepository._store = create_hand_store()
+        return HandRepository._store
+
+    @staticmethod
+    def use(store: Optional[HandStore]) -> Optional[HandStore]:
+        with HandRepository._lock:
+            previous, HandRepository._store = HandRepository._store, store
+        return previous
+
+    @staticmethod
+    def init():
+        HandRepository.store().init()
+
+    @staticmethod
+    def close():
+        with HandRepository._lock:
+            store, HandRepository._store = HandRepository._store, None
+        if store is not None:
+            store.close()
+
+    @staticmethod
+    def save_hand(hand: HandHistory):
+        HandRepository.store().save_hand(hand)
+
+    @staticmethod
+    def save_hands(hands: List[HandHistory]):
+        HandRepository.store().save_hands(hands)
+
+    @staticmethod
+    def get(hand_id: str) -> Optional[HandHistory]:
+        return HandRepository.store().get(hand_id)
+
+    @staticmethod
+    def list_all() -> List[HandHistory]:
+        return HandRepository.store().list_all()
+
+    @staticmethod
+    def list_page(limit: int, before: Optional[Tuple[datetime, str]] = None) -> List[HandHistory]:
+        return HandRepository.store().list_page(limit, before)
+
+    @staticmethod
+    def search(criteria: HandSearch, limit: int, before: Optional[Tuple[datetime, str]] = None) -> List[HandHistory]:
+        return HandRepository.store().search(criteria, limit, before)
+
+    @staticmethod
+    def iter_all(batch_size: int = 1000) -> Iterator[HandHistory]:
+        return HandRepository.store().iter_all(batch_size)
+
+    @staticmethod
+    def iter_after(after: Optional[Tuple[datetime, str]] = None) -> Iterator[HandHistory]:
+        return HandRepository.store().iter_after(after)
+
+    @staticmethod
+    def bulk_insert(hands: List[HandHistory]) -> int:
+        return HandRepository.store().bulk_insert(hands)
+
+    @staticmethod
+    def load_stats() -> List[StatsRow]:
+        return HandRepository.store().load_stats()
+
+    @staticmethod
+    def add_stats(rows: List[StatsRow]):
+        HandRepository.store().add_stats(rows)
+
+    @staticmethod
+    def replace_stats(rows: List[StatsRow]):
+        HandRepository.store().replace_stats(rows)
+
+    @staticmethod
+    def pack_records(batch_size: int = 1000) -> int:
+        return HandRepository.store().pack_records(batch_size)
@@ -0,0 +1,126 @@
+import bisect
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+from src.models.hand import HandHistory
+from src.repositories.hand_repo import HandSearch, HandStore, StatsRow, _cards_filter
+from src.services.cards import canonical_hole, hand_class, parse_cards
+
+Key = Tuple[datetime, str]
+
+class MemoryHandStore(HandStore):
+    """Hands in process memory, ordered by ``(created_at, id)``; nothing survives a restart.
+
+    Meant for tests, benchmarks and throwaway demo servers. Searches scan
+    every hand.
+    """
+
+    def __init__(self):
+        self._hands: Dict[str, HandHistory] = {}
+        self._order: List[Key] = []
+        self._stats: Dict[int, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._hands)
+
+    def _add(self, hand: HandHistory) -> bool:
+        if hand.id in self._hands:
+            return False
+        if hand.created_at is None:
+            hand.created_at = datetime.now(timezone.utc)
+        self._hands[hand.id] = hand
+        bisect.insort(self._order, (hand.created_at, hand.id))
+        return True
+
+    def save_hand(self, hand: HandHistory):
+        self.save_hands([hand])
+
+    def save_hands(self, hands: List[HandHistory]):
+        with self._lock:
+            for hand in hands:
+                if hand.id in self._hands:
+                    raise KeyError(f"Hand {hand.id} already exists")
+            for hand in hands:
+                self._add(hand)
+
+    def bulk_insert(self, hands: List[HandHistory]) -> int:
+        with self._lock:
+            return sum(self._add(hand) for hand in hands)
+
+    def get(self, hand_id: str) -> Optional[HandHistory]:
+        return self._hands.get(hand_id)
+
+    def _newest_first(self, before: Optional[Key]) -> Iterator[HandHistory]:
+        with self._lock:
+            end = len(self._order) if before is None else bisect.bisect_left(self._order, before)
+            keys = self._order[:end]
+        for _, hand_id in reversed(keys):
+            yield self._hands[hand_id]
+
+    def list_page(self, limit: int, before: Optional[Key] = None) -> List[HandHistory]:
+        page = []
+        for hand in self._newest_first(before):
+            if len(page) == limit:
+                break
+            page.append(hand)
+        return page
+
+    def search(self, criteria: HandSearch, limit: int, before: Optional[Key] = None) -> List[HandHistory]:
+        matches = []
+        for hand in self._newest_first(before):
+            if len(matches) == limit:
+                break
+            if _matches(hand, criteria):
+                matches.append(hand)
+        return matches
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[HandHistory]:
+        return self._newest_first(None)
+
+    def iter_after(self, after: Optional[Key] = None) -> Iterator[HandHistory]:
+        with self._lock:
+            start = 0 if after is None else bisect.bisect_right(self._order, after)
+            keys = self._order[start:]
+        return (self._hands[hand_id] for _, hand_id in keys)
+
+    def load_stats(self) -> List[StatsRow]:
+        with self._lock:
+            return [(seat, *counters) for seat, counters in sorted(self._stats.items())]
+
+    def add_stats(self, rows: List[StatsRow]):
+        with self._lock:
+            for seat, *deltas in rows:
+                counters = self._stats.setdefault(seat, [0] * len(deltas))
+                for i, delta in enumerate(deltas):
+                    counters[i] += delta
+
+    def replace_stats(self, rows: List[StatsRow]):
+        with self._lock:
+            self._stats = {seat: list(counters) for seat, *counters in rows}
+
+def _matches(hand: HandHistory, criteria: HandSearch) -> bool:
+    if criteria.since is not None and hand.created_at < criteria.since:
+        return False
+    if criteria.until is not None and hand.created_at >= criteria.until:
+        return False
+    if criteria.board and not set(criteria.board) <= set(hand.board):
+        return False
+    if criteria.seat is None and not criteria.cards and criteria.net_min is None and criteria.net_max is None:
+        return True
+
+    column, values = _cards_filter(criteria.cards) if criteria.cards else (None, None)
+    for seat in hand.seats:
+        if criteria.seat is not None and seat.seat != criteria.seat:
+            continue
+        if criteria.net_min is not None and seat.net < criteria.net_min:
+            continue
+        if criteria.net_max is not None and seat.net > criteria.net_max:
+            continue
+        if column is not None:
+            cards = parse_cards(seat.hole_cards)
+            value = canonical_hole(cards) if column == "hole_cards" else hand_class(cards)
+            if value not in values:
+                continue
+        return True
+    return False
@@ -0,0 +1,281 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional, Tuple
+from src.models.hand import HandHistory, SeatResult
+from src.repositories.hand_repo import (
+    HAND_COLUMNS, SEAT_COLUMNS, STATS_COUNTERS, HandSearch, HandStore, StatsRow, _cards_filter, _pack_text_row,
+    _seat_rows, _stats_upsert,
+)
+from src.services.hand_record import encode_hand
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS hands (
+        id TEXT PRIMARY KEY,
+        stack TEXT NOT NULL,
+        hands TEXT NOT NULL,
+        actions TEXT NOT NULL,
+        result TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        starting_stack INTEGER,
+        dealer_seat INTEGER,
+        board TEXT NOT NULL DEFAULT '[]',
+        seed INTEGER,
+        operations TEXT NOT NULL DEFAULT '[]',
+        record BLOB
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS hands_created_at_id_idx ON hands (created_at, id)",
+    """
+    CREATE TABLE IF NOT EXISTS hand_seats (
+        hand_id TEXT NOT NULL REFERENCES hands (id) ON DELETE CASCADE,
+        seat INTEGER NOT NULL,
+        hole_cards TEXT NOT NULL,
+        hand_class TEXT NOT NULL,
+        net INTEGER NOT NULL,
+        PRIMARY KEY (hand_id, seat)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS hand_seats_seat_net_idx ON hand_seats (seat, net)",
+    "CREATE INDEX IF NOT EXISTS hand_seats_class_idx ON hand_seats (hand_class, seat)",
+    "CREATE INDEX IF NOT EXISTS hand_seats_cards_idx ON hand_seats (hole_cards, seat)",
+    f"""
+    CREATE TABLE IF NOT EXISTS player_stats (
+        seat INTEGER PRIMARY KEY,
+        {", ".join(f"{c} INTEGER NOT NULL DEFAULT 0" for c in STATS_COUNTERS)}
+    )
+    """,
+]
+
+PLACEHOLDERS = ", ".join(["?"] * len(HAND_COLUMNS.split(",")))
+
+def _timestamp(value: Optional[datetime]) -> str:
+    # Fixed-width UTC text, so string order is time order.
+    return (value or datetime.now(timezone.utc)).astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+def _hand_to_row(hand: HandHistory) -> tuple:
+    return (
+        hand.id, "", "", "", "", _timestamp(hand.created_at),
+        hand.starting_stack, hand.dealer_seat, json.dumps(hand.board), hand.seed, json.dumps(hand.operations),
+        hand.record or encode_hand(hand),
+    )
+
+def _row_to_hand(row) -> HandHistory:
+    if row[11] is not None:
+        return HandHistory.from_record(
+            row[0], row[11],
+            created_at=datetime.fromisoformat(row[5]),
+            starting_stack=row[6],
+            dealer_seat=row[7],
+            board=json.loads(row[8]),
+            seed=row[9],
+            operations=json.loads(row[10]),
+        )
+    return HandHistory(
+        id=row[0],
+        mainInfo=row[1],
+        dealt=row[2],
+        actions=row[3],
+        result=row[4],
+        created_at=datetime.fromisoformat(row[5]),
+        starting_stack=row[6],
+        dealer_seat=row[7],
+        board=json.loads(row[8]),
+        seed=row[9],
+        operations=json.loads(row[10]),
+    )
+
+def _cursor_condition(before: Optional[Tuple[datetime, str]], op: str = "<") -> Tuple[str, list]:
+    if before is None:
+        return "", []
+    return f"(h.created_at, h.id) {op} (?, ?)", [_timestamp(before[0]), before[1]]
+
+def _search_query(criteria: HandSearch, limit: int, before: Optional[Tuple[datetime, str]]) -> Tuple[str, list]:
+    conditions, params = [], []
+    seat_conditions, seat_params = [], []
+    if criteria.seat is not None:
+        seat_conditions.append("s.seat = ?")
+        seat_params.append(criteria.seat)
+    if criteria.cards:
+        column, values = _cards_filter(criteria.cards)
+        seat_conditions.append(f"s.{column} IN ({', '.join('?' * len(values))})")
+        seat_params.extend(values)
+    if criteria.net_min is not None:
+        seat_conditions.append("s.net >= ?")
+        seat_params.append(criteria.net_min)
+    if criteria.net_max is not None:
+        seat_conditions.append("s.net <= ?")
+        seat_params.append(criteria.net_max)
+    if seat_conditions:
+        conditions.append(
+            "EXISTS (SELECT 1 FROM hand_seats s WHERE s.hand_id = h.id AND " + " AND ".join(seat_conditions) + ")"
+        )
+        params.extend(seat_params)
+    if criteria.board:
+        board = list(dict.fromkeys(criteria.board))
+        conditions.append(
+            f"(SELECT COUNT(*) FROM json_each(h.board) WHERE value IN ({', '.join('?' * len(board))})) = ?"
+        )
+        params.extend(board + [len(board)])
+    if criteria.since is not None:
+        conditions.append("h.created_at >= ?")
+        params.append(_timestamp(criteria.since))
+    if criteria.until is not None:
+        conditions.append("h.created_at < ?")
+        params.append(_timestamp(criteria.until))
+    condition, values = _cursor_condition(before)
+    if condition:
+        conditions.append(condition)
+        params.extend(values)
+
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    columns = ", ".join(f"h.{c.strip()}" for c in HAND_COLUMNS.split(","))
+    query = f"SELECT {columns} FROM hands h{where} ORDER BY h.created_at DESC, h.id DESC LIMIT ?"
+    params.append(limit)
+    return query, params
+
+class SQLiteHandStore(HandStore):
+    """Hands in a local SQLite file in WAL mode, for tests and single-box deployments.
+
+    With ``synchronous=NORMAL`` a commit is a WAL append without an fsync,
+    and ``save_hands`` writes a whole batch in one transaction, so the hand
+    writer's batches cost one commit each. Timestamps are stored as UTC
+    ISO-8601 text, and board and operations as JSON arrays.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            for statement in SCHEMA:
+                self._conn.execute(statement)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(hands)")}
+            if "record" not in columns:
+                self._conn.execute("ALTER TABLE hands ADD COLUMN record BLOB")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _insert(self, hands: List[HandHistory], verb: str = "INSERT") -> int:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    f"{verb} INTO hands ({HAND_COLUMNS}) VALUES ({PLACEHOLDERS})", [_hand_to_row(h) for h in hands]
+                )
+                inserted = self._conn.total_changes - before
+                self._conn.executemany(
+                    f"{verb} INTO hand_seats ({SEAT_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                    [row for hand in hands for row in _seat_rows(hand)]
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return inserted
+
+    def save_hand(self, hand: HandHistory):
+        self._insert([hand])
+
+    def save_hands(self, hands: List[HandHistory]):
+        if hands:
+            self._insert(hands)
+
+    def bulk_insert(self, hands: List[HandHistory]) -> int:
+        return self._insert(hands, "INSERT OR IGNORE") if hands else 0
+
+    def _select(self, query: str, params) -> List[HandHistory]:
+        with self._lock:
+            hands = [_row_to_hand(row) for row in self._conn.execute(query, params).fetchall()]
+            if hands:
+                by_id = {h.id: h for h in hands}
+                rows = self._conn.execute(
+                    f"SELECT hand_id, seat, hole_cards, net FROM hand_seats "
+                    f"WHERE hand_id IN ({', '.join('?' * len(hands))}) ORDER BY hand_id, seat",
+                    list(by_id)
+                ).fetchall()
+                for hand_id, seat, hole_cards, net in rows:
+                    by_id[hand_id].seats.append(SeatResult(seat=seat, hole_cards=hole_cards, net=net))
+        return hands
+
+    def get(self, hand_id: str) -> Optional[HandHistory]:
+        hands = self._select(f"SELECT {HAND_COLUMNS} FROM hands WHERE id = ?", (hand_id,))
+        return hands[0] if hands else None
+
+    def list_page(self, limit: int, before: Optional[Tuple[datetime, str]] = None) -> List[HandHistory]:
+        condition, params = _cursor_condition(before)
+        where = f" WHERE {condition}" if condition else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {HAND_COLUMNS} FROM hands h{where} ORDER BY created_at DESC, id DESC LIMIT ?",
+                params + [limit]
+            ).fetchall()
+        return [_row_to_hand(row) for row in rows]
+
+    def search(self, criteria: HandSearch, limit: int, before: Optional[Tuple[datetime, str]] = None) -> List[HandHistory]:
+        return self._select(*_search_query(criteria, limit, before))
+
+    def _pages(self, order: str, op: str, cursor: Optional[Tuple[datetime, str]], batch_size: int) -> Iterator[HandHistory]:
+        # Keyset pages, so no read transaction stays open between batches.
+        while True:
+            condition, params = _cursor_condition(cursor, op)
+            where = f" WHERE {condition}" if condition else ""
+            hands = self._select(
+                f"SELECT {HAND_COLUMNS} FROM hands h{where} ORDER BY created_at {order}, id {order} LIMIT ?",
+                params + [batch_size]
+            )
+            yield from hands
+            if len(hands) < batch_size:
+                return
+            cursor = (hands[-1].created_at, hands[-1].id)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[HandHistory]:
+        return self._pages("DESC", "<", None, batch_size)
+
+    def iter_after(self, after: Optional[Tuple[datetime, str]] = None) -> Iterator[HandHistory]:
+        return self._pages("ASC", ">", after, 1000)
+
+    def load_stats(self) -> List[StatsRow]:
+        with self._lock:
+            return self._conn.execute(f"SELECT seat, {', '.join(STATS_COUNTERS)} FROM player_stats ORDER BY seat").fetchall()
+
+    def add_stats(self, rows: List[StatsRow]):
+        if rows:
+            self._write_stats(rows)
+
+    def replace_stats(self, rows: List[StatsRow]):
+        self._write_stats(rows, replace=True)
+
+    def _write_stats(self, rows: List[StatsRow], replace: bool = False):
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                if replace:
+                    self._conn.execute("DELETE FROM player_stats")
+                self._conn.executemany(_stats_upsert("?"), rows)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def pack_records(self, batch_size: int = 1000) -> int:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, stack, hands, actions, result FROM hands WHERE record IS NULL LIMIT ?", (batch_size,)
+            ).fetchall()
+            if rows:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "UPDATE hands SET record = ?, stack = '', hands = '', actions = '', result = '' WHERE id = ?",
+                    [(_pack_text_row(row), row[0]) for row in rows]
+                )
+                self._conn.execute("COMMIT")
+        return len(rows)
@@ -1,50 +1,77 @@
-from fastapi import APIRouter, HTTPException, Body
-from pydantic import BaseModel
-from typing import Optional
-from src.services.game import start_hand, get_state, apply_action, reset_game, apply_stacks_to_players, _CURRENT_GAME
+from fastapi import APIRouter, HTTPException, Body, Query, Request
+from pydantic import BaseModel, Field
+from typing import Optional, Tuple
+from datetime import datetime
+import json
+from src.models.hand import HandHistory
+from src.services.cards import parse_cards
+from src.services.equity import estimate_equity
+from src.services.state_store import VersionConflict
+from src.services.response_cache import CACHE_HITS, CACHE_MISSES, NOT_MODIFIED, history_cache
+from src.services import hand_export
+from src.services.hand_export import Throughput, encode_cursor, hand_from_dict, hand_to_dict
 from src.repositories.hand_repo import HandRepository
-from fastapi.responses import JSONResponse
+from src.services.game import start_hand, apply_action, reset_game, apply_stacks_to_players, equity_spot
+from src.repositories.hand_repo import HandSearch
+from src.repositories.async_hand_repo import AsyncHandRepository
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from urllib.parse import urlencode
+from starlette.concurrency import run_in_threadpool
 
 router = APIRouter()
 
+MAX_PAGE_SIZE = 500
+
 
 class StartRequest(BaseModel):
-    num_players: int = 6
+    num_players: int = Field(6, ge=2, le=10)
     dealer_index: int = 0
 
 
 class ActionRequest(BaseModel):
+    game_id: str
     action: str
     amount: int | None = None
+    since: Optional[int] = Field(None, ge=0)  # when set, only log entries after this sequence number are returned
+
+class EquityRequest(BaseModel):
+    game_id: str
+    opponents: int | None = None
+    samples: int = 20000
+    time_budget_ms: float = 100
 
 class StackRequest(BaseModel):
     stack: int
+    game_id: str | None = None
 
 
 @router.post("/hands/start")
-def start(req: StartRequest):
-    gs = start_hand(num_players=req.num_players, dealer_index=req.dealer_index)
-    return { "game_id": gs.id, "log": gs.actions_log }
+async def start(req: StartRequest):
+    gs = await run_in_threadpool(start_hand, num_players=req.num_players, dealer_index=req.dealer_index)
+    return { "game_id": gs.id, "log": gs.actions_log.render() }
 
 
 @router.post("/hands/action")
-def api_action(req: ActionRequest):
+async def api_action(req: ActionRequest):
+    # Bot turns and finishing the hand are CPU-bound and take the table lock,
+    # so the whole transition runs off the event loop.
     try:
-        gs = get_state()
-        if not gs:
-            raise HTTPException(status_code=404, detail="Hand not found")
-        gs = apply_action(gs.id, req.action, req.amount)
+        gs = await run_in_threadpool(apply_action, req.game_id, req.action, req.amount)
     except KeyError:
         raise HTTPException(status_code=404, detail="Hand not found")
+    except VersionConflict as ex:
+        raise HTTPException(status_code=409, detail=str(ex))
     except Exception as ex:
         raise HTTPException(status_code=400, detail=str(ex))
 
+    seq = len(gs.actions_log)
+    actions = gs.actions_log.render(req.since)
     if gs.status == "FINISHED":
-        saved = HandRepository.get(gs.id)
         return {
             "finished": True, 
-            "hand": saved.__dict__ if saved else None,
-            "actions": gs.actions_log,
+            "hand": hand_to_dict(gs.hand) if gs.hand else None,
+            "actions": actions,
+            "seq": seq,
             "id": gs.id,
             "hole_cards": {1: gs.hole_cards.get(1, "")},
             "board": gs.board,
@@ -55,43 +82,201 @@ def api_action(req: ActionRequest):
     return {
         "id": gs.id,
         "hole_cards": {1: gs.hole_cards.get(1, "")},
-        "actions": gs.actions_log,
+        "actions": actions,
+        "seq": seq,
         "board": gs.board,
         "stacks": gs.stacks,
         "status": gs.status,
     }
 
+@router.post("/hands/equity")
+async def api_equity(req: EquityRequest):
+    # Copied under the table lock, so a transition running on another thread
+    # is never seen half applied; the sampling itself runs without the lock.
+    try:
+        hole, board, active = await run_in_threadpool(equity_spot, req.game_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Hand not found")
+
+    opponents = req.opponents if req.opponents is not None else active
+    samples = max(1, min(req.samples, 1_000_000))
+    try:
+        result = await run_in_threadpool(estimate_equity, hole, board, opponents, samples, req.time_budget_ms)
+    except ValueError as ex:
+        raise HTTPException(status_code=400, detail=str(ex))
+
+    return {
+        "id": req.game_id,
+        "opponents": opponents,
+        "win": result.win,
+        "tie": result.tie,
+        "lose": result.lose,
+        "equity": result.equity,
+        "samples": result.samples,
+        "elapsed_ms": result.elapsed_ms,
+    }
+
+def format_hand(hand: HandHistory) -> str:
+    formatted_hand = f"Hand #{hand.id}\n"
+    formatted_hand += f"{hand.mainInfo}\n"
+    formatted_hand += f"{hand.dealt}\n"
+    formatted_hand += f"Actions: {hand.actions}\n"
+    formatted_hand += f"{hand.result}"
+    return formatted_hand
+
+async def cached_json(request: Request, build) -> Response:
+    """Serve ``await build()`` through ``history_cache`` with an ETag; a matching ``If-None-Match`` gets a 304."""
+    key = f"{request.url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+    entry = history_cache.get(key)
+    if entry is not None:
+        CACHE_HITS.inc()
+    else:
+        CACHE_MISSES.inc()
+        version = history_cache.version
+        body = json.dumps(await build(), ensure_ascii=False, separators=(",", ":")).encode()
+        entry = history_cache.put(key, version, body)
+
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if entry.etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        NOT_MODIFIED.inc()
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        return hand_export.decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @router.get("/hands/")
-def api_list():
-    hands = HandRepository.list_all()
-    formatted_hands = []
-    
-    for hand in hands:
-        formatted_hand = f"Hand #{hand.id}\n"
-        formatted_hand += f"{hand.mainInfo}\n"
-        formatted_hand += f"{hand.dealt}\n"
-        formatted_hand += f"Actions: {hand.actions}\n"
-        formatted_hand += f"{hand.result}"
-        formatted_hands.append(formatted_hand)
-    
-    return {"hands": formatted_hands}
+async def api_list(request: Request, limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE), cursor: Optional[str] = None):
+    before = decode_cursor(cursor) if cursor else None
+
+    async def build():
+        hands = await AsyncHandRepository.list_page(limit, before)
+        next_cursor = encode_cursor(hands[-1]) if len(hands) == limit else None
+        return {"hands": [format_hand(hand) for hand in hands], "next_cursor": next_cursor}
+
+    return await cached_json(request, build)
+
+@router.get("/hands/stream")
+async def api_stream():
+    async def lines():
+        async for hand in AsyncHandRepository.iter_all():
+            yield json.dumps(hand_to_dict(hand)) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@router.get("/hands/export")
+def api_export(format: str = "ndjson", cursor: Optional[str] = None):
+    """Oldest-first bulk export; ``cursor`` takes the same form as ``next_cursor`` on ``/hands/``."""
+    if format not in hand_export.FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown export format: {format}")
+    after = decode_cursor(cursor) if cursor else None
+
+    def lines():
+        for _, text in hand_export.export_hands(format, after):
+            if text is not None:
+                yield text
+
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/plain"
+    return StreamingResponse(lines(), media_type=media_type)
+
+@router.post("/hands/import")
+async def api_import(request: Request, batch: int = Query(5000, ge=1, le=50000)):
+    """Load an NDJSON body in batches as it is uploaded."""
+    imported = Throughput()
+    pending, buffer, lines = [], b"", 0
+    try:
+        async for chunk in request.stream():
+            buffer += chunk
+            *complete, buffer = buffer.split(b"\n")
+            for line in complete:
+                lines += 1
+                if line.strip():
+                    pending.append(hand_from_dict(json.loads(line)))
+            if len(pending) >= batch:
+                imported.add(await run_in_threadpool(HandRepository.bulk_insert, pending))
+                pending = []
+        if buffer.strip():
+            lines += 1
+            pending.append(hand_from_dict(json.loads(buffer)))
+        imported.add(await run_in_threadpool(HandRepository.bulk_insert, pending))
+    except (ValueError, TypeError) as ex:
+        raise HTTPException(status_code=400, detail=f"Line {lines}: {ex}; {imported.rows} hands imported before it")
+    finally:
+        if imported.rows:
+            history_cache.bump()
+
+    return {"lines": lines, "imported": imported.rows, "rows_per_sec": round(imported.rate)}
+
+@router.get("/hands/search")
+async def api_search(
+    request: Request,
+    seat: Optional[int] = None,
+    cards: Optional[str] = None,
+    board: Optional[str] = None,
+    net_min: Optional[int] = None,
+    net_max: Optional[int] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+):
+    try:
+        criteria = HandSearch(
+            seat=seat,
+            cards=cards,
+            board=parse_cards(board) if board else None,
+            net_min=net_min,
+            net_max=net_max,
+            since=since,
+            until=until,
+        )
+        before = decode_cursor(cursor) if cursor else None
+    except ValueError as ex:
+        raise HTTPException(status_code=400, detail=str(ex))
+
+    async def build():
+        try:
+            hands = await AsyncHandRepository.search(criteria, limit, before)
+        except ValueError as ex:
+            raise HTTPException(status_code=400, detail=str(ex))
+        next_cursor = encode_cursor(hands[-1]) if len(hands) == limit else None
+        return {"hands": [hand_to_dict(hand) for hand in hands], "next_cursor": next_cursor}
+
+    return await cached_json(request, build)
+
+@router.get("/hands/{hand_id}")
+async def api_get(request: Request, hand_id: str):
+    async def build():
+        hand = await AsyncHandRepository.get(hand_id)
+        if hand is None:
+            raise HTTPException(status_code=404, detail="Hand not found")
+        return hand_to_dict(hand)
+
+    return await cached_json(request, build)
 
 @router.post("/reset/game")
-def api_reset(req: StackRequest):
+async def api_reset(req: StackRequest):
     try:
-        reset_game(req.stack)
+        await run_in_threadpool(reset_game, req.stack, req.game_id)
         return {"message": f"Game reset with starting stack of {req.stack}"}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/apply/stacks")
-def api_apply_stacks(req: StackRequest):
+async def api_apply_stacks(req: StackRequest):
     try:
-        apply_stacks_to_players(req.stack)
-        gs = get_state()
+        gs = await run_in_threadpool(apply_stacks_to_players, req.stack, req.game_id)
         if gs:
             return {"message": f"Stacks updated to {req.stack} for all players"}
         else:
             return {"message": f"Stacks will be applied to {req.stack} for next game"}
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Hand not found")
+    except VersionConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
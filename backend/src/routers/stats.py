@@ -0,0 +1,17 @@
+from fastapi import APIRouter, HTTPException
+from starlette.concurrency import run_in_threadpool
+from src.services.stats import stats_aggregator
+
+router = APIRouter()
+
+@router.get("/stats")
+async def api_stats():
+    players = await run_in_threadpool(stats_aggregator.all)
+    return {"players": [player.to_dict() for player in players]}
+
+@router.get("/stats/{seat}")
+async def api_player_stats(seat: int):
+    player = await run_in_threadpool(stats_aggregator.get, seat)
+    if player is None:
+        raise HTTPException(status_code=404, detail="No stats for this seat")
+    return player.to_dict()
@@ -0,0 +1,95 @@
+import json
+import os
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from src.services.events import event_hub
+from src.services.game import get_state
+from src.services.tables import registry
+
+router = APIRouter()
+
+EVENT_STREAM_HEARTBEAT = float(os.getenv("EVENT_STREAM_HEARTBEAT", "15"))
+EVENT_STREAM_STORE_POLL = float(os.getenv("EVENT_STREAM_STORE_POLL", "0.5"))
+
+
+def sse(event: str, data: dict, seq: Optional[int] = None) -> str:
+    frame = f"id: {seq}\n" if seq is not None else ""
+    return frame + f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.get("/tables/{game_id}/events")
+async def table_events(
+    game_id: str,
+    request: Request,
+    since: int = Query(0, ge=0),
+    last_event_id: Optional[str] = Header(None),
+):
+    """Server-Sent Events for one table.
+
+    Every log entry is sent once as an ``action`` event whose id is its
+    sequence number (1-based position in the log). Clients resume with
+    ``?since=N`` or the ``Last-Event-ID`` header that EventSource sends on
+    reconnect. The stream ends with ``finished`` when the hand is over, or
+    ``closed`` when the table is reset or evicted.
+
+    ``event_hub`` only wakes streams in the process that ran the
+    transition. With a ``STATE_STORE`` shared by several workers, the
+    stream also checks the stored version every
+    ``EVENT_STREAM_STORE_POLL`` seconds, so a move applied by another
+    worker arrives within that interval. Without a store each worker has
+    its own tables, so SSE then needs a single worker or sticky sessions.
+    """
+    # With a SQLite state store these reads hit the database, so they run off the event loop.
+    if await run_in_threadpool(get_state, game_id) is None:
+        raise HTTPException(status_code=404, detail="Hand not found")
+    if last_event_id and last_event_id.isdigit():
+        since = max(since, int(last_event_id))
+
+    poll = EVENT_STREAM_STORE_POLL if registry.store is not None else EVENT_STREAM_HEARTBEAT
+
+    async def events():
+        sent = since
+        quiet = 0.0
+        while True:
+            changed = event_hub.listen(game_id)
+            gs = await run_in_threadpool(get_state, game_id)
+            if gs is None:
+                event_hub.close(game_id)
+                yield sse("closed", {"id": game_id})
+                return
+
+            # Read the status before the log: a finished hand's log is complete.
+            finished = gs.status == "FINISHED"
+            entries = gs.actions_log.events
+            end = len(entries)
+            for seq in range(sent + 1, end + 1):
+                event = entries[seq - 1]
+                yield sse("action", {"seq": seq, "text": event.render(), **event.to_dict()}, seq)
+            if end > sent:
+                quiet = 0.0
+            sent = max(sent, end)
+
+            if finished:
+                yield sse("finished", {
+                    "id": gs.id,
+                    "seq": sent,
+                    "board": gs.board,
+                    "stacks": gs.stacks,
+                    "hand_id": gs.hand.id if gs.hand else None,
+                })
+                return
+            if await request.is_disconnected():
+                return
+            if not await event_hub.wait(changed, poll):
+                quiet += poll
+                if quiet >= EVENT_STREAM_HEARTBEAT:
+                    quiet = 0.0
+                    yield ": keep-alive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,146 @@
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+import numpy as np
+
+from src.models.game_state import GameState
+from src.services.cards import parse_cards
+from src.services.equity import estimate_equity
+from src.services.preflop import preflop_equity
+
+BOT_POLICY = os.getenv("BOT_POLICY", "equity").lower()
+BOT_EQUITY_SAMPLES = int(os.getenv("BOT_EQUITY_SAMPLES", "200"))
+BOT_TIME_BUDGET_MS = float(os.getenv("BOT_TIME_BUDGET_MS", "1.0"))
+
+
+@dataclass
+class BotDecision:
+    action: str  # "fold", "check", "call" or "raise"
+    amount: Optional[int] = None
+
+
+class BotPolicy(Protocol):
+    def decide(self, gs: GameState, player_index: int) -> BotDecision:
+        ...
+
+
+def _call_amount(state) -> int:
+    return getattr(state, "checking_or_calling_amount", 0) or 0
+
+
+def _big_blind(state) -> int:
+    return max(state.blinds_or_straddles)
+
+
+class RandomPolicy:
+    """The original threshold bot: ignores its cards and rolls the table's RNG."""
+
+    def decide(self, gs: GameState, player_index: int) -> BotDecision:
+        state = gs.poker_state
+        stack = state.stacks[player_index]
+        call_amount = _call_amount(state)
+        big_blind = _big_blind(state)
+        decision = gs.rng.random()
+
+        if call_amount == 0:
+            if decision < 0.6:
+                return BotDecision("check")
+            bet = min(big_blind * gs.rng.randint(2, 4), stack)
+            return BotDecision("raise", bet) if bet >= big_blind else BotDecision("check")
+
+        if call_amount > big_blind * 5:
+            return BotDecision("fold") if decision < 0.6 else BotDecision("call")
+        if decision < 0.7:
+            return BotDecision("call")
+        if decision < 0.85:
+            raise_to = min(call_amount * 2, stack)
+            return BotDecision("raise", raise_to) if raise_to > call_amount else BotDecision("call")
+        return BotDecision("fold")
+
+
+class EquityPolicy:
+    """Bets and calls by hand strength against the players still in the hand.
+
+    Preflop equity is a lookup in the precomputed 169-class table; postflop
+    it is a Monte Carlo run of ``samples`` runouts. On a seeded table the
+    runouts are drawn from a generator seeded by the table seed and the spot,
+    so replaying the seed replays the bots' lines. Only an unseeded table
+    caps the run at ``time_budget_ms`` and draws from ``rng``. The bot
+    compares its equity with its fair share of the pot and with the pot odds
+    it is being offered, and bluffs at ``bluff_rate``. Postflop estimates are
+    cached per hand, seat, street and opponent count, so a bot facing a
+    re-raise on the same street does not sample again.
+    """
+
+    CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        samples: int = BOT_EQUITY_SAMPLES,
+        time_budget_ms: float = BOT_TIME_BUDGET_MS,
+        bluff_rate: float = 0.05,
+        rng: Optional[np.random.Generator] = None,
+    ):
+        self.samples = samples
+        self.time_budget_ms = time_budget_ms
+        self.bluff_rate = bluff_rate
+        self.rng = rng
+        self._cache: "OrderedDict[tuple, float]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def equity(self, gs: GameState, player_index: int) -> float:
+        state = gs.poker_state
+        hole = parse_cards(gs.hole_cards[player_index + 1])
+        opponents = max(1, sum(1 for active in state.statuses if active) - 1)
+        if not gs.board:
+            return preflop_equity(hole, opponents)
+
+        key = (gs.id, player_index, len(gs.board), opponents)
+        equity = self._cache.get(key)
+        if equity is None:
+            if gs.seed is None:
+                rng, time_budget_ms = self.rng, self.time_budget_ms
+            else:
+                # Seeded by the same spot as the cache key, so a cache hit and a fresh run agree.
+                rng, time_budget_ms = np.random.default_rng([gs.seed, player_index, len(gs.board), opponents]), None
+            equity = estimate_equity(hole, gs.board, opponents, self.samples, time_budget_ms, rng).equity
+            with self._cache_lock:
+                self._cache[key] = equity
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return equity
+
+    def decide(self, gs: GameState, player_index: int) -> BotDecision:
+        state = gs.poker_state
+        equity = self.equity(gs, player_index)
+        opponents = max(1, sum(1 for active in state.statuses if active) - 1)
+        strength = equity * (opponents + 1)  # 1.0 = an average hand at this table
+        call_amount = _call_amount(state)
+        pot = state.total_pot_amount
+        bluff = gs.rng.random() < self.bluff_rate
+
+        if call_amount == 0:
+            if strength > 1.5 or bluff:
+                return BotDecision("raise", max(_big_blind(state), pot * 2 // 3))
+            return BotDecision("check")
+
+        pot_odds = call_amount / (pot + call_amount)
+        if strength > 2.0 and equity > pot_odds + 0.15:
+            return BotDecision("raise", state.pot_completion_betting_or_raising_to_amount)
+        if equity >= pot_odds:
+            return BotDecision("call")
+        return BotDecision("fold")
+
+
+def create_policy(name: str = BOT_POLICY) -> BotPolicy:
+    if name == "random":
+        return RandomPolicy()
+    if name == "equity":
+        return EquityPolicy()
+    raise ValueError(f"Unknown bot policy: {name}")
+
+
+bot_policy: BotPolicy = create_policy()
@@ -0,0 +1,28 @@
+from typing import List, Sequence
+
+RANKS = "23456789TJQKA"
+SUITS = "cdhs"
+
+
+def parse_cards(text: str) -> List[str]:
+    """Split card codes such as ``"Ad, 6s"`` or ``"Js7d3s"`` into ``["Ad", "6s"]``."""
+    compact = text.replace(",", "").replace(" ", "")
+    cards = [compact[i:i + 2] for i in range(0, len(compact), 2)]
+    for card in cards:
+        if len(card) != 2 or card[0] not in RANKS or card[1] not in SUITS:
+            raise ValueError(f"Invalid card: {card}")
+    return cards
+
+
+def canonical_hole(cards: Sequence[str]) -> str:
+    """Two hole cards as one string, higher rank first: ``"As6d"``."""
+    ordered = sorted(cards, key=lambda c: (RANKS.index(c[0]), SUITS.index(c[1])), reverse=True)
+    return "".join(ordered)
+
+
+def hand_class(cards: Sequence[str]) -> str:
+    """Starting-hand class of two hole cards: ``"AA"``, ``"AKs"`` or ``"AKo"``."""
+    high, low = sorted(cards, key=lambda c: RANKS.index(c[0]), reverse=True)
+    if high[0] == low[0]:
+        return high[0] + low[0]
+    return high[0] + low[0] + ("s" if high[1] == low[1] else "o")
@@ -0,0 +1,92 @@
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from src.services.evaluator import cards_to_ints, evaluate_batch
+
+EQUITY_BATCH_SIZE = 25000
+
+
+@dataclass
+class EquityResult:
+    win: float
+    tie: float
+    lose: float
+    samples: int
+    elapsed_ms: float
+
+    @property
+    def equity(self) -> float:
+        """Win probability with ties counted as half a win."""
+        return self.win + self.tie / 2
+
+
+def estimate_equity(
+    hole: Sequence[str],
+    board: Sequence[str],
+    opponents: int,
+    samples: int = 20000,
+    time_budget_ms: Optional[float] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> EquityResult:
+    """Monte Carlo win/tie/lose of ``hole`` against ``opponents`` random hands.
+
+    Opponent hole cards and the rest of the board are drawn together for a
+    whole batch and every 7-card hand in the batch is scored in a single
+    ``evaluate_batch`` call. Sampling stops after ``samples`` runouts or once
+    ``time_budget_ms`` is spent, whichever comes first; at least one batch is
+    always run.
+    """
+    if opponents < 1:
+        raise ValueError("At least one opponent is required")
+    if len(hole) != 2 or len(board) > 5:
+        raise ValueError("Need two hole cards and at most five board cards")
+    known = cards_to_ints(list(hole) + list(board))
+    if len(set(known)) != len(known):
+        raise ValueError("Duplicate cards")
+
+    rng = rng or np.random.default_rng()
+    deck = np.array([c for c in range(52) if c not in set(known)], dtype=np.int32)
+    missing = 5 - len(board)
+    need = missing + 2 * opponents
+    if need > len(deck):
+        raise ValueError("Not enough cards left for that many opponents")
+
+    started = time.perf_counter()
+    deadline = started + time_budget_ms / 1000 if time_budget_ms is not None else None
+    hero_known = np.array(known, dtype=np.int32)
+    board_known = hero_known[2:]
+    wins = ties = done = 0
+
+    while done < samples:
+        batch = min(EQUITY_BATCH_SIZE, samples - done)
+        # argpartition of uniform keys picks a uniformly random subset per row.
+        keys = rng.random((batch, len(deck)))
+        draws = deck[np.argpartition(keys, need - 1, axis=1)[:, :need]]
+
+        board_cards = np.concatenate([np.broadcast_to(board_known, (batch, len(board_known))), draws[:, :missing]], axis=1)
+        hero = np.concatenate([np.broadcast_to(hero_known[:2], (batch, 2)), board_cards], axis=1)
+        opp_holes = draws[:, missing:].reshape(batch, opponents, 2)
+        opp = np.concatenate(
+            [opp_holes, np.broadcast_to(board_cards[:, None, :], (batch, opponents, 5))], axis=2
+        ).reshape(batch * opponents, 7)
+
+        scores = evaluate_batch(np.concatenate([hero, opp]))
+        hero_scores = scores[:batch]
+        best_opp = scores[batch:].reshape(batch, opponents).max(axis=1)
+        wins += int((hero_scores > best_opp).sum())
+        ties += int((hero_scores == best_opp).sum())
+        done += batch
+
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+
+    return EquityResult(
+        win=wins / done,
+        tie=ties / done,
+        lose=(done - wins - ties) / done,
+        samples=done,
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+    )
@@ -0,0 +1,163 @@
+"""Lookup-table 7-card hand evaluator.
+
+Cards are ints ``rank * 4 + suit`` (rank 0 = deuce .. 12 = ace, suits in
+``cdhs`` order). A hand's score is ``category << 20 | tiebreak`` so that a
+higher score is a better hand. Everything that depends on a set of ranks
+(straights, top-k kickers) is a lookup into a table indexed by a 13-bit rank
+mask, which lets ``evaluate_batch`` score a whole ``(n, 7)`` array with a
+handful of NumPy operations instead of one Python call per hand.
+"""
+from typing import Iterable, List, Sequence
+
+import numpy as np
+
+from src.services.cards import RANKS, SUITS
+
+HIGH_CARD, PAIR, TWO_PAIR, TRIPS, STRAIGHT, FLUSH, FULL_HOUSE, QUADS, STRAIGHT_FLUSH = range(9)
+CATEGORY_NAMES = (
+    "High card", "Pair", "Two pair", "Three of a kind", "Straight",
+    "Flush", "Full house", "Four of a kind", "Straight flush",
+)
+
+_MASKS = 1 << 13
+_BITS = (1 << np.arange(13)).astype(np.int32)
+
+
+def _build_tables():
+    top = np.zeros((6, _MASKS), dtype=np.int32)
+    straight = np.full(_MASKS, -1, dtype=np.int32)
+    popcount = np.zeros(_MASKS, dtype=np.int32)
+    runs = [(0b11111 << low, low + 4) for low in range(8, -1, -1)]
+    runs.append((0b1000000001111, 3))  # wheel: A-2-3-4-5 plays as a five-high straight
+    for mask in range(_MASKS):
+        ranks = [r for r in range(12, -1, -1) if mask >> r & 1]
+        popcount[mask] = len(ranks)
+        for k in range(1, 6):
+            packed = 0
+            for r in ranks[:k]:
+                packed = packed << 4 | r
+            top[k, mask] = packed << 4 * (k - min(k, len(ranks)))
+        for run, high in runs:
+            if mask & run == run:
+                straight[mask] = high
+                break
+    return top, straight, popcount
+
+
+TOP, STRAIGHT_HIGH, POPCOUNT = _build_tables()
+
+
+def card_to_int(card: str) -> int:
+    return RANKS.index(card[0]) * 4 + SUITS.index(card[1])
+
+
+def cards_to_ints(cards: Iterable[str]) -> List[int]:
+    return [card_to_int(card) for card in cards]
+
+
+def category(score: int) -> str:
+    return CATEGORY_NAMES[score >> 20]
+
+
+def evaluate_batch(cards: np.ndarray) -> np.ndarray:
+    """Score an ``(n, 7)`` int array of cards; returns an ``(n,)`` int32 array."""
+    cards = np.asarray(cards)
+    n = len(cards)
+    ranks = cards >> 2
+    suits = cards & 3
+
+    # One bincount over row-offset indices counts every row at once.
+    rank_counts = np.bincount((ranks + 13 * np.arange(n)[:, None]).ravel(), minlength=13 * n).reshape(n, 13)
+    suit_counts = np.bincount((suits + 4 * np.arange(n)[:, None]).ravel(), minlength=4 * n).reshape(n, 4)
+
+    rank_mask = np.bitwise_or.reduce(1 << ranks, axis=1).astype(np.int32)
+    m4 = (rank_counts == 4).astype(np.int32) @ _BITS
+    m3 = (rank_counts == 3).astype(np.int32) @ _BITS
+    m2 = (rank_counts == 2).astype(np.int32) @ _BITS
+    m1 = (rank_counts == 1).astype(np.int32) @ _BITS
+
+    flush_suit = suit_counts.argmax(axis=1)
+    has_flush = suit_counts.max(axis=1) >= 5
+    in_flush = suits == flush_suit[:, None]
+    flush_mask = np.where(in_flush, 1 << ranks, 0).sum(axis=1).astype(np.int32)
+
+    straight_flush = np.where(has_flush, STRAIGHT_HIGH[flush_mask], -1)
+    straight = STRAIGHT_HIGH[rank_mask]
+
+    quad = TOP[1, m4]
+    trip = TOP[1, m3]
+    full_pair = TOP[1, (m3 & ~(1 << trip)) | m2]
+    pairs = TOP[2, m2]
+    high_pair = pairs >> 4
+    low_pair = pairs & 0xF
+    two_pair_kicker = TOP[1, rank_mask & ~(1 << high_pair) & ~(1 << low_pair)]
+
+    conditions = [
+        straight_flush >= 0,
+        m4 != 0,
+        (m3 != 0) & ((POPCOUNT[m3] >= 2) | (m2 != 0)),
+        has_flush,
+        straight >= 0,
+        m3 != 0,
+        POPCOUNT[m2] >= 2,
+        m2 != 0,
+    ]
+    choices = [
+        STRAIGHT_FLUSH << 20 | straight_flush << 16,
+        QUADS << 20 | quad << 16 | TOP[1, rank_mask & ~(1 << quad)] << 12,
+        FULL_HOUSE << 20 | trip << 16 | full_pair << 12,
+        FLUSH << 20 | TOP[5, flush_mask],
+        STRAIGHT << 20 | straight << 16,
+        TRIPS << 20 | trip << 16 | TOP[2, m1] << 8,
+        TWO_PAIR << 20 | high_pair << 16 | low_pair << 12 | two_pair_kicker << 8,
+        PAIR << 20 | TOP[1, m2] << 16 | TOP[3, m1] << 4,
+    ]
+    return np.select(conditions, choices, default=HIGH_CARD << 20 | TOP[5, m1]).astype(np.int32)
+
+
+def evaluate(cards: Sequence[int]) -> int:
+    """Score a single 5-7 card hand with the same tables, without NumPy overhead."""
+    counts = [0] * 13
+    suit_masks = [0, 0, 0, 0]
+    for card in cards:
+        rank = card >> 2
+        counts[rank] += 1
+        suit_masks[card & 3] |= 1 << rank
+
+    rank_mask = m4 = m3 = m2 = m1 = 0
+    for rank, count in enumerate(counts):
+        if count:
+            bit = 1 << rank
+            rank_mask |= bit
+            if count == 4:
+                m4 |= bit
+            elif count == 3:
+                m3 |= bit
+            elif count == 2:
+                m2 |= bit
+            else:
+                m1 |= bit
+
+    flush_mask = next((mask for mask in suit_masks if POPCOUNT[mask] >= 5), 0)
+    if flush_mask and STRAIGHT_HIGH[flush_mask] >= 0:
+        return STRAIGHT_FLUSH << 20 | int(STRAIGHT_HIGH[flush_mask]) << 16
+    if m4:
+        quad = int(TOP[1, m4])
+        return QUADS << 20 | quad << 16 | int(TOP[1, rank_mask & ~(1 << quad)]) << 12
+    if m3 and (POPCOUNT[m3] >= 2 or m2):
+        trip = int(TOP[1, m3])
+        return FULL_HOUSE << 20 | trip << 16 | int(TOP[1, (m3 & ~(1 << trip)) | m2]) << 12
+    if flush_mask:
+        return FLUSH << 20 | int(TOP[5, flush_mask])
+    if STRAIGHT_HIGH[rank_mask] >= 0:
+        return STRAIGHT << 20 | int(STRAIGHT_HIGH[rank_mask]) << 16
+    if m3:
+        return TRIPS << 20 | int(TOP[1, m3]) << 16 | int(TOP[2, m1]) << 8
+    if POPCOUNT[m2] >= 2:
+        pairs = int(TOP[2, m2])
+        high_pair, low_pair = pairs >> 4, pairs & 0xF
+        kicker = int(TOP[1, rank_mask & ~(1 << high_pair) & ~(1 << low_pair)])
+        return TWO_PAIR << 20 | high_pair << 16 | low_pair << 12 | kicker << 8
+    if m2:
+        return PAIR << 20 | int(TOP[1, m2]) << 16 | int(TOP[3, m1]) << 4
+    return HIGH_CARD << 20 | int(TOP[5, m1])
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from typing import Dict, Optional
+
+
+class EventHub:
+    """Wakes the event streams of a table when its log changes.
+
+    The game service calls ``publish(game_id)`` once per transition, from
+    whatever thread ran it; that costs one ``call_soon_threadsafe`` no
+    matter how many clients follow the table. Every stream of a table
+    waits on the same ``asyncio.Event``, which is replaced after it fires,
+    and reads the new entries from the table itself.
+
+    A stream must call ``listen`` before reading the log and then
+    ``wait`` on the returned event, so a publish that lands in between
+    is not missed. The hub only reaches streams in this process; see
+    ``table_events`` for how a stream follows moves made by other workers.
+    """
+
+    def __init__(self):
+        self._events: Dict[str, asyncio.Event] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def listen(self, game_id: str) -> asyncio.Event:
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            event = self._events.get(game_id)
+            if event is None:
+                event = self._events[game_id] = asyncio.Event()
+            return event
+
+    def publish(self, game_id: str):
+        with self._lock:
+            loop = self._loop
+            if loop is None or game_id not in self._events:
+                return
+        try:
+            loop.call_soon_threadsafe(self.close, game_id)
+        except RuntimeError:
+            pass  # the loop is closed; there is nobody left to wake
+
+    def close(self, game_id: str):
+        """Wake the table's streams and forget it; call on the loop thread."""
+        with self._lock:
+            event = self._events.pop(game_id, None)
+        if event is not None:
+            event.set()
+
+    @staticmethod
+    async def wait(event: asyncio.Event, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+event_hub = EventHub()
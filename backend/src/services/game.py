@@ -1,22 +1,50 @@
 from pokerkit import Automation, NoLimitTexasHoldem
-import uuid
-from src.models.hand import HandHistory
+import logging
+import random
+from collections import deque
+from src.models.hand import HandHistory, SeatResult, new_hand_id
 from src.models.player import Player
 from src.models.game_state import GameState
+from src.models.action_log import ActionCode, ActionLog
 from src.repositories.hand_repo import HandRepository
-import random
-from typing import Optional
-
-_CURRENT_GAME: Optional[GameState] = None
+from src.services.tables import registry
+from src.services.cards import parse_cards
+from src.services.hand_writer import WRITE_BEHIND, hand_writer
+from src.services.stats import compute_hand_stats, stats_aggregator
+from src.services.bots import BotDecision, bot_policy
+from src.services.events import event_hub
+from src.services.notation import to_notation
+from src.services.hand_pool import HandPool
+from src.services.hand_record import encode_hand, render_dealt, render_main_info, render_result
+from src.services.response_cache import history_cache
+from src.services.metrics import (
+    BOT_LOOP_SECONDS, DB_SAVE_SECONDS, FINALIZE_SECONDS, HANDS_FAILED, HANDS_FINISHED, HANDS_STARTED,
+    USER_ACTION_SECONDS, metrics,
+)
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 big_blind = 40
 small_blind = 20
 starting_stack = 10000
 
+_seed_source = random.SystemRandom()
+
+# Set by ``TableScheduler.start``. While set, bot turns run on the scheduler's
+# workers and ``apply_action`` only applies the user's move.
+bot_scheduler = None
+
 # ----------------------------------------Create initial poker state ------------------------------
-def create_state(num_players: int):
-    stacks = tuple([starting_stack for _ in range(num_players)])
-    return NoLimitTexasHoldem.create_state(
+def new_seed() -> int:
+    return _seed_source.getrandbits(63)
+
+def create_state(num_players: int, stack: Optional[int] = None, rng: Optional[random.Random] = None):
+    """New pokerkit state; with ``rng`` the deck is shuffled from it instead of the global ``random``."""
+    stack = starting_stack if stack is None else stack
+    stacks = tuple([stack for _ in range(num_players)])
+    state = NoLimitTexasHoldem.create_state(
         (
             Automation.ANTE_POSTING,
             Automation.BET_COLLECTION,
@@ -33,81 +61,139 @@ def create_state(num_players: int):
         stacks,
         num_players,
     )
+    if rng is not None:
+        cards = list(state.deck)
+        rng.shuffle(cards)
+        state.deck_cards = deque(cards)
+    return state
 #----------------------------------------------------------------------------------------------------
 
 # ---------------------------------------- Starting hands dealt -------------------------------------
-def start_hand(num_players: int = 6, dealer_index: int = 0) -> GameState:
-    global _CURRENT_GAME
-    if _CURRENT_GAME is not None:
-        raise Exception("A game is already in progress")
+def start_hand(num_players: int = 6, dealer_index: int = 0, seed: Optional[int] = None) -> GameState:
+    gs = hand_pool.take(num_players, starting_stack) if seed is None else None
+    if gs is None:
+        gs = deal_hand(num_players, dealer_index, seed=seed)
+    else:
+        seat_dealer(gs, dealer_index)
+    registry.add(gs)
+    HANDS_STARTED.inc()
+    if bot_scheduler is not None:
+        bot_scheduler.table_changed(gs.id)
+    return gs
 
-    players = [Player.create(i+1) for i in range(num_players)]
-    poker_state = create_state(num_players)
+def deal_hand(num_players: int = 6, dealer_index: int = 0, stack: Optional[int] = None, seed: Optional[int] = None) -> GameState:
+    """Create and deal a new hand without registering it as a live table.
+
+    The table's ``seed`` drives the deck shuffle and the bots' rolls, so a
+    stored hand can be dealt again exactly.
+    """
+    gs = deal_cards(num_players, stack, seed)
+    seat_dealer(gs, dealer_index)
+    return gs
 
-    dealer = f"Player {dealer_index + 1}"
-    sb = f"Player {(dealer_index + 1) % num_players + 1}"
-    bb = f"Player {(dealer_index + 2) % num_players + 1}"
+def deal_cards(num_players: int = 6, stack: Optional[int] = None, seed: Optional[int] = None) -> GameState:
+    """Shuffle and deal hole cards; the button is placed later by ``seat_dealer``.
+
+    pokerkit always posts blinds from its first two seats, so the dealt
+    state does not depend on the dealer and can be prepared ahead of time.
+    """
+    players = [Player.create(i+1) for i in range(num_players)]
+    stack = starting_stack if stack is None else stack
+    seed = new_seed() if seed is None else seed
+    rng = random.Random(seed)
+    poker_state = create_state(num_players, stack, rng)
 
     hole_cards = {}
     first_card = []
     second_card = []
     for i in range(num_players):
-        first_card.append(poker_state.deal_hole())
+        first_card.append(poker_state.deal_hole().cards[0])
     for i in range(num_players):
-        second_card.append(poker_state.deal_hole())
+        second_card.append(poker_state.deal_hole().cards[0])
 
     for i, p in enumerate(players):
         card1 = first_card[i]
         card2 = second_card[i]
-        hole_cards[p.seat] = f"{card1}, {card2}"
+        hole_cards[p.seat] = f"{card1!r}, {card2!r}"
 
-    game_id = str(uuid.uuid4())
+    game_id = new_hand_id()
     gs = GameState(
         id=game_id,
         players=players,
-        dealer_index=dealer_index,
-        stacks=[starting_stack for _ in players],
+        dealer_index=0,
+        stacks=[stack for _ in players],
         poker_state=poker_state,
         hole_cards=hole_cards,
-        actions_log=[],
+        actions_log=ActionLog(),
         board=[],
         status="RUNNING",
+        starting_stack=stack,
+        seed=seed,
+        rng=rng,
     )
-    _CURRENT_GAME = gs
-
-    for i, cards in hole_cards.items():
-        gs.actions_log.append(f"Player {i} is dealt {str(first_card[i-1].cards[0])}, {str(second_card[i-1].cards[0])}")
-
-    gs.actions_log.append("---")
-    gs.actions_log.append(f"{dealer} is the dealer")
-    gs.actions_log.append(f"{sb} posts small blind - {small_blind} chips")
-    gs.actions_log.append(f"{bb} posts big blind - {big_blind} chips")
-    gs.actions_log.append("---")
 
+    log = gs.actions_log
+    for i in hole_cards:
+        log.add(ActionCode.DEALT, i, cards=(repr(first_card[i-1]), repr(second_card[i-1])))
     return gs
+
+def seat_dealer(gs: GameState, dealer_index: int):
+    num_players = len(gs.players)
+    dealer = dealer_index + 1
+    sb = (dealer_index + 1) % num_players + 1
+    bb = (dealer_index + 2) % num_players + 1
+    gs.dealer_index = dealer_index
+
+    log = gs.actions_log
+    log.add(ActionCode.SEPARATOR)
+    log.add(ActionCode.DEALER, dealer)
+    log.add(ActionCode.SMALL_BLIND, sb, small_blind)
+    log.add(ActionCode.BIG_BLIND, bb, big_blind)
+    log.add(ActionCode.SEPARATOR)
+
+hand_pool = HandPool(deal_cards)
+metrics.gauge("poker_hand_pool_ready", "Pre-dealt hands waiting in the pool", lambda: sum(hand_pool.depths().values()))
 # --------------------------------------------------------------------------------------------------------
 
 # ---------------------------------------- Get current game state ----------------------------------------
-def get_state() -> Optional[GameState]:
-    return _CURRENT_GAME
-
-def reset_game(stack_amount: int = None) -> None:
-    global _CURRENT_GAME, starting_stack
-    _CURRENT_GAME = None
+def get_state(game_id: str) -> Optional[GameState]:
+    return registry.get(game_id)
+
+def equity_spot(game_id: str) -> Tuple[List[str], List[str], int]:
+    """The user's hole cards, the board and the opponents still in, copied under the table lock."""
+    with registry.read(game_id) as gs:
+        hole = parse_cards(gs.hole_cards.get(1, ""))
+        opponents = sum(1 for active in gs.poker_state.statuses[1:] if active)
+        return hole, list(gs.board), max(1, opponents)
+
+def reset_game(stack_amount: int = None, game_id: Optional[str] = None) -> None:
+    global starting_stack
+    if game_id is not None:
+        registry.remove(game_id)
+        event_hub.publish(game_id)
     
     if stack_amount is not None:
         starting_stack = stack_amount
-        print(f"DEBUG: Global starting_stack reset to {starting_stack}")
+        hand_pool.invalidate(starting_stack)
+        logger.info("Starting stack reset to %s", starting_stack)
 
-def active_game() -> bool:
-    return _CURRENT_GAME is not None
+def active_game(game_id: str) -> bool:
+    gs = registry.get(game_id)
+    return gs is not None and gs.status == "RUNNING"
 
 def append_board_token(gs: GameState):
     state = gs.poker_state
     if hasattr(state, "board_cards") and state.board_cards:
-        token = "".join(str(c) for c in state.board_cards)
-        gs.actions_log.append(token)
-        gs.board = [str(c) for c in state.board_cards]
+        gs.board = [repr(c) for c in state.get_board_cards(0)]
+        gs.actions_log.add(ActionCode.BOARD, cards=tuple(gs.board))
+
+def deal_next_street(gs: GameState):
+    state = gs.poker_state
+    if getattr(state, "can_burn_card", False) and state.can_burn_card():
+        state.burn_card()
+    if getattr(state, "can_deal_board", False) and state.can_deal_board():
+        state.deal_board()
+        append_board_token(gs)
 
 def actor_indices(state):
     return getattr(state, "actor_indices", None)
@@ -119,11 +205,9 @@ def update_stacks(gs: GameState):
     """Update GameState stacks from poker_state and validate consistency"""
     if hasattr(gs.poker_state, 'stacks'):
         gs.stacks = list(gs.poker_state.stacks)
-        print(f"DEBUG: Updated stacks - {gs.stacks}")
-        
-        all_in_players = [i for i, stack in enumerate(gs.stacks) if stack == 0]
-        if all_in_players:
-            print(f"DEBUG: Players all-in: {[i+1 for i in all_in_players]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            all_in_seats = [i + 1 for i, stack in enumerate(gs.stacks) if stack == 0]
+            logger.debug("Table %s stacks %s, all-in seats %s", gs.id, gs.stacks, all_in_seats)
 
 def can_player_act(gs: GameState, player_index: int) -> bool:
     """Check if player can take actions (has chips and isn't folded)"""
@@ -140,27 +224,36 @@ def can_player_act(gs: GameState, player_index: int) -> bool:
     
     return has_chips and is_active
 
-def apply_stacks_to_players(stack_amount: int) -> GameState:
-    global _CURRENT_GAME, starting_stack
+def apply_stacks_to_players(stack_amount: int, game_id: Optional[str] = None) -> Optional[GameState]:
+    global starting_stack
+    if stack_amount != starting_stack:
+        hand_pool.invalidate(stack_amount)
     starting_stack = stack_amount
 
-    if _CURRENT_GAME is not None:
-        _CURRENT_GAME.stacks = [stack_amount for _ in _CURRENT_GAME.players]
+    if game_id is None:
+        return None
+    with registry.acquire(game_id) as gs:
+        gs.stacks = [stack_amount for _ in gs.players]
+    return gs
 #----------------------------------------------------------------------------------------------------------
 
 #---------------------------------------- Bot actions until user turn -------------------------------------
-def bots_act_until_user_turn(gs: GameState):
+def bots_act_until_user_turn(gs: GameState, user_index: Optional[int] = 0):
+    """Let bots act until it is ``user_index``'s turn; ``None`` makes every seat a bot."""
+    with BOT_LOOP_SECONDS.time():
+        return _bots_act_until_user_turn(gs, user_index)
+
+def _bots_act_until_user_turn(gs: GameState, user_index: Optional[int]):
     state = gs.poker_state
 
     while actor_indices(state):
         current_index = state.actor_indices[0]
-        if current_index == 0:
+        if current_index == user_index:
             break
 
         update_stacks(gs)
         bot_stack = gs.stacks[current_index]
-        
-        print(f"DEBUG: Bot {current_index + 1} has {bot_stack} chips")
+        logger.debug("Bot %s to act with %s chips", current_index + 1, bot_stack)
 
         try:
             call_amount = get_check_call_amount(state)
@@ -168,92 +261,34 @@ def bots_act_until_user_turn(gs: GameState):
             if bot_stack <= 0:
                 if state.can_fold():
                     state.fold()
-                    gs.actions_log.append(f"Player {current_index + 1} folds (no chips)")
+                    gs.actions_log.add(ActionCode.FOLD_NO_CHIPS, current_index + 1)
                 elif call_amount == 0 and state.can_check_or_call():
                     state.check_or_call()
-                    gs.actions_log.append(f"Player {current_index + 1} checks")
+                    gs.actions_log.add(ActionCode.CHECK, current_index + 1)
                 else:
-                    print(f"DEBUG: Bot {current_index + 1} has no chips and no valid actions")
+                    logger.warning("Bot %s has no chips and no valid actions", current_index + 1, extra={"game_id": gs.id})
                     break
                 continue
             
-            if state.can_check_or_call():
-                if call_amount == 0:
-                    decision = random.random()
-                    if decision < 0.6:
-                        state.check_or_call()
-                        gs.actions_log.append(f"Player {current_index + 1} checks")
-                    elif state.can_complete_bet_or_raise_to():
-                        max_bet = min(big_blind * random.randint(2, 4), bot_stack)
-                        if max_bet >= big_blind:
-                            state.complete_bet_or_raise_to(max_bet)
-                            if max_bet == bot_stack:
-                                gs.actions_log.append(f"Player {current_index + 1} bets all-in for {max_bet} chips")
-                            else:
-                                gs.actions_log.append(f"Player {current_index + 1} bets {max_bet} chips")
-                        else:
-                            state.check_or_call()
-                            gs.actions_log.append(f"Player {current_index + 1} checks")
-                    else:
-                        state.check_or_call()
-                        gs.actions_log.append(f"Player {current_index + 1} checks")
-                else:
-                    decision = random.random()
-                    
-                    if bot_stack < call_amount:
-                        if decision < 0.4 and bot_stack > 0:
-                            state.complete_bet_or_raise_to(bot_stack)
-                            gs.actions_log.append(f"Player {current_index + 1} calls all-in for {bot_stack} chips")
-                        else:
-                            state.fold()
-                            gs.actions_log.append(f"Player {current_index + 1} folds")
-                    elif call_amount > big_blind * 5:
-                        if decision < 0.6:
-                            state.fold()
-                            gs.actions_log.append(f"Player {current_index + 1} folds")
-                        else:
-                            state.check_or_call()
-                            gs.actions_log.append(f"Player {current_index + 1} calls {call_amount} chips")
-                    elif decision < 0.7:
-                        state.check_or_call()
-                        gs.actions_log.append(f"Player {current_index + 1} calls {call_amount} chips")
-                    elif decision < 0.85 and state.can_complete_bet_or_raise_to():
-                        max_raise = min(call_amount * 2, bot_stack)
-                        if max_raise > call_amount:
-                            state.complete_bet_or_raise_to(max_raise)
-                            if max_raise == bot_stack:
-                                gs.actions_log.append(f"Player {current_index + 1} raises all-in to {max_raise} chips")
-                            else:
-                                gs.actions_log.append(f"Player {current_index + 1} raises to {max_raise} chips")
-                        else:
-                            state.check_or_call()
-                            gs.actions_log.append(f"Player {current_index + 1} calls {call_amount} chips")
-                    else:
-                        state.fold()
-                        gs.actions_log.append(f"Player {current_index + 1} folds")
-                        
-            elif state.can_fold():
-                state.fold()
-                gs.actions_log.append(f"Player {current_index + 1} folds")
-            else:
-                print(f"DEBUG: Bot {current_index + 1} has no valid actions")
+            decision = bot_policy.decide(gs, current_index)
+            if not apply_bot_decision(gs, current_index, decision):
+                logger.warning("Bot %s has no valid actions", current_index + 1, extra={"game_id": gs.id})
                 break
                 
         except Exception as e:
-            print(f"DEBUG: Bot {current_index + 1} action failed: {e}")
+            logger.warning("Bot %s action failed: %s", current_index + 1, e, extra={"game_id": gs.id})
             try:
                 if state.can_fold():
                     state.fold()
-                    gs.actions_log.append(f"Player {current_index + 1} folds")
+                    gs.actions_log.add(ActionCode.FOLD, current_index + 1)
                 elif state.can_check_or_call():
                     call_amount = get_check_call_amount(state)
                     if call_amount > 0 and bot_stack < call_amount and bot_stack > 0:
                         state.complete_bet_or_raise_to(bot_stack)
-                        gs.actions_log.append(f"Player {current_index + 1} calls all-in for {bot_stack} chips")
+                        gs.actions_log.add(ActionCode.CALL_ALL_IN, current_index + 1, bot_stack)
                     else:
                         state.check_or_call()
-                        action_name = "checks" if call_amount == 0 else f"calls {call_amount} chips"
-                        gs.actions_log.append(f"Player {current_index + 1} {action_name}")
+                        gs.actions_log.add(ActionCode.CHECK if call_amount == 0 else ActionCode.CALL, current_index + 1, call_amount)
                 else:
                     break
             except Exception:
@@ -262,27 +297,69 @@ def bots_act_until_user_turn(gs: GameState):
         update_stacks(gs)
 
         if not actor_indices(state):
-            if getattr(state, "can_burn_card", False) and state.can_burn_card():
-                state.burn_card()
-            if getattr(state, "can_deal_board", False) and state.can_deal_board():
-                state.deal_board()
-                append_board_token(gs)
+            deal_next_street(gs)
 
     return gs
+
+def apply_bot_decision(gs: GameState, player_index: int, decision: BotDecision) -> bool:
+    """Play a policy's decision, falling back to check/call or fold when it is not legal."""
+    state = gs.poker_state
+    seat = player_index + 1
+    call_amount = get_check_call_amount(state)
+
+    if decision.action == "raise" and state.can_complete_bet_or_raise_to():
+        amount = max(decision.amount or 0, state.min_completion_betting_or_raising_to_amount)
+        amount = min(amount, state.max_completion_betting_or_raising_to_amount)
+        state.complete_bet_or_raise_to(amount)
+        all_in = state.stacks[player_index] == 0
+        if call_amount == 0:
+            gs.actions_log.add(ActionCode.BET_ALL_IN if all_in else ActionCode.BET, seat, amount)
+        else:
+            gs.actions_log.add(ActionCode.RAISE_ALL_IN if all_in else ActionCode.RAISE, seat, amount)
+        return True
+
+    if decision.action == "fold" and call_amount > 0 and state.can_fold():
+        state.fold()
+        gs.actions_log.add(ActionCode.FOLD, seat)
+        return True
+
+    if state.can_check_or_call():
+        state.check_or_call()
+        if call_amount == 0:
+            gs.actions_log.add(ActionCode.CHECK, seat)
+        elif state.stacks[player_index] == 0:
+            gs.actions_log.add(ActionCode.CALL_ALL_IN, seat, call_amount)
+        else:
+            gs.actions_log.add(ActionCode.CALL, seat, call_amount)
+        return True
+
+    if state.can_fold():
+        state.fold()
+        gs.actions_log.add(ActionCode.FOLD, seat)
+        return True
+
+    return False
 #----------------------------------------------------------------------------------------------------------
 
 # ---------------------------------------- Apply user action ----------------------------------------------
 def apply_action(game_id: str, action_token: str, amount: int | None = None) -> GameState:
-    global _CURRENT_GAME
+    try:
+        with USER_ACTION_SECONDS.time(), registry.acquire(game_id) as gs:
+            return _apply_action(gs, action_token, amount)
+    finally:
+        event_hub.publish(game_id)
+        if bot_scheduler is not None:
+            bot_scheduler.table_changed(game_id)
 
-    gs = _CURRENT_GAME
-    if gs is None:
-        raise KeyError("Game not found")
+def _apply_action(gs: GameState, action_token: str, amount: int | None = None) -> GameState:
+    if gs.status != "RUNNING":
+        raise Exception("Hand is already finished")
 
     state = gs.poker_state
 
-    if actor_indices(state) and state.actor_indices[0] != 0:
-        bots_act_until_user_turn(gs)
+    if not (actor_indices(state) and state.actor_indices[0] == 0):
+        # The scheduler has not run the bots yet; catch up before the user's move.
+        advance_hand(gs)
 
     if actor_indices(state) and state.actor_indices[0] == 0:
         tok = action_token.strip().lower()
@@ -290,21 +367,21 @@ def apply_action(game_id: str, action_token: str, amount: int | None = None) ->
         
         update_stacks(gs)
         current_stack = gs.stacks[0]
-        
-        print(f"DEBUG: Player action '{tok}', amount={amount}")
-        print(f"DEBUG: Player stack in poker_state: {player_stack}")  
-        print(f"DEBUG: Player stack in GameState: {current_stack}")
-        
+        logger.debug(
+            "Table %s user action %r amount=%s stack=%s (poker_state %s)",
+            gs.id, tok, amount, current_stack, player_stack,
+        )
+
         try:
             if tok == "f" and state.can_fold():
                 state.fold()
-                gs.actions_log.append("Player 1 folds")
+                gs.actions_log.add(ActionCode.FOLD, 1)
                 
             elif tok == "x":
                 call_amount = get_check_call_amount(state)
                 if call_amount == 0 and state.can_check_or_call():
                     state.check_or_call()
-                    gs.actions_log.append("Player 1 checks")
+                    gs.actions_log.add(ActionCode.CHECK, 1)
                 else:
                     raise Exception(f"Cannot check - must call {call_amount} or fold")
                     
@@ -314,18 +391,16 @@ def apply_action(game_id: str, action_token: str, amount: int | None = None) ->
                     if current_stack < call_amount:
                         if current_stack > 0:
                             state.complete_bet_or_raise_to(current_stack)
-                            gs.actions_log.append(f"Player 1 calls all-in for {current_stack} chips")
+                            gs.actions_log.add(ActionCode.CALL_ALL_IN, 1, current_stack)
                         else:
                             raise Exception("No chips remaining to call")
                     else:
                         state.check_or_call()
-                        gs.actions_log.append(f"Player 1 calls {call_amount} chips")
+                        gs.actions_log.add(ActionCode.CALL, 1, call_amount)
                 else:
                     raise Exception("No bet to call - use check instead")
                     
             elif tok == "b":
-                print(f"DEBUG: Attempting to bet {amount}")
-                
                 if current_stack <= 0:
                     raise Exception("Cannot bet - no chips remaining")
                 
@@ -341,15 +416,13 @@ def apply_action(game_id: str, action_token: str, amount: int | None = None) ->
                 if state.can_complete_bet_or_raise_to() and max_bet >= big_blind:
                     state.complete_bet_or_raise_to(max_bet)
                     if max_bet == current_stack:
-                        gs.actions_log.append(f"Player 1 bets all-in for {max_bet} chips")
+                        gs.actions_log.add(ActionCode.BET_ALL_IN, 1, max_bet)
                     else:
-                        gs.actions_log.append(f"Player 1 bets {max_bet} chips")
+                        gs.actions_log.add(ActionCode.BET, 1, max_bet)
                 else:
                     raise Exception(f"Cannot bet - minimum bet is {big_blind}")
                     
             elif tok == "r":
-                print(f"DEBUG: Attempting to raise to {amount}")
-                
                 if current_stack <= 0:
                     raise Exception("Cannot raise - no chips remaining")
                 
@@ -365,21 +438,19 @@ def apply_action(game_id: str, action_token: str, amount: int | None = None) ->
                 if state.can_complete_bet_or_raise_to():
                     state.complete_bet_or_raise_to(max_raise)
                     if max_raise == current_stack:
-                        gs.actions_log.append(f"Player 1 raises all-in to {max_raise} chips")
+                        gs.actions_log.add(ActionCode.RAISE_ALL_IN, 1, max_raise)
                     else:
-                        gs.actions_log.append(f"Player 1 raises to {max_raise} chips")
+                        gs.actions_log.add(ActionCode.RAISE, 1, max_raise)
                 else:
                     raise Exception("Cannot raise at this time")
                     
             elif tok == "allin":
-                print(f"DEBUG: Attempting all-in with stack {current_stack}")
-                
                 if current_stack <= 0:
                     raise Exception("Cannot go all-in - no chips remaining")
                 
                 if state.can_complete_bet_or_raise_to():
                     state.complete_bet_or_raise_to(current_stack)
-                    gs.actions_log.append(f"Player 1 goes all-in for {current_stack} chips")
+                    gs.actions_log.add(ActionCode.ALL_IN, 1, current_stack)
                 else:
                     raise Exception("Cannot go all-in at this time")
                     
@@ -388,29 +459,82 @@ def apply_action(game_id: str, action_token: str, amount: int | None = None) ->
                 if state.can_check_or_call():
                     if current_stack < call_amount and current_stack > 0:
                         state.complete_bet_or_raise_to(current_stack) 
-                        gs.actions_log.append(f"Player 1 calls all-in for {current_stack} chips")
+                        gs.actions_log.add(ActionCode.CALL_ALL_IN, 1, current_stack)
                     else:
                         state.check_or_call()
-                        action_name = "checks" if call_amount == 0 else f"calls {call_amount} chips"
-                        gs.actions_log.append(f"Player 1 {action_name}")
+                        gs.actions_log.add(ActionCode.CHECK if call_amount == 0 else ActionCode.CALL, 1, call_amount)
                 else:
                     raise Exception("No valid action available")
                     
         except Exception as e:
-            print(f"DEBUG: Exception in user action: {e}")
+            logger.info("Rejected user action %r: %s", tok, e, extra={"game_id": gs.id})
             raise e
 
     update_stacks(gs)
-    
-    bots_act_until_user_turn(gs)
 
-    if not actor_indices(state):
-        if getattr(state, "can_burn_card", False) and state.can_burn_card():
-            state.burn_card()
-        if getattr(state, "can_deal_board", False) and state.can_deal_board():
-            state.deal_board()
-            append_board_token(gs)
+    if bot_scheduler is None:
+        advance_hand(gs)
 
+    return gs
+
+def advance_hand(gs: GameState):
+    """Play bot turns and deal streets until the user is to act or the hand is over."""
+    while not is_hand_finished(gs):
+        bots_act_until_user_turn(gs)
+        if actor_indices(gs.poker_state):
+            break
+        deal_next_street(gs)
+
+    if gs.status == "RUNNING" and is_hand_finished(gs):
+        finalize_hand(gs)
+#----------------------------------------------------------------------------------------------------------
+
+# ---------------------------------------- Scheduled table work -------------------------------------------
+def advance_table(game_id: str) -> Optional[int]:
+    """Run the bots on a live table; return the log length if the user is now to act."""
+    try:
+        with registry.acquire(game_id) as gs:
+            if gs.status != "RUNNING":
+                return None
+            advance_hand(gs)
+            state = gs.poker_state
+            if gs.status == "RUNNING" and actor_indices(state) and state.actor_indices[0] == 0:
+                return len(gs.actions_log)
+            return None
+    except KeyError:
+        return None
+    finally:
+        event_hub.publish(game_id)
+
+def auto_act(game_id: str, seq: int) -> bool:
+    """Check, or fold facing a bet, for a user whose clock ran out at log length ``seq``.
+
+    Does nothing and returns False if the user acted in the meantime.
+    """
+    try:
+        with registry.acquire(game_id) as gs:
+            state = gs.poker_state
+            if gs.status != "RUNNING" or len(gs.actions_log) != seq:
+                return False
+            if not (actor_indices(state) and state.actor_indices[0] == 0):
+                return False
+            gs.actions_log.add(ActionCode.TIMEOUT, 1)
+            if get_check_call_amount(state) == 0 and state.can_check_or_call():
+                state.check_or_call()
+                gs.actions_log.add(ActionCode.CHECK, 1)
+            else:
+                state.fold()
+                gs.actions_log.add(ActionCode.FOLD, 1)
+            update_stacks(gs)
+            logger.info("User timed out", extra={"game_id": game_id})
+            return True
+    except KeyError:
+        return False
+    finally:
+        event_hub.publish(game_id)
+
+def is_hand_finished(gs: GameState) -> bool:
+    state = gs.poker_state
     finished_flag = False
     
     status_value = getattr(state, "status", None)
@@ -418,7 +542,7 @@ def apply_action(game_id: str, action_token: str, amount: int | None = None) ->
         status_str = str(status_value).upper()
         if "FINISHED" in status_str or "COMPLETE" in status_str:
             finished_flag = True
-            print(f"DEBUG: Game finished via status: {status_value}")
+            logger.debug("Table %s finished via status %s", gs.id, status_value)
 
     if not finished_flag and not actor_indices(state):
         can_deal_more = (getattr(state, "can_burn_card", False) and state.can_burn_card()) or \
@@ -426,70 +550,74 @@ def apply_action(game_id: str, action_token: str, amount: int | None = None) ->
         
         if not can_deal_more:
             finished_flag = True
-            print(f"DEBUG: Game finished - no more actions or cards")
+            logger.debug("Table %s finished: no more actions or cards", gs.id)
 
     if not finished_flag:
         active_players = [i for i, stack in enumerate(gs.stacks) if stack > 0]
-        print(f"DEBUG: Active players with chips: {len(active_players)}")
-        
         if len(active_players) <= 1:
             finished_flag = True
-            print(f"DEBUG: Game finished - only {len(active_players)} players with chips")
-
-    print(f"DEBUG: Finished flag final value: {finished_flag}")
-    if finished_flag:
-        finalize_hand(gs)
+            logger.debug("Table %s finished: only %s players with chips", gs.id, len(active_players))
 
-    return gs
+    return finished_flag
 #-----------------------------------------------------------------------------------------------------------------
 
 # ---------------------------------------- Finalize hand and persist history -------------------------------------
 def finalize_hand(gs: GameState) -> HandHistory:
-    global _CURRENT_GAME
-    state = gs.poker_state
+    with FINALIZE_SECONDS.time():
+        return _finalize_hand(gs)
+
+def _finalize_hand(gs: GameState) -> HandHistory:
+    hand = build_hand_history(gs)
+    nets = [seat.net for seat in hand.seats]
+    hand_stats = compute_hand_stats(gs.actions_log.seat_actions(), nets)
+
+    gs.hand = hand
+    gs.status = "FINISHED"
+    # Stored and counted only once the registry has saved the transition.
+    gs.after_save.append(lambda: _record_hand(hand, hand_stats))
 
-    hands_entries = []
-    for seat in range(1, len(gs.players) + 1):
-        hc = gs.hole_cards.get(seat, "")
-        clean_cards = hc.replace(", ", "").replace(" ", "")
-        hands_entries.append(f"Player{seat}: {clean_cards}")
-    dealt_str = "Hands: " + "; ".join(hands_entries)
+    return hand
 
-    actions_str = " ".join(gs.actions_log)
+def _record_hand(hand: HandHistory, hand_stats):
+    try:
+        if WRITE_BEHIND:
+            hand_writer.submit(hand)
+            logger.debug("Hand %s queued for writing", hand.id)
+        else:
+            with DB_SAVE_SECONDS.time():
+                HandRepository.save_hand(hand)
+            history_cache.bump()
+            logger.debug("Hand %s saved to database", hand.id)
+    except Exception as e:
+        HANDS_FAILED.inc()
+        logger.error("Failed to save hand: %s", e, extra={"game_id": hand.id})
+
+    stats_aggregator.record(hand_stats)
+    HANDS_FINISHED.inc()
 
+def build_hand_history(gs: GameState) -> HandHistory:
     update_stacks(gs)
     final_stacks = gs.stacks if hasattr(gs, 'stacks') else gs.poker_state.stacks
 
-    winnings_parts = []
+    seats = []
     for i in range(len(gs.players)):
-        start = starting_stack
-        final = final_stacks[i]
-        net = final - start
-        sign = "+" if net > 0 else ""
-        winnings_parts.append(f"Player {i+1}: {sign}{net}")
-
-    result_str = "Winnings: " + "; ".join(winnings_parts)
-
-    dealer = f"Player {gs.dealer_index + 1}"
-    small_blind_player = f"Player {(gs.dealer_index + 1) % len(gs.players) + 1}"
-    big_blind_player = f"Player {(gs.dealer_index + 2) % len(gs.players) + 1}"
-    main_info = f"Stack {starting_stack}; Dealer: {dealer}; {small_blind_player} Small blind; {big_blind_player} Big blind"
+        hole_cards = "".join(parse_cards(gs.hole_cards.get(i + 1, "")))
+        seats.append(SeatResult(seat=i + 1, hole_cards=hole_cards, net=final_stacks[i] - gs.starting_stack))
 
     hand = HandHistory(
         id=gs.id, 
-        mainInfo=main_info, 
-        dealt=dealt_str, 
-        actions=actions_str, 
-        result=result_str
+        mainInfo=render_main_info(gs.starting_stack, gs.dealer_index + 1, len(gs.players)),
+        dealt=render_dealt([seat.hole_cards for seat in seats]),
+        actions=" ".join(gs.actions_log),
+        result=render_result([seat.net for seat in seats]),
+        created_at=datetime.now(timezone.utc),
+        starting_stack=gs.starting_stack,
+        dealer_seat=gs.dealer_index + 1,
+        board=list(gs.board),
+        seats=seats,
+        seed=gs.seed,
+        operations=to_notation(gs.poker_state.operations),
     )
-
-    try:
-        HandRepository.save_hand(hand)
-        print(f"DEBUG: Hand {gs.id} saved to database")
-    except Exception as e:
-        print(f"DEBUG: Failed to save hand to database: {e}")
-
-    _CURRENT_GAME = None
-    gs.status = "FINISHED"
+    hand.record = encode_hand(hand, gs.actions_log.events)
 
     return hand
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""Hand histories in and out of the database in bulk.
+
+Two export formats are supported: ``ndjson`` (one ``HandHistory`` per
+line, seats included, which ``import`` reads back) and ``pokerstars``
+(the PokerStars text format most tracking tools understand). Exports go
+oldest first, so the ``(created_at, id)`` of the last hand written is a
+cursor that resumes the export where it stopped.
+"""
+import base64
+import json
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.models.hand import HandHistory, SeatResult
+from src.repositories.hand_repo import HandRepository
+from src.services import game
+from src.services.stats import nets_from_text
+
+FORMATS = ("ndjson", "pokerstars")
+
+STREETS = {0: "FLOP", 3: "TURN", 4: "RIVER"}  # keyed by board cards already out
+
+
+def encode_cursor(hand: HandHistory) -> str:
+    raw = f"{hand.created_at.isoformat()}|{hand.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, hand_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), hand_id
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def hand_to_dict(hand: HandHistory) -> dict:
+    data = asdict(hand)
+    del data["record"]
+    if hand.created_at is not None:
+        data["created_at"] = hand.created_at.isoformat()
+    return data
+
+
+def hand_from_dict(data: dict) -> HandHistory:
+    data = dict(data)
+    data["seats"] = [SeatResult(**seat) for seat in data.get("seats", [])]
+    if data.get("created_at"):
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+    return HandHistory(**data)
+
+
+def to_ndjson(hand: HandHistory) -> str:
+    return json.dumps(hand_to_dict(hand)) + "\n"
+
+
+def to_pokerstars(hand: HandHistory) -> Optional[str]:
+    """PokerStars-style text for a hand, rebuilt from its recorded operations.
+
+    Seats and blinds follow the engine: seat 1 posts the small blind and
+    seat 2 the big blind (the reverse heads-up, where seat 2 has the
+    button). Hands stored before operations were recorded return ``None``.
+    """
+    if not hand.operations:
+        return None
+    nets = [seat.net for seat in sorted(hand.seats, key=lambda s: s.seat)] or nets_from_text(hand.result)
+    n = len(nets)
+    start = hand.starting_stack or game.starting_stack
+    stacks = [start] * n
+    street = [0] * n
+    total = [0] * n
+
+    def put(p: int, amount: int) -> int:
+        amount = min(amount, stacks[p])
+        stacks[p] -= amount
+        street[p] += amount
+        total[p] += amount
+        return amount
+
+    if n == 2:
+        sb, bb, button = 1, 0, 1
+    else:
+        sb, bb, button = 0, 1, n - 1
+    played = hand.created_at.strftime("%Y/%m/%d %H:%M:%S UTC") if hand.created_at else ""
+    lines = [
+        f"PokerStars Hand #{hand.id}:  Hold'em No Limit ({game.small_blind}/{game.big_blind}) - {played}",
+        f"Table 'Poker' {n}-max Seat #{button + 1} is the button",
+    ]
+    lines += [f"Seat {p + 1}: Player {p + 1} ({start} in chips)" for p in range(n)]
+    lines.append(f"Player {sb + 1}: posts small blind {put(sb, game.small_blind)}")
+    lines.append(f"Player {bb + 1}: posts big blind {put(bb, game.big_blind)}")
+    lines.append("*** HOLE CARDS ***")
+
+    holes: Dict[int, List[str]] = {p: [] for p in range(n)}
+    board: List[str] = []
+    level = max(street)
+    folded = set()
+    dealt = False
+    for op in hand.operations:
+        parts = op.split()
+        if parts[1] == "dh":
+            holes[int(parts[2][1:]) - 1] += [parts[3][i:i + 2] for i in range(0, len(parts[3]), 2)]
+            continue
+        if not dealt:
+            lines += [f"Dealt to Player {p + 1} [{' '.join(holes[p])}]" for p in range(n)]
+            dealt = True
+        if parts[1] == "db":
+            cards = [parts[2][i:i + 2] for i in range(0, len(parts[2]), 2)]
+            previous = f" [{' '.join(board)}]" if board else ""
+            lines.append(f"*** {STREETS[len(board)]} ***{previous} [{' '.join(cards)}]")
+            board += cards
+            street, level = [0] * n, 0
+            continue
+        p = int(parts[0][1:]) - 1
+        if parts[1] == "f":
+            folded.add(p)
+            lines.append(f"Player {p + 1}: folds")
+        elif parts[1] == "cc":
+            owed = put(p, level - street[p])
+            action = f"calls {owed}" if owed else "checks"
+            lines.append(f"Player {p + 1}: {action}" + (" and is all-in" if owed and not stacks[p] else ""))
+        else:
+            to = int(parts[2])
+            put(p, to - street[p])
+            action = f"raises {to - level} to {to}" if level else f"bets {to}"
+            level = to
+            lines.append(f"Player {p + 1}: {action}" + (" and is all-in" if not stacks[p] else ""))
+
+    returned = [0] * n
+    ordered = sorted(range(n), key=lambda p: street[p], reverse=True)
+    if n > 1 and street[ordered[0]] > street[ordered[1]]:
+        top = ordered[0]
+        returned[top] = street[top] - street[ordered[1]]
+        lines.append(f"Uncalled bet ({returned[top]}) returned to Player {top + 1}")
+
+    live = [p for p in range(n) if p not in folded]
+    if len(live) > 1:
+        lines.append("*** SHOW DOWN ***")
+        lines += [f"Player {p + 1}: shows [{' '.join(holes[p])}]" for p in live]
+    collected = [nets[p] + total[p] - returned[p] for p in range(n)]
+    lines += [f"Player {p + 1} collected {collected[p]} from pot" for p in range(n) if collected[p] > 0]
+
+    lines.append("*** SUMMARY ***")
+    lines.append(f"Total pot {sum(total) - sum(returned)} | Rake 0")
+    if board:
+        lines.append(f"Board [{' '.join(board)}]")
+    for p in range(n):
+        if p in folded:
+            outcome = "folded"
+        elif len(live) > 1:
+            outcome = f"showed [{' '.join(holes[p])}] and " + (f"won ({collected[p]})" if collected[p] > 0 else "lost")
+        else:
+            outcome = f"collected ({collected[p]})"
+        lines.append(f"Seat {p + 1}: Player {p + 1} {outcome}")
+    return "\n".join(lines) + "\n\n\n"
+
+
+def export_hands(fmt: str, after: Optional[Tuple[datetime, str]] = None) -> Iterator[Tuple[HandHistory, Optional[str]]]:
+    """``(hand, text)`` pairs streamed oldest first; ``text`` is ``None`` for hands the format cannot express."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    render = to_ndjson if fmt == "ndjson" else to_pokerstars
+    for hand in HandRepository.iter_after(after):
+        yield hand, render(hand)
+
+
+def import_hands(lines: Iterable[str], batch_size: int = 5000) -> Iterator[Tuple[int, int]]:
+    """Load NDJSON hands in batches, yielding ``(lines read, hands inserted)`` after each batch."""
+    batch: List[HandHistory] = []
+    read = 0
+    for line in lines:
+        read += 1
+        if line.strip():
+            batch.append(hand_from_dict(json.loads(line)))
+        if len(batch) >= batch_size:
+            yield read, HandRepository.bulk_insert(batch)
+            batch = []
+    if batch:
+        yield read, HandRepository.bulk_insert(batch)
+
+
+class Throughput:
+    """Rows processed and rows/sec since construction, for progress lines."""
+
+    def __init__(self):
+        self.rows = 0
+        self.started = time.perf_counter()
+
+    def add(self, rows: int = 1):
+        self.rows += rows
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.rows / elapsed if elapsed else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.rows} rows ({self.rate:.0f} rows/sec)"
@@ -0,0 +1,139 @@
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from src.models.game_state import GameState
+from src.services.metrics import metrics
+
+HAND_POOL_DEPTH = int(os.getenv("HAND_POOL_DEPTH", "16"))
+HAND_POOL_MAX_CONFIGS = int(os.getenv("HAND_POOL_MAX_CONFIGS", "8"))
+
+logger = logging.getLogger(__name__)
+
+POOL_HITS = metrics.counter("poker_hand_pool_hits_total", "Hands started from a pre-dealt pool entry")
+POOL_MISSES = metrics.counter("poker_hand_pool_misses_total", "Hands dealt inside the request because the pool was empty")
+POOL_REFILL_SECONDS = metrics.histogram("poker_hand_pool_refill_seconds", "Time to pre-deal one pooled hand")
+
+PoolKey = Tuple[int, int]  # (num_players, starting_stack)
+
+
+class HandPool:
+    """Pre-dealt hands per (num_players, starting_stack), kept topped up by a background thread.
+
+    ``take`` pops a dealt hand or returns ``None`` on a miss; either way the
+    configuration is remembered, so the producer starts keeping ``depth``
+    hands ready for it. Only the ``max_configs`` most recently requested
+    configurations are kept, and a configuration that fails to deal is
+    dropped. ``invalidate`` drops every pooled hand, e.g.
+    when the starting stack changes, and hands that were being dealt at
+    that moment are thrown away.
+    """
+
+    def __init__(
+        self,
+        deal: Callable[[int, int], GameState],
+        depth: int = HAND_POOL_DEPTH,
+        max_configs: int = HAND_POOL_MAX_CONFIGS,
+    ):
+        self.deal = deal
+        self.depth = depth
+        self.max_configs = max_configs
+        self._pools: "OrderedDict[PoolKey, Deque[GameState]]" = OrderedDict()
+        self._generation = 0
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def take(self, num_players: int, stack: int) -> Optional[GameState]:
+        key = (num_players, stack)
+        with self._cond:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = deque()
+                while len(self._pools) > self.max_configs:
+                    self._pools.popitem(last=False)
+            self._pools.move_to_end(key)
+            gs = pool.popleft() if pool else None
+            self._cond.notify()
+        (POOL_HITS if gs is not None else POOL_MISSES).inc()
+        return gs
+
+    def invalidate(self, stack: Optional[int] = None):
+        """Drop pooled hands; with ``stack``, keep refilling the same table sizes at the new stack."""
+        with self._cond:
+            sizes = [num_players for num_players, _ in self._pools]
+            self._pools.clear()
+            self._generation += 1
+            if stack is not None:
+                for num_players in sizes:
+                    self._pools[(num_players, stack)] = deque()
+            self._cond.notify()
+
+    def warm(self, num_players: int, stack: int):
+        with self._cond:
+            self._pools.setdefault((num_players, stack), deque())
+            self._cond.notify()
+
+    def depths(self) -> Dict[PoolKey, int]:
+        with self._cond:
+            return {key: len(pool) for key, pool in self._pools.items()}
+
+    def stats(self) -> dict:
+        return {
+            "depth": self.depth,
+            "pools": [
+                {"num_players": n, "starting_stack": stack, "ready": ready}
+                for (n, stack), ready in self.depths().items()
+            ],
+            "hits": POOL_HITS.value,
+            "misses": POOL_MISSES.value,
+        }
+
+    def start(self):
+        if self._thread is not None or self.depth <= 0:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="hand-pool", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self._thread.join()
+        self._thread = None
+
+    def _next_key(self) -> Tuple[Optional[PoolKey], int]:
+        with self._cond:
+            while not self._stopping:
+                for key, pool in reversed(self._pools.items()):
+                    if len(pool) < self.depth:
+                        return key, self._generation
+                self._cond.wait()
+            return None, self._generation
+
+    def _run(self):
+        while True:
+            key, generation = self._next_key()
+            if key is None:
+                return
+            try:
+                with POOL_REFILL_SECONDS.time():
+                    gs = self.deal(*key)
+            except Exception as e:
+                # Dealing is deterministic apart from the shuffle, so a key that
+                # fails once fails every time; stop refilling it.
+                logger.error("Failed to pre-deal a %s-player hand, dropping the pool: %s", key[0], e)
+                with self._cond:
+                    if generation == self._generation:
+                        self._pools.pop(key, None)
+                continue
+            with self._cond:
+                pool = self._pools.get(key)
+                if generation == self._generation and pool is not None and len(pool) < self.depth:
+                    pool.append(gs)
+
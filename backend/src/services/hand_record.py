@@ -0,0 +1,298 @@
+"""Compact binary records for stored hand histories.
+
+A record is the packed form of a hand's four text fields (``mainInfo``,
+``dealt``, ``actions``, ``result``). It starts with ``b"PH"`` and a format
+version byte. Version 1 continues with a flags byte and, without
+``FLAG_TEXT``, this body:
+
+    varint  starting stack
+    byte    dealer seat (0 when unknown)
+    byte    number of seats, then per seat:
+              byte card count, card bytes (hole cards); zigzag varint net
+    varint  number of log events, then per event:
+              byte code, then
+              DEALT:      byte seat, byte card count, card bytes
+              BOARD:      byte card count, card bytes
+              SEPARATOR:  nothing
+              any other:  byte seat, varint amount
+
+A card byte is ``rank * 4 + suit`` in ``cards.RANKS`` / ``cards.SUITS``
+order. A 6-max hand packs into roughly 150 bytes against about 1 KB of text.
+
+Text that the renderer would not reproduce byte for byte (hand-written
+imports, rows from older builds) is kept with ``FLAG_TEXT`` as four
+varint-length UTF-8 strings, so every record renders back to exactly what
+was saved.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+from src.models.action_log import ActionCode, ActionEvent, ActionLog, _TEMPLATES
+from src.models.hand import HandHistory
+from src.services.cards import RANKS, SUITS
+
+MAGIC = b"PH"
+VERSION = 1
+FLAG_TEXT = 1
+
+_HEADER = MAGIC + bytes([VERSION])
+_CARD_BYTES = {rank + suit: r * 4 + s for r, rank in enumerate(RANKS) for s, suit in enumerate(SUITS)}
+_CARD_CODES = {value: code for code, value in _CARD_BYTES.items()}
+_CODES = {code.value: code for code in ActionCode}
+
+Texts = Tuple[str, str, str, str]
+
+
+@dataclass
+class PackedHand:
+    """A decoded record; ``texts`` is set instead of the rest for ``FLAG_TEXT`` records."""
+    starting_stack: int = 0
+    dealer_seat: Optional[int] = None
+    seats: List[Tuple[str, int]] = field(default_factory=list)  # (hole cards, net) by seat number
+    log: Optional[ActionLog] = None
+    texts: Optional[Texts] = None
+
+
+# ---- rendering ----
+
+def render_main_info(starting_stack: int, dealer_seat: int, num_players: int) -> str:
+    return (
+        f"Stack {starting_stack}; Dealer: Player {dealer_seat}; "
+        f"Player {dealer_seat % num_players + 1} Small blind; Player {(dealer_seat + 1) % num_players + 1} Big blind"
+    )
+
+
+def render_dealt(holes: Sequence[str]) -> str:
+    return "Hands: " + "; ".join(f"Player{seat}: {cards}" for seat, cards in enumerate(holes, start=1))
+
+
+def render_result(nets: Sequence[int]) -> str:
+    return "Winnings: " + "; ".join(f"Player {seat}: {'+' if net > 0 else ''}{net}" for seat, net in enumerate(nets, start=1))
+
+
+def render(packed: PackedHand) -> Texts:
+    if packed.texts is not None:
+        return packed.texts
+    return (
+        render_main_info(packed.starting_stack, packed.dealer_seat or 0, len(packed.seats)),
+        render_dealt([cards for cards, _ in packed.seats]),
+        " ".join(packed.log),
+        render_result([net for _, net in packed.seats]),
+    )
+
+
+def render_record(record: bytes) -> Texts:
+    """The four text fields of a hand, rendered from its record."""
+    return render(decode_record(record))
+
+
+# ---- encoding ----
+
+def _varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _cards(out: bytearray, cards: Sequence[str]):
+    out.append(len(cards))
+    out.extend(_CARD_BYTES[card] for card in cards)
+
+
+def _hole(cards: str) -> List[str]:
+    return [cards[i:i + 2] for i in range(0, len(cards), 2)]
+
+
+def _pack(starting_stack: int, dealer_seat: Optional[int], seats: Sequence[Tuple[str, int]],
+          events: Sequence[ActionEvent]) -> bytes:
+    out = bytearray(_HEADER)
+    out.append(0)
+    _varint(out, starting_stack)
+    out.append(dealer_seat or 0)
+    out.append(len(seats))
+    for cards, net in seats:
+        _cards(out, _hole(cards))
+        _varint(out, net << 1 if net >= 0 else (-net << 1) - 1)
+    _varint(out, len(events))
+    for event in events:
+        code = event.code
+        out.append(code)
+        if code == ActionCode.DEALT:
+            out.append(event.seat)
+            _cards(out, event.cards)
+        elif code == ActionCode.BOARD:
+            _cards(out, event.cards)
+        elif code != ActionCode.SEPARATOR:
+            out.append(event.seat)
+            _varint(out, event.amount)
+    return bytes(out)
+
+
+def _pack_text(texts: Texts) -> bytes:
+    out = bytearray(_HEADER)
+    out.append(FLAG_TEXT)
+    for text in texts:
+        data = text.encode("utf-8")
+        _varint(out, len(data))
+        out.extend(data)
+    return bytes(out)
+
+
+def encode_hand(hand: HandHistory, events: Optional[Sequence[ActionEvent]] = None) -> bytes:
+    """Pack a hand's text fields.
+
+    With ``events`` (the table's action log) the hand is taken to have
+    been rendered by ``build_hand_history`` and is packed directly.
+    Without them the texts are parsed back and the result is checked
+    against the original, falling back to ``FLAG_TEXT`` on any difference.
+    """
+    texts = (hand.mainInfo, hand.dealt, hand.actions, hand.result)
+    if events is not None:
+        seats = [(seat.hole_cards, seat.net) for seat in sorted(hand.seats, key=lambda s: s.seat)]
+        return _pack(hand.starting_stack or 0, hand.dealer_seat, seats, events)
+
+    parsed = _parse(texts)
+    if parsed is not None:
+        record = _pack(*parsed)
+        if render_record(record) == texts:
+            return record
+    return _pack_text(texts)
+
+
+# ---- decoding ----
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _read_cards(data: bytes, pos: int) -> Tuple[Tuple[str, ...], int]:
+    count = data[pos]
+    end = pos + 1 + count
+    return tuple(_CARD_CODES[b] for b in data[pos + 1:end]), end
+
+
+def decode_record(record: bytes) -> PackedHand:
+    if record[:2] != MAGIC:
+        raise ValueError("Not a hand record")
+    if record[2] != VERSION:
+        raise ValueError(f"Unsupported hand record version {record[2]}")
+    data = bytes(record)
+    pos = 4
+    if data[3] & FLAG_TEXT:
+        texts = []
+        for _ in range(4):
+            length, pos = _read_varint(data, pos)
+            texts.append(data[pos:pos + length].decode("utf-8"))
+            pos += length
+        return PackedHand(texts=tuple(texts))
+
+    starting_stack, pos = _read_varint(data, pos)
+    dealer_seat = data[pos] or None
+    count = data[pos + 1]
+    pos += 2
+    seats = []
+    for _ in range(count):
+        cards, pos = _read_cards(data, pos)
+        zigzag, pos = _read_varint(data, pos)
+        seats.append(("".join(cards), -((zigzag + 1) >> 1) if zigzag & 1 else zigzag >> 1))
+
+    log = ActionLog()
+    count, pos = _read_varint(data, pos)
+    for _ in range(count):
+        code = _CODES[data[pos]]
+        pos += 1
+        if code == ActionCode.DEALT:
+            seat = data[pos]
+            cards, pos = _read_cards(data, pos + 1)
+            log.add(code, seat, cards=cards)
+        elif code == ActionCode.BOARD:
+            cards, pos = _read_cards(data, pos)
+            log.add(code, cards=cards)
+        elif code == ActionCode.SEPARATOR:
+            log.add(code)
+        else:
+            seat = data[pos]
+            amount, pos = _read_varint(data, pos + 1)
+            log.add(code, seat, amount)
+    return PackedHand(starting_stack, dealer_seat, seats, log)
+
+
+# ---- parsing text from older rows ----
+
+_CARD = r"[2-9TJQKA][cdhs]"
+_MAIN_INFO = re.compile(r"Stack (\d+); Dealer: Player (\d+); .*")
+_DEALT_SEAT = re.compile(rf"Player(\d+): ((?:{_CARD})*)")
+_RESULT_SEAT = re.compile(r"Player (\d+): ([+-]?\d+)")
+_EVENT_PATTERNS = [
+    (ActionCode.DEALT, re.compile(rf"Player (?P<seat>\d+) is dealt (?P<cards>[A-Z ]+? \({_CARD}\)(?:, [A-Z ]+? \({_CARD}\))*)(?= |$)")),
+    (ActionCode.BOARD, re.compile(rf"(?P<cards>(?:{_CARD})+)(?= |$)")),
+] + sorted(
+    (
+        (code, re.compile(
+            re.escape(template).replace(r"\{seat\}", r"(?P<seat>\d+)").replace(r"\{amount\}", r"(?P<amount>\d+)") + "(?= |$)"
+        ))
+        for code, template in _TEMPLATES.items()
+    ),
+    key=lambda item: -len(item[1].pattern),
+)
+_CARD_IN_NAME = re.compile(rf"\(({_CARD})\)")
+_CARD_RUN = re.compile(_CARD)
+
+
+def _parse_events(actions: str) -> Optional[List[ActionEvent]]:
+    events = []
+    pos = 0
+    while pos < len(actions):
+        for code, pattern in _EVENT_PATTERNS:
+            match = pattern.match(actions, pos)
+            if match is not None:
+                break
+        else:
+            return None
+        groups = match.groupdict()
+        if code == ActionCode.DEALT:
+            cards = tuple(_CARD_IN_NAME.findall(groups["cards"]))
+        elif code == ActionCode.BOARD:
+            cards = tuple(_CARD_RUN.findall(groups["cards"]))
+        else:
+            cards = ()
+        events.append(ActionEvent(code, int(groups.get("seat") or 0), int(groups.get("amount") or 0), cards=cards))
+        pos = match.end() + 1
+    return events
+
+
+def _parse_seats(pattern: re.Pattern, text: str, prefix: str) -> Optional[List[str]]:
+    if not text.startswith(prefix):
+        return None
+    values = []
+    for number, part in enumerate(text[len(prefix):].split("; "), start=1):
+        match = pattern.fullmatch(part)
+        if match is None or int(match.group(1)) != number:
+            return None
+        values.append(match.group(2))
+    return values
+
+
+def _parse(texts: Texts):
+    main_info, dealt, actions, result = texts
+    header = _MAIN_INFO.fullmatch(main_info)
+    holes = _parse_seats(_DEALT_SEAT, dealt, "Hands: ")
+    nets = _parse_seats(_RESULT_SEAT, result, "Winnings: ")
+    if header is None or holes is None or nets is None or len(holes) != len(nets):
+        return None
+    dealer_seat = int(header.group(2))
+    if not 0 < dealer_seat < 256 or any(len(cards) not in (0, 4) for cards in holes):
+        return None
+    events = _parse_events(actions)
+    if events is None or any(e.seat > 255 for e in events):
+        return None
+    return int(header.group(1)), dealer_seat, list(zip(holes, map(int, nets))), events
@@ -0,0 +1,196 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Optional
+
+from src.models.hand import HandHistory
+from src.repositories.hand_repo import HandRepository
+from src.services.metrics import DB_SAVE_SECONDS, HANDS_FAILED
+from src.services.response_cache import history_cache
+
+logger = logging.getLogger(__name__)
+
+WRITE_BEHIND = os.getenv("HAND_WRITE_MODE", "inline").lower() == "behind"
+HAND_WRITE_QUEUE_SIZE = int(os.getenv("HAND_WRITE_QUEUE_SIZE", "10000"))
+HAND_WRITE_BATCH_SIZE = int(os.getenv("HAND_WRITE_BATCH_SIZE", "500"))
+HAND_WRITE_FLUSH_INTERVAL = float(os.getenv("HAND_WRITE_FLUSH_INTERVAL", "0.5"))
+HAND_WRITE_ENQUEUE_TIMEOUT = float(os.getenv("HAND_WRITE_ENQUEUE_TIMEOUT", "1.0"))
+HAND_WRITE_RETRIES = 3
+HAND_WRITE_RETRY_DELAY = float(os.getenv("HAND_WRITE_RETRY_DELAY", "0.1"))
+HAND_WRITE_MAX_BACKOFF = float(os.getenv("HAND_WRITE_MAX_BACKOFF", "30"))
+
+
+@dataclass
+class _Part:
+    """Part of a batch that is still being retried."""
+    hands: List[HandHistory]
+    failures: int = 0
+    failing_since: Optional[float] = None
+
+
+class HandWriter:
+    """Write-behind persistence for finished hands.
+
+    ``submit`` puts the hand on a bounded queue and returns; a background
+    thread flushes the queue in batches when ``batch_size`` hands are
+    waiting or ``flush_interval`` seconds have passed since the first one
+    arrived. When the queue is full ``submit`` waits up to
+    ``enqueue_timeout`` seconds and then writes the hand inline, so a slow
+    database slows callers down instead of losing hands. ``stop`` drains
+    whatever is still queued.
+
+    A batch that cannot be written is retried with exponential backoff up
+    to ``max_backoff`` seconds, for as long as it takes. Meanwhile the queue
+    fills up and ``submit`` slows callers down. A part of the batch that
+    fails ``HAND_WRITE_RETRIES`` times in a row is split in half and the
+    halves take turns, so a hand the store rejects ends up on its own. It
+    is dropped once another write has gone through since it started
+    failing, because that shows the store works and the hand does not. If
+    the store is still down while stopping, hands are dropped after
+    ``HAND_WRITE_RETRIES`` failed attempts, so shutdown does not hang.
+    """
+
+    def __init__(
+        self,
+        save_batch: Callable[[List[HandHistory]], None] = HandRepository.save_hands,
+        max_queue: int = HAND_WRITE_QUEUE_SIZE,
+        batch_size: int = HAND_WRITE_BATCH_SIZE,
+        flush_interval: float = HAND_WRITE_FLUSH_INTERVAL,
+        enqueue_timeout: float = HAND_WRITE_ENQUEUE_TIMEOUT,
+        retry_delay: float = HAND_WRITE_RETRY_DELAY,
+        max_backoff: float = HAND_WRITE_MAX_BACKOFF,
+    ):
+        self.save_batch = save_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.retry_delay = retry_delay
+        self.max_backoff = max_backoff
+        self._queue: "queue.Queue[HandHistory]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._start_lock = threading.Lock()
+        self.written = 0
+        self.failed = 0
+        self.inline_writes = 0
+        self.batches = 0
+        self._last_write = 0.0
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def start(self):
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="hand-writer", daemon=True)
+            self._thread.start()
+
+    def submit(self, hand: HandHistory):
+        if self._thread is None:
+            self.start()
+        try:
+            self._queue.put(hand, timeout=self.enqueue_timeout)
+        except queue.Full:
+            self.inline_writes += 1
+            self.save_batch([hand])
+            self._last_write = time.monotonic()
+            history_cache.bump()
+            self.written += 1
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the writer after flushing every queued hand."""
+        with self._start_lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._stopping.set()
+            thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not (self._stopping.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if batch:
+                self._flush(batch)
+
+    def _next_batch(self) -> List[HandHistory]:
+        try:
+            first = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if self._stopping.is_set():
+                remaining = 0
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: List[HandHistory]):
+        parts: Deque[_Part] = deque([_Part(batch)])
+        streak = 0
+        while parts:
+            part = parts.popleft()
+            try:
+                with DB_SAVE_SECONDS.time():
+                    self.save_batch(part.hands)
+            except Exception as e:
+                streak += 1
+                part.failures += 1
+                if part.failing_since is None:
+                    part.failing_since = time.monotonic()
+                logger.warning("Failed to write %s hands (attempt %s): %s", len(part.hands), part.failures, e)
+                self._retry_later(parts, part)
+                self._stopping.wait(min(self.max_backoff, self.retry_delay * 2 ** streak))
+                continue
+            streak = 0
+            self._last_write = time.monotonic()
+            history_cache.bump()
+            self.written += len(part.hands)
+            self.batches += 1
+
+    def _retry_later(self, parts: Deque[_Part], part: _Part):
+        if part.failures < HAND_WRITE_RETRIES:
+            parts.append(part)
+        elif len(part.hands) == 1 and self._last_write > part.failing_since:
+            self._drop(part, "the store accepts other hands")
+        elif self._stopping.is_set():
+            self._drop(part, "stopping while the store is failing")
+        elif len(part.hands) > 1:
+            middle = len(part.hands) // 2
+            parts.append(_Part(part.hands[:middle], failing_since=part.failing_since))
+            parts.append(_Part(part.hands[middle:], failing_since=part.failing_since))
+        else:
+            parts.append(part)
+
+    def _drop(self, part: _Part, reason: str):
+        self.failed += len(part.hands)
+        HANDS_FAILED.inc(len(part.hands))
+        logger.error("Dropped %s hands after %s attempts (%s): %s",
+                     len(part.hands), part.failures, reason, ", ".join(h.id for h in part.hands))
+
+    def stats(self) -> dict:
+        return {
+            "enabled": WRITE_BEHIND,
+            "pending": self.pending,
+            "written": self.written,
+            "batches": self.batches,
+            "failed": self.failed,
+            "inline_writes": self.inline_writes,
+        }
+
+
+hand_writer = HandWriter()
+atexit.register(hand_writer.stop)
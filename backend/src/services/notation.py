@@ -0,0 +1,35 @@
+"""Compact, PHH-style text for the dealt cards and player actions of a hand.
+
+    d dh p1 7c       hole card dealt to player 1
+    d db KhTh6d      board cards dealt (burns are implied)
+    p3 cc            check or call
+    p3 cbr 80        bet or raise to 80
+    p1 f             fold
+
+``p1`` is pokerkit's player index 0, i.e. seat 1. Automated operations
+(blinds, bet collection, showdown, pot pushing) are left out because the
+engine repeats them on its own during a replay.
+"""
+from typing import Iterable, List
+
+from pokerkit import BoardDealing, CheckingOrCalling, CompletionBettingOrRaisingTo, Folding, HoleDealing
+
+
+def _cards(cards) -> str:
+    return "".join(repr(card) for card in cards)
+
+
+def to_notation(operations: Iterable) -> List[str]:
+    lines = []
+    for op in operations:
+        if isinstance(op, HoleDealing):
+            lines.append(f"d dh p{op.player_index + 1} {_cards(op.cards)}")
+        elif isinstance(op, BoardDealing):
+            lines.append(f"d db {_cards(op.cards)}")
+        elif isinstance(op, Folding):
+            lines.append(f"p{op.player_index + 1} f")
+        elif isinstance(op, CheckingOrCalling):
+            lines.append(f"p{op.player_index + 1} cc")
+        elif isinstance(op, CompletionBettingOrRaisingTo):
+            lines.append(f"p{op.player_index + 1} cbr {op.amount}")
+    return lines
@@ -0,0 +1,97 @@
+"""Precomputed preflop equity for the 169 starting-hand classes.
+
+The table holds the all-in equity of every class against 1..MAX_OPPONENTS
+random hands, stored as uint16 fractions of 65535 behind a small versioned
+header. It is loaded once, on first use. Regenerate it with
+
+    python -m src.services.preflop --samples 40000
+"""
+import argparse
+import os
+import struct
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.services.cards import RANKS, hand_class
+from src.services.equity import estimate_equity
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "preflop_equity.bin")
+MAGIC = b"PFEQ"
+VERSION = 1
+MAX_OPPONENTS = 9
+_HEADER = struct.Struct("<4sBBH")
+
+
+def hand_classes() -> List[str]:
+    """All 169 classes, pairs first, then suited and offsuit from the top."""
+    classes = [r + r for r in reversed(RANKS)]
+    for i in range(len(RANKS) - 1, -1, -1):
+        for j in range(i - 1, -1, -1):
+            classes.append(RANKS[i] + RANKS[j] + "s")
+            classes.append(RANKS[i] + RANKS[j] + "o")
+    return classes
+
+
+def representative(cls: str) -> List[str]:
+    if len(cls) == 2:
+        return [cls[0] + "s", cls[1] + "h"]
+    return [cls[0] + "s", cls[1] + ("s" if cls[2] == "s" else "h")]
+
+
+def build_table(samples: int, seed: int = 0) -> Dict[str, List[float]]:
+    rng = np.random.default_rng(seed)
+    return {
+        cls: [estimate_equity(representative(cls), [], n, samples, rng=rng).equity for n in range(1, MAX_OPPONENTS + 1)]
+        for cls in hand_classes()
+    }
+
+
+def write_table(table: Dict[str, List[float]], path: str = TABLE_PATH):
+    classes = hand_classes()
+    values = array("H", (round(table[cls][n] * 65535) for cls in classes for n in range(MAX_OPPONENTS)))
+    if values.itemsize != 2:
+        raise RuntimeError("unsigned short is not 16 bits on this platform")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, MAX_OPPONENTS, len(classes)))
+        f.write(values.tobytes())
+
+
+@lru_cache(maxsize=None)
+def load_table(path: str = TABLE_PATH) -> Dict[str, tuple]:
+    with open(path, "rb") as f:
+        magic, version, opponents, count = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Unsupported preflop table in {path}")
+        values = array("H")
+        values.frombytes(f.read())
+    classes = hand_classes()
+    if count != len(classes) or len(values) != count * opponents:
+        raise ValueError(f"Truncated preflop table in {path}")
+    return {
+        cls: tuple(v / 65535 for v in values[i * opponents:(i + 1) * opponents])
+        for i, cls in enumerate(classes)
+    }
+
+
+def preflop_equity(hole: List[str], opponents: int) -> float:
+    table = load_table()
+    row = table[hand_class(hole)]
+    return row[min(max(opponents, 1), len(row)) - 1]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Regenerate the preflop equity table")
+    parser.add_argument("--samples", type=int, default=40000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=TABLE_PATH)
+    args = parser.parse_args(argv)
+    write_table(build_table(args.samples, args.seed), args.output)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
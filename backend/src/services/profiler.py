@@ -0,0 +1,217 @@
+"""Sampled request profiles written as collapsed stacks.
+
+While a request is profiled, a sampler thread reads ``sys._current_frames``
+every ``PROFILE_INTERVAL`` seconds and counts each distinct stack. No trace
+hooks are installed, so the request runs at full speed apart from the GIL
+the sampler briefly takes. Stacks are rooted at the thread name. Threads
+parked in the standard library (idle threadpool workers, the event loop
+waiting in ``select``) are skipped. Other requests that run at the same
+time show up in the profile as well, so profile under steady load, not
+under a burst.
+
+Profiles are written one per request to ``PROFILE_DIR`` in the collapsed
+format (``frame;frame;frame count`` per line). ``flamegraph.pl`` and
+speedscope both read it as is. Only the newest ``PROFILE_KEEP`` files are
+kept.
+
+A request is profiled when ``PROFILE_SAMPLE_RATE`` picks it, or when
+``PROFILE_TOKEN`` is set and the request sends it in ``X-Profile``. With
+neither set, profiling is off and ``ProfileMiddleware`` is not installed.
+Sampling stops when the response headers are sent. For a regular response
+that is after the handler has built the body. For a streaming response
+(the SSE table events, NDJSON exports) only the work up to the first
+headers is covered, not the stream itself.
+
+Listing and downloading profiles needs ``PROFILE_TOKEN``. Without it, the
+``/debug/profiles`` endpoints answer 404 even when sampling is on.
+"""
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter as Tally
+from typing import Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from src.services.metrics import metrics
+
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN", "")
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.001"))
+PROFILE_KEEP = int(os.getenv("PROFILE_KEEP", "200"))
+
+PROFILE_SUFFIX = ".collapsed"
+
+PROFILES_WRITTEN = metrics.counter("poker_profiles_written_total", "Request profiles written to PROFILE_DIR")
+
+_STDLIB = os.path.dirname(os.__file__)
+_IDLE = {"wait", "select", "poll", "get", "accept", "_wait_for_tstate_lock"}
+_NAME = re.compile(r"^[\w.-]+\.collapsed$")
+
+
+def _is_idle(frame) -> bool:
+    code = frame.f_code
+    return code.co_name in _IDLE and code.co_filename.startswith(_STDLIB)
+
+
+def _frame_label(frame) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_name}"
+
+
+class Sampler:
+    """Counts the stacks of busy threads until ``stop``."""
+
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        self.interval = interval
+        self.stacks: Tally = Tally()
+        self.samples = 0
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sample(self, skip: int):
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == skip or _is_idle(frame):
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.append(names.get(ident, str(ident)))
+            self.stacks[";".join(reversed(labels))] += 1
+        self.samples += 1
+
+    def _run(self):
+        me = threading.get_ident()
+        while not self._stopping.wait(self.interval):
+            self.sample(me)
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class ProfileStore:
+    """Decides which requests to profile and keeps the written profiles."""
+
+    def __init__(
+        self,
+        directory: str = PROFILE_DIR,
+        sample_rate: float = PROFILE_SAMPLE_RATE,
+        token: str = PROFILE_TOKEN,
+        keep: int = PROFILE_KEEP,
+    ):
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.token = token
+        self.keep = keep
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0 or bool(self.token)
+
+    def authorized(self, header: Optional[str]) -> bool:
+        if not self.token or header is None:
+            return False
+        return hmac.compare_digest(header.encode(), self.token.encode())
+
+    def wanted(self, header: Optional[str]) -> bool:
+        if self.authorized(header):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def save(self, method: str, path: str, elapsed: float, sampler: Sampler) -> str:
+        endpoint = re.sub(r"[^\w-]+", "_", path.strip("/")) or "root"
+        now = time.time_ns()
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(now // 1_000_000_000))
+        name = f"{stamp}.{now % 1_000_000_000:09d}-{method}-{endpoint}-{elapsed * 1000:.0f}ms{PROFILE_SUFFIX}"
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, name), "w") as f:
+            f.write(sampler.collapsed())
+        PROFILES_WRITTEN.inc()
+        with self._lock:
+            for old in self.list()[self.keep:]:
+                try:
+                    os.remove(os.path.join(self.directory, old["name"]))
+                except FileNotFoundError:
+                    pass
+        return name
+
+    def list(self) -> List[Dict]:
+        """Profiles on disk, newest first."""
+        try:
+            names = [n for n in os.listdir(self.directory) if _NAME.match(n)]
+        except FileNotFoundError:
+            return []
+        profiles = []
+        for name in sorted(names, reverse=True):
+            try:
+                size = os.path.getsize(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            profiles.append({"name": name, "bytes": size})
+        return profiles
+
+    def path(self, name: str) -> Optional[str]:
+        if not _NAME.match(name):
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isfile(path) else None
+
+
+class ProfileMiddleware:
+    """ASGI middleware that samples the requests ``store.wanted`` picks."""
+
+    def __init__(self, app, store: ProfileStore):
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith("/debug/"):
+            return await self.app(scope, receive, send)
+        header = dict(scope["headers"]).get(b"x-profile")
+        if not self.store.wanted(header.decode("latin-1") if header is not None else None):
+            return await self.app(scope, receive, send)
+
+        sampler = Sampler()
+        started = time.perf_counter()
+        sampler.start()
+        saved = False
+
+        async def finish():
+            nonlocal saved
+            if not saved:
+                saved = True
+                sampler.stop()
+                await run_in_threadpool(
+                    self.store.save, scope["method"], scope["path"], time.perf_counter() - started, sampler
+                )
+
+        async def send_and_finish(message):
+            if message["type"] == "http.response.start":
+                await finish()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_finish)
+        finally:
+            await finish()
+
+
+profile_store = ProfileStore()
@@ -0,0 +1,67 @@
+"""Rebuild stored hands from their seed and operations and check the result.
+
+The seed reshuffles the deck exactly as the table did, the recorded
+operations are applied in order, and every dealt card and the final
+stacks are compared with what was stored.
+"""
+import random
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from src.models.hand import HandHistory
+from src.services.game import create_state
+from src.services.stats import nets_from_text
+
+
+@dataclass
+class ReplayResult:
+    hand_id: str
+    ok: bool
+    error: Optional[str] = None
+    stacks: List[int] = field(default_factory=list)
+
+
+def replay_hand(hand: HandHistory) -> ReplayResult:
+    if hand.seed is None or not hand.operations:
+        return ReplayResult(hand.id, False, "no seed or operations recorded")
+    try:
+        stacks = _replay(hand)
+    except Exception as e:
+        return ReplayResult(hand.id, False, f"replay failed: {e}")
+
+    expected = nets_from_text(hand.result)
+    nets = [stack - hand.starting_stack for stack in stacks]
+    if nets != expected:
+        return ReplayResult(hand.id, False, f"nets {nets} != stored {expected}", stacks)
+    return ReplayResult(hand.id, True, stacks=stacks)
+
+
+def _replay(hand: HandHistory) -> List[int]:
+    num_players = len(nets_from_text(hand.result))
+    state = create_state(num_players, hand.starting_stack, random.Random(hand.seed))
+
+    for line in hand.operations:
+        parts = line.split()
+        if parts[0] == "d":
+            if parts[1] == "db" and state.can_burn_card():
+                state.burn_card()
+            op = state.deal_hole() if parts[1] == "dh" else state.deal_board()
+            dealt = "".join(repr(card) for card in op.cards)
+            if dealt != parts[-1]:
+                raise Exception(f"{line!r} dealt {dealt}")
+        elif parts[1] == "f":
+            state.fold()
+        elif parts[1] == "cc":
+            state.check_or_call()
+        elif parts[1] == "cbr":
+            state.complete_bet_or_raise_to(int(parts[2]))
+        else:
+            raise Exception(f"Unknown operation {line!r}")
+
+    if state.status:
+        raise Exception("hand did not finish")
+    return list(state.stacks)
+
+
+def replay_batch(hands: List[HandHistory]) -> List[ReplayResult]:
+    return [replay_hand(hand) for hand in hands]
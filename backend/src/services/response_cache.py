@@ -0,0 +1,103 @@
+"""Cached JSON bodies for the hand-history endpoints.
+
+Entries are stored under the current history version. ``bump`` is called
+whenever a hand reaches the database (a finished table once its
+transition is saved when writing inline, the hand writer after each
+flush, and the importer). It moves the
+version on and drops every entry. The ETag is a hash of the body, so a
+client that already has the body gets a 304, even if the entry had to be
+rebuilt after a bump.
+
+Each worker process keeps its own version, and it only sees the hands that
+worker saved. ``RESPONSE_CACHE_TTL`` limits how long a worker can serve a
+list that is missing hands saved by another worker.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from src.services.metrics import metrics
+
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "256"))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+
+CACHE_HITS = metrics.counter("poker_history_cache_hits_total", "Hand-history responses served from the cache")
+CACHE_MISSES = metrics.counter("poker_history_cache_misses_total", "Hand-history responses built from the database")
+NOT_MODIFIED = metrics.counter("poker_history_not_modified_total", "Hand-history requests answered with 304")
+
+
+@dataclass
+class CachedResponse:
+    version: int
+    etag: str
+    body: bytes
+    stored_at: float
+
+
+class ResponseCache:
+    """LRU of response bodies bounded by entry count and total bytes."""
+
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_SIZE,
+        max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+        ttl: float = RESPONSE_CACHE_TTL,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.version = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def bump(self):
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.version != self.version or time.monotonic() - entry.stored_at > self.ttl:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, version: int, body: bytes) -> CachedResponse:
+        """Store ``body`` built at ``version``; it is returned but not kept if the version moved on meanwhile."""
+        digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+        entry = CachedResponse(version, f'"{digest}"', body, time.monotonic())
+        if len(body) > self.max_bytes:
+            return entry
+        with self._lock:
+            if version != self.version:
+                return entry
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = entry
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+        return entry
+
+    def _drop(self, key: str):
+        self._bytes -= len(self._entries.pop(key).body)
+
+    def stats(self) -> dict:
+        return {"version": self.version, "entries": len(self._entries), "bytes": self._bytes}
+
+
+history_cache = ResponseCache()
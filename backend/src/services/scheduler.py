@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Set
+
+from src.services import game
+from src.services.metrics import metrics
+from src.services.tables import registry
+
+TABLE_SCHEDULER = os.getenv("TABLE_SCHEDULER", "1").lower() not in ("0", "false", "no", "off")
+ACTION_TIMEOUT = float(os.getenv("ACTION_TIMEOUT", "30"))
+BOT_WORKERS = int(os.getenv("BOT_WORKERS", "4"))
+TABLE_SWEEP_INTERVAL = float(os.getenv("TABLE_SWEEP_INTERVAL", "60"))
+BOT_RETRY_DELAY = float(os.getenv("BOT_RETRY_DELAY", "0.5"))
+BOT_RETRY_MAX_DELAY = float(os.getenv("BOT_RETRY_MAX_DELAY", "30"))
+
+logger = logging.getLogger(__name__)
+
+ACTION_TIMEOUTS = metrics.counter("poker_action_timeouts_total", "User turns auto-played after the action clock ran out")
+BOT_RUN_FAILURES = metrics.counter("poker_bot_run_failures_total", "Bot runs and auto actions that raised and were retried")
+
+
+class TableScheduler:
+    """Runs bot turns on a bounded worker pool and keeps an action clock per table.
+
+    Lives on the server's event loop. ``table_changed`` may be called from
+    any thread: it stops the table's clock and queues one bot run. A table
+    has at most one run in flight; changes that arrive meanwhile queue one
+    more run when it finishes. When a run leaves the user to act, a clock
+    of ``action_timeout`` seconds is armed. If the log has not moved on when
+    it fires, the user checks when that is free and folds otherwise, and
+    the bots carry on.
+
+    A run or auto action that raises (a pokerkit error, a version conflict
+    in the state store) is queued again after ``retry_delay`` seconds,
+    doubling on each failure in a row up to ``retry_max_delay``. A user
+    action in the meantime cancels the wait and runs at once. Retries end
+    when a run succeeds or the table is evicted.
+    """
+
+    def __init__(self, workers: int = BOT_WORKERS, action_timeout: float = ACTION_TIMEOUT,
+                 sweep_interval: float = TABLE_SWEEP_INTERVAL, retry_delay: float = BOT_RETRY_DELAY,
+                 retry_max_delay: float = BOT_RETRY_MAX_DELAY):
+        self.workers = workers
+        self.action_timeout = action_timeout
+        self.sweep_interval = sweep_interval
+        self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._running: Set[str] = set()
+        self._dirty: Set[str] = set()
+        # An action clock, or the wait before retrying a failed run.
+        self._clocks: Dict[str, asyncio.TimerHandle] = {}
+        self._failures: Dict[str, int] = {}
+        self._sweeper: Optional[asyncio.TimerHandle] = None
+
+    def start(self):
+        """Start on the running event loop and take over bot turns from ``apply_action``."""
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bots")
+        if self.sweep_interval > 0:
+            self._sweeper = self._loop.call_later(self.sweep_interval, self._sweep)
+        game.bot_scheduler = self
+        logger.info("Table scheduler started with %s workers, %ss action clock", self.workers, self.action_timeout)
+
+    def stop(self):
+        if self._loop is None:
+            return
+        if game.bot_scheduler is self:
+            game.bot_scheduler = None
+        for clock in self._clocks.values():
+            clock.cancel()
+        self._clocks.clear()
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        self._pool.shutdown(wait=True)
+        self._loop = self._pool = self._sweeper = None
+        self._running.clear()
+        self._dirty.clear()
+        self._failures.clear()
+
+    def table_changed(self, game_id: str):
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._queue, game_id)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "action_timeout": self.action_timeout,
+            "running": len(self._running),
+            "clocks": len(self._clocks),
+            "retrying": len(self._failures),
+        }
+
+    # Everything below runs on the event loop thread.
+    def _queue(self, game_id: str):
+        clock = self._clocks.pop(game_id, None)
+        if clock is not None:
+            clock.cancel()
+        if self._pool is None:
+            return
+        if game_id in self._running:
+            self._dirty.add(game_id)
+            return
+        self._running.add(game_id)
+        future = self._loop.run_in_executor(self._pool, game.advance_table, game_id)
+        future.add_done_callback(lambda f: self._advanced(game_id, f))
+
+    def _advanced(self, game_id: str, future: asyncio.Future):
+        self._running.discard(game_id)
+        if game_id in self._dirty:
+            self._dirty.discard(game_id)
+            self._queue(game_id)
+            return
+        if future.cancelled() or self._pool is None:
+            return
+        if future.exception() is not None:
+            logger.error("Bot run failed: %s", future.exception(), extra={"game_id": game_id})
+            self._retry(game_id)
+            return
+        self._failures.pop(game_id, None)
+        seq = future.result()
+        if seq is not None and self.action_timeout > 0:
+            self._clocks[game_id] = self._loop.call_later(self.action_timeout, self._expired, game_id, seq)
+
+    def _expired(self, game_id: str, seq: int):
+        self._clocks.pop(game_id, None)
+        if self._pool is None:
+            return
+        future = self._loop.run_in_executor(self._pool, game.auto_act, game_id, seq)
+        future.add_done_callback(lambda f: self._timed_out(game_id, f))
+
+    def _timed_out(self, game_id: str, future: asyncio.Future):
+        if future.cancelled() or self._pool is None:
+            return
+        if future.exception() is not None:
+            logger.error("Auto action failed: %s", future.exception(), extra={"game_id": game_id})
+            self._retry(game_id)
+            return
+        if future.result():
+            ACTION_TIMEOUTS.inc()
+            self._queue(game_id)
+
+    def _retry(self, game_id: str):
+        BOT_RUN_FAILURES.inc()
+        failures = self._failures.get(game_id, 0) + 1
+        self._failures[game_id] = failures
+        delay = min(self.retry_max_delay, self.retry_delay * 2 ** (failures - 1))
+        self._clocks[game_id] = self._loop.call_later(delay, self._queue, game_id)
+
+    def _sweep(self):
+        if self._pool is None:
+            return
+        self._loop.run_in_executor(self._pool, registry.evict_idle)
+        self._sweeper = self._loop.call_later(self.sweep_interval, self._sweep)
+
+
+table_scheduler = TableScheduler()
+metrics.gauge("poker_bot_runs_in_flight", "Tables with a bot run on the worker pool", lambda: table_scheduler.stats()["running"])
@@ -0,0 +1,133 @@
+"""Headless bot-vs-bot simulation.
+
+Plays complete hands with every seat driven by the bot policy, without the
+HTTP layer or the table registry, and fans them out over a process pool:
+
+    python -m src.services.simulator --hands 100000 --output hands.ndjson
+    python -m src.services.simulator --hands 100000 --db
+"""
+import argparse
+import random
+import time
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from src.models.hand import HandHistory
+from src.services.game import (
+    actor_indices,
+    bots_act_until_user_turn,
+    build_hand_history,
+    deal_hand,
+    deal_next_street,
+    is_hand_finished,
+)
+from src.services.hand_export import to_ndjson
+
+
+@dataclass
+class SimulationResult:
+    hands: int
+    seconds: float
+
+    @property
+    def hands_per_sec(self) -> float:
+        return self.hands / self.seconds if self.seconds else 0.0
+
+
+def play_hand(
+    num_players: int = 6, dealer_index: int = 0, stack: Optional[int] = None, seed: Optional[int] = None
+) -> HandHistory:
+    gs = deal_hand(num_players, dealer_index, stack, seed)
+    while not is_hand_finished(gs):
+        bots_act_until_user_turn(gs, user_index=None)
+        if actor_indices(gs.poker_state):
+            raise Exception("Bot has no valid action")
+        deal_next_street(gs)
+    gs.status = "FINISHED"
+    return build_hand_history(gs)
+
+
+def _play_chunk(count: int, num_players: int, stack: Optional[int], seed: Optional[int]) -> List[HandHistory]:
+    rng = random.Random(seed) if seed is not None else None
+    return [
+        play_hand(num_players, i % num_players, stack, rng.getrandbits(63) if rng else None)
+        for i in range(count)
+    ]
+
+
+def _chunks(total: int, size: int) -> Iterable[int]:
+    while total > 0:
+        yield min(size, total)
+        total -= size
+
+
+def simulate(
+    total_hands: int,
+    num_players: int = 6,
+    stack: Optional[int] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 500,
+    seed: Optional[int] = None,
+    sink: Optional[Callable[[List[HandHistory]], None]] = None,
+) -> SimulationResult:
+    """Play ``total_hands`` across a process pool, passing each finished chunk to ``sink``."""
+    started = time.perf_counter()
+    played = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_play_chunk, count, num_players, stack, None if seed is None else seed + n)
+            for n, count in enumerate(_chunks(total_hands, chunk_size))
+        ]
+        for future in as_completed(futures):
+            hands = future.result()
+            played += len(hands)
+            if sink is not None:
+                sink(hands)
+    return SimulationResult(hands=played, seconds=time.perf_counter() - started)
+
+
+@contextmanager
+def file_sink(path: str) -> Iterator[Callable[[List[HandHistory]], None]]:
+    """A sink appending hands as NDJSON to ``path``; the file is closed on exit."""
+    with open(path, "a", encoding="utf-8") as out:
+
+        def write(hands: List[HandHistory]):
+            out.writelines(to_ndjson(hand) for hand in hands)
+            out.flush()
+
+        yield write
+
+
+def repository_sink() -> Callable[[List[HandHistory]], None]:
+    from src.repositories.hand_repo import HandRepository
+
+    return HandRepository.save_hands
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run bot-vs-bot hands without the HTTP layer")
+    parser.add_argument("--hands", type=int, default=10000)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--stack", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=None)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--output", help="append hands as NDJSON to this file")
+    target.add_argument("--db", action="store_true", help="bulk insert hands through HandRepository")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        opened = file_sink(args.output)
+    else:
+        opened = nullcontext(repository_sink() if args.db else None)
+
+    with opened as sink:
+        result = simulate(args.hands, args.players, args.stack, args.workers, args.chunk, args.seed, sink)
+    print(f"{result.hands} hands in {result.seconds:.2f}s ({result.hands_per_sec:.0f} hands/sec)")
+
+
+if __name__ == "__main__":
+    main()
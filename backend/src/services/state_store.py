@@ -0,0 +1,181 @@
+"""Shared storage for live tables, so several workers can serve one hand.
+
+With ``STATE_STORE=memory`` (the default) tables only live in this
+process's ``TableRegistry`` and nothing is serialized. With
+``STATE_STORE=sqlite`` every transition writes the pickled, zlib-compressed
+``GameState`` to a SQLite file that all workers on the host share, and the
+next request for the table loads it again if another worker changed it.
+
+Each saved state carries a version. A save names the version it started
+from and fails with ``VersionConflict`` if someone else saved first.
+"""
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+
+from src.models.game_state import GameState
+
+STATE_STORE = os.getenv("STATE_STORE", "memory").lower()
+STATE_STORE_PATH = os.getenv("STATE_STORE_PATH", "game_state.sqlite3")
+STATE_COMPRESSION_LEVEL = int(os.getenv("STATE_COMPRESSION_LEVEL", "1"))
+
+
+class VersionConflict(Exception):
+    pass
+
+
+def serialize(gs: GameState, level: int = STATE_COMPRESSION_LEVEL) -> bytes:
+    return zlib.compress(pickle.dumps(gs, protocol=pickle.HIGHEST_PROTOCOL), level)
+
+
+def deserialize(blob: bytes) -> GameState:
+    return pickle.loads(zlib.decompress(blob))
+
+
+class StateStore(ABC):
+    """Interface for table storage; ``create`` and ``save`` return the new version."""
+
+    @abstractmethod
+    def create(self, gs: GameState) -> int:
+        ...
+
+    @abstractmethod
+    def version(self, game_id: str) -> Optional[int]:
+        ...
+
+    @abstractmethod
+    def load(self, game_id: str) -> Optional[Tuple[GameState, int]]:
+        ...
+
+    @abstractmethod
+    def save(self, gs: GameState, expected_version: int) -> int:
+        ...
+
+    @abstractmethod
+    def delete(self, game_id: str):
+        ...
+
+    @abstractmethod
+    def purge(self, idle_seconds: float) -> int:
+        ...
+
+
+class MemoryStateStore(StateStore):
+    """Serialized tables in a dict: the SQLite store's behaviour without the file, for tests and benchmarks."""
+
+    def __init__(self):
+        self._rows: Dict[str, Tuple[int, bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def create(self, gs: GameState) -> int:
+        blob = serialize(gs)
+        with self._lock:
+            if gs.id in self._rows:
+                raise VersionConflict(f"Table {gs.id} already exists")
+            self._rows[gs.id] = (1, blob, time.time())
+        return 1
+
+    def version(self, game_id: str) -> Optional[int]:
+        row = self._rows.get(game_id)
+        return row[0] if row else None
+
+    def load(self, game_id: str) -> Optional[Tuple[GameState, int]]:
+        row = self._rows.get(game_id)
+        return (deserialize(row[1]), row[0]) if row else None
+
+    def save(self, gs: GameState, expected_version: int) -> int:
+        blob = serialize(gs)
+        with self._lock:
+            row = self._rows.get(gs.id)
+            if row is None or row[0] != expected_version:
+                raise VersionConflict(f"Table {gs.id} was changed by another request")
+            self._rows[gs.id] = (expected_version + 1, blob, time.time())
+        return expected_version + 1
+
+    def delete(self, game_id: str):
+        with self._lock:
+            self._rows.pop(game_id, None)
+
+    def purge(self, idle_seconds: float) -> int:
+        cutoff = time.time() - idle_seconds
+        with self._lock:
+            stale = [game_id for game_id, row in self._rows.items() if row[2] < cutoff]
+            for game_id in stale:
+                del self._rows[game_id]
+        return len(stale)
+
+
+class SQLiteStateStore(StateStore):
+    """Tables in a WAL-mode SQLite file shared by every worker on the host."""
+
+    def __init__(self, path: str = STATE_STORE_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS game_states ("
+                "game_id TEXT PRIMARY KEY, version INTEGER NOT NULL, state BLOB NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def create(self, gs: GameState) -> int:
+        blob = serialize(gs)
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT INTO game_states (game_id, version, state, updated_at) VALUES (?, 1, ?, ?)",
+                    (gs.id, blob, time.time())
+                )
+        except sqlite3.IntegrityError:
+            raise VersionConflict(f"Table {gs.id} already exists")
+        return 1
+
+    def version(self, game_id: str) -> Optional[int]:
+        with self._lock:
+            row = self._conn.execute("SELECT version FROM game_states WHERE game_id = ?", (game_id,)).fetchone()
+        return row[0] if row else None
+
+    def load(self, game_id: str) -> Optional[Tuple[GameState, int]]:
+        with self._lock:
+            row = self._conn.execute("SELECT state, version FROM game_states WHERE game_id = ?", (game_id,)).fetchone()
+        return (deserialize(row[0]), row[1]) if row else None
+
+    def save(self, gs: GameState, expected_version: int) -> int:
+        blob = serialize(gs)
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE game_states SET version = version + 1, state = ?, updated_at = ? "
+                "WHERE game_id = ? AND version = ?",
+                (blob, time.time(), gs.id, expected_version)
+            )
+        if cur.rowcount != 1:
+            raise VersionConflict(f"Table {gs.id} was changed by another request")
+        return expected_version + 1
+
+    def delete(self, game_id: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM game_states WHERE game_id = ?", (game_id,))
+
+    def purge(self, idle_seconds: float) -> int:
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM game_states WHERE updated_at < ?", (time.time() - idle_seconds,))
+        return cur.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_store(name: str = STATE_STORE) -> Optional[StateStore]:
+    if name == "memory":
+        return None
+    if name == "sqlite":
+        return SQLiteStateStore()
+    raise ValueError(f"Unknown state store: {name}")
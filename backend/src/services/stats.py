@@ -0,0 +1,234 @@
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pokerkit import BoardDealing, CheckingOrCalling, CompletionBettingOrRaisingTo, Folding
+
+from src.models.hand import HandHistory
+from src.repositories.hand_repo import STATS_COUNTERS, HandRepository
+from src.services.hand_record import decode_record
+
+STATS_FLUSH_INTERVAL = float(os.getenv("STATS_FLUSH_INTERVAL", "5"))
+STATS_CACHE_TTL = float(os.getenv("STATS_CACHE_TTL", "2"))
+
+logger = logging.getLogger(__name__)
+
+# (seat, street, action) with street 0 = preflop and action one of
+# "fold", "check", "call" or "raise" (opening bets included).
+SeatAction = Tuple[int, int, str]
+
+
+@dataclass
+class PlayerStats:
+    seat: int
+    hands: int = 0
+    net: int = 0
+    vpip: int = 0
+    pfr: int = 0
+    faced_bet: int = 0
+    folded_to_bet: int = 0
+    showdowns: int = 0
+    showdowns_won: int = 0
+
+    COUNTERS = STATS_COUNTERS
+
+    def add(self, other: "PlayerStats"):
+        for name in self.COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        hands = self.hands or 1
+        data["vpip_rate"] = self.vpip / hands
+        data["pfr_rate"] = self.pfr / hands
+        data["fold_to_bet_rate"] = self.folded_to_bet / self.faced_bet if self.faced_bet else 0.0
+        data["showdown_rate"] = self.showdowns / hands
+        data["showdown_win_rate"] = self.showdowns_won / self.showdowns if self.showdowns else 0.0
+        return data
+
+
+def compute_hand_stats(actions: Iterable[SeatAction], nets: Sequence[int]) -> List[PlayerStats]:
+    """Per-seat counters for one hand; ``nets[i]`` is seat ``i + 1``'s result.
+
+    Fold-to-bet only counts postflop decisions made after someone bet on the
+    same street. A seat goes to showdown when it never folded and at least
+    one other seat also stayed in.
+    """
+    stats = [PlayerStats(seat=i + 1, hands=1, net=net) for i, net in enumerate(nets)]
+    folded = set()
+    bet_streets = set()
+    for seat, street, action in actions:
+        player = stats[seat - 1]
+        if street == 0:
+            if action in ("call", "raise"):
+                player.vpip = 1
+            if action == "raise":
+                player.pfr = 1
+        elif street in bet_streets:
+            player.faced_bet += 1
+            if action == "fold":
+                player.folded_to_bet += 1
+        if action == "raise":
+            bet_streets.add(street)
+        if action == "fold":
+            folded.add(seat)
+
+    remaining = [p for p in stats if p.seat not in folded]
+    if len(remaining) > 1:
+        for player in remaining:
+            player.showdowns = 1
+            player.showdowns_won = 1 if player.net > 0 else 0
+    return stats
+
+
+def actions_from_operations(operations) -> List[SeatAction]:
+    actions = []
+    street = 0
+    for op in operations:
+        if isinstance(op, BoardDealing):
+            street += 1
+        elif isinstance(op, Folding):
+            actions.append((op.player_index + 1, street, "fold"))
+        elif isinstance(op, CheckingOrCalling):
+            actions.append((op.player_index + 1, street, "call" if op.amount else "check"))
+        elif isinstance(op, CompletionBettingOrRaisingTo):
+            actions.append((op.player_index + 1, street, "raise"))
+    return actions
+
+
+_ACTION_RE = re.compile(
+    r"Player (\d+) (folds|checks|calls|bets|raises|goes all-in)"
+    r"|((?:\[[^\]]*\])+|\b(?:[2-9TJQKA][cdhs]){3,5}\b)"
+)
+_NET_RE = re.compile(r"Player (\d+): ([+-]?\d+)")
+_VERBS = {"folds": "fold", "checks": "check", "calls": "call", "bets": "raise", "raises": "raise", "goes all-in": "raise"}
+
+
+def actions_from_text(actions: str) -> List[SeatAction]:
+    """Recover seat actions from a stored ``actions`` string (for backfills)."""
+    result = []
+    street = 0
+    for match in _ACTION_RE.finditer(actions):
+        if match.group(3):
+            street += 1
+        else:
+            result.append((int(match.group(1)), street, _VERBS[match.group(2)]))
+    return result
+
+
+def nets_from_text(result: str) -> List[int]:
+    return [int(net) for _, net in sorted(_NET_RE.findall(result), key=lambda m: int(m[0]))]
+
+
+def stats_from_hand(hand: HandHistory) -> List[PlayerStats]:
+    """Counters for a stored hand, read from its record's log or parsed from its text."""
+    packed = decode_record(hand.record) if hand.record is not None else None
+    if packed is not None and packed.log is not None:
+        return compute_hand_stats(packed.log.seat_actions(), [net for _, net in packed.seats])
+    return compute_hand_stats(actions_from_text(hand.actions), nets_from_text(hand.result))
+
+
+def totals_from_hands(hands: Iterable[HandHistory]) -> Dict[int, PlayerStats]:
+    totals: Dict[int, PlayerStats] = {}
+    for hand in hands:
+        for player in stats_from_hand(hand):
+            totals.setdefault(player.seat, PlayerStats(seat=player.seat)).add(player)
+    return totals
+
+
+class StatsAggregator:
+    """Per-seat totals read from the ``player_stats`` rollup of the hand store.
+
+    ``record`` adds one hand to the cached totals and to a pending delta;
+    ``flush`` adds the pending deltas to the rollup as increments, so
+    several processes can share it. Reads serve the cached totals and
+    reload them from the rollup once they are ``cache_ttl`` seconds old,
+    so ``/stats`` on one worker picks up the hands other workers flushed
+    within ``flush_interval + cache_ttl``.
+    """
+
+    def __init__(self, flush_interval: float = STATS_FLUSH_INTERVAL, cache_ttl: float = STATS_CACHE_TTL):
+        self.flush_interval = flush_interval
+        self.cache_ttl = cache_ttl
+        self._totals: Dict[int, PlayerStats] = {}
+        self._pending: Dict[int, PlayerStats] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        # Held across a flush or a load, so a load never sees a flush half done.
+        self._store_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, hand_stats: Iterable[PlayerStats]):
+        with self._lock:
+            for player in hand_stats:
+                self._totals.setdefault(player.seat, PlayerStats(seat=player.seat)).add(player)
+                self._pending.setdefault(player.seat, PlayerStats(seat=player.seat)).add(player)
+
+    def get(self, seat: int) -> Optional[PlayerStats]:
+        self._refresh()
+        return self._totals.get(seat)
+
+    def all(self) -> List[PlayerStats]:
+        self._refresh()
+        with self._lock:
+            return [self._totals[seat] for seat in sorted(self._totals)]
+
+    def _refresh(self):
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.cache_ttl:
+            return
+        try:
+            self.load()
+        except Exception as e:
+            logger.warning("Failed to reload player stats: %s", e)
+
+    def load(self):
+        with self._store_lock:
+            rows = HandRepository.load_stats()
+            with self._lock:
+                self._totals = {row[0]: PlayerStats(*row) for row in rows}
+                for seat, pending in self._pending.items():
+                    self._totals.setdefault(seat, PlayerStats(seat=seat)).add(pending)
+                self._loaded_at = time.monotonic()
+
+    def flush(self):
+        with self._store_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            try:
+                HandRepository.add_stats([(p.seat, *(getattr(p, c) for c in PlayerStats.COUNTERS)) for p in pending.values()])
+            except Exception:
+                with self._lock:
+                    for seat, delta in pending.items():
+                        self._pending.setdefault(seat, PlayerStats(seat=seat)).add(delta)
+                raise
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="stats-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while not self._stopping.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning("Failed to flush player stats: %s", e)
+
+
+stats_aggregator = StatsAggregator()
@@ -0,0 +1,173 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+from src.models.game_state import GameState
+from src.services.metrics import metrics
+from src.services.state_store import StateStore, VersionConflict, create_store
+
+MAX_TABLES = int(os.getenv("MAX_TABLES", "5000"))
+TABLE_IDLE_TTL = float(os.getenv("TABLE_IDLE_TTL", "1800"))
+
+
+@dataclass
+class Table:
+    game: Optional[GameState]
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    last_used: float = field(default_factory=time.monotonic)
+    version: int = -1  # store version of ``game``; -1 means reload before use
+
+
+class TableRegistry:
+    """Live tables keyed by game_id.
+
+    The registry lock only guards the dict itself and is held for O(1) work.
+    Game transitions run under the table's own lock, so requests for
+    different tables never wait on each other while requests for the same
+    table are serialized. Idle tables are evicted least recently used first,
+    either when they pass the TTL or when the registry is over its cap.
+
+    With a ``store`` the registry is only a cache: each transition first
+    reloads the table if another worker saved a newer version, then saves
+    it back, raising ``VersionConflict`` if someone else saved in between.
+    The transition's ``after_save`` effects run only once it is saved, so a
+    transition that loses the race leaves nothing behind.
+    """
+
+    def __init__(self, max_tables: int = MAX_TABLES, idle_ttl: float = TABLE_IDLE_TTL, store: Optional[StateStore] = None):
+        self.max_tables = max_tables
+        self.idle_ttl = idle_ttl
+        self.store = store
+        self._tables: "OrderedDict[str, Table]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._tables
+
+    def add(self, gs: GameState) -> None:
+        with self._lock:
+            if gs.id in self._tables:
+                raise Exception(f"A game with id {gs.id} is already in progress")
+            self._evict_locked(reserve=1)
+            table = self._tables[gs.id] = Table(game=gs)
+        if self.store is not None:
+            table.version = self.store.create(gs)
+
+    def get(self, game_id: str) -> Optional[GameState]:
+        """Return the game without taking its lock (read-only peeks)."""
+        table = self._tables.get(game_id)
+        if self.store is None:
+            return table.game if table else None
+        if table is not None and table.version == self.store.version(game_id):
+            return table.game
+        loaded = self.store.load(game_id)
+        return loaded[0] if loaded else None
+
+    def remove(self, game_id: str) -> None:
+        with self._lock:
+            self._tables.pop(game_id, None)
+        if self.store is not None:
+            self.store.delete(game_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+
+    def games(self) -> List[GameState]:
+        with self._lock:
+            return [table.game for table in self._tables.values() if table.game is not None]
+
+    def _use(self, game_id: str) -> Table:
+        with self._lock:
+            table = self._tables.get(game_id)
+            if table is None:
+                if self.store is None:
+                    raise KeyError("Game not found")
+                self._evict_locked(reserve=1)
+                table = self._tables[game_id] = Table(game=None)
+            table.last_used = time.monotonic()
+            self._tables.move_to_end(game_id)
+        return table
+
+    @contextmanager
+    def read(self, game_id: str) -> Iterator[GameState]:
+        """Hold the table's lock to read a consistent view; nothing is saved.
+
+        The caller must copy what it needs before the block ends and must
+        not change the game.
+        """
+        table = self._use(game_id)
+        with table.lock:
+            if self.store is not None:
+                self._refresh(game_id, table)
+            yield table.game
+
+    @contextmanager
+    def acquire(self, game_id: str) -> Iterator[GameState]:
+        """Hold the table's lock for the duration of one transition."""
+        table = self._use(game_id)
+        with table.lock:
+            if self.store is not None:
+                self._refresh(game_id, table)
+            try:
+                yield table.game
+            except BaseException:
+                table.version = -1  # the cached copy may be half-updated
+                if table.game is not None:
+                    table.game.after_save.clear()
+                raise
+            if self.store is not None:
+                try:
+                    table.version = self.store.save(table.game, table.version)
+                except VersionConflict:
+                    table.version = -1
+                    table.game.after_save.clear()
+                    raise
+            table.last_used = time.monotonic()
+            table.game.run_after_save()
+
+    def _refresh(self, game_id: str, table: Table):
+        current = self.store.version(game_id)
+        if current is not None and current != table.version:
+            loaded = self.store.load(game_id)
+            if loaded is None:
+                current = None
+            else:
+                table.game, table.version = loaded
+        if current is None:
+            with self._lock:
+                self._tables.pop(game_id, None)
+            raise KeyError("Game not found")
+
+    def evict_idle(self) -> int:
+        if self.store is not None:
+            self.store.purge(self.idle_ttl)
+        with self._lock:
+            return self._evict_locked()
+
+    def _evict_locked(self, reserve: int = 0) -> int:
+        now = time.monotonic()
+        evicted = 0
+        # OrderedDict is kept in LRU order, so the oldest tables come first.
+        for game_id in list(self._tables):
+            table = self._tables[game_id]
+            over_cap = len(self._tables) + reserve > self.max_tables
+            expired = now - table.last_used > self.idle_ttl
+            if not over_cap and not expired:
+                break
+            if table.lock.locked():
+                continue
+            del self._tables[game_id]
+            evicted += 1
+        return evicted
+
+
+registry = TableRegistry(store=create_store())
+metrics.gauge("poker_live_tables", "Tables currently held in memory", lambda: len(registry))
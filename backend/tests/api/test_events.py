@@ -0,0 +1,73 @@
+from fastapi.testclient import TestClient
+from src.main import app
+
+client = TestClient(app)
+
+def play_out(game_id):
+    for _ in range(10):
+        if client.post("/hands/action", json={"game_id": game_id, "action": "f"}).json()["status"] == "FINISHED":
+            return
+    raise AssertionError("hand did not finish")
+
+def test_action_since_returns_only_new_entries():
+    start = client.post("/hands/start", json={"num_players": 6, "dealer_index": 0}).json()
+    seen = len(start["log"])
+
+    data = client.post("/hands/action", json={"game_id": start["game_id"], "action": "f", "since": seen}).json()
+    assert "Player 1 folds" in data["actions"]
+    assert not any(" is dealt " in entry for entry in data["actions"])
+    assert data["seq"] == seen + len(data["actions"])
+
+def test_action_rejects_a_negative_since():
+    game_id = client.post("/hands/start", json={"num_players": 6, "dealer_index": 0}).json()["game_id"]
+
+    response = client.post("/hands/action", json={"game_id": game_id, "action": "f", "since": -1})
+    assert response.status_code == 422
+
+def test_event_stream_resumes_after_since():
+    game_id = client.post("/hands/start", json={"num_players": 6, "dealer_index": 0}).json()["game_id"]
+    play_out(game_id)
+
+    with client.stream("GET", f"/tables/{game_id}/events", params={"since": 3}) as response:
+        body = "".join(response.iter_text())
+
+    frames = [frame for frame in body.split("\n\n") if frame]
+    ids = [int(line[4:]) for frame in frames for line in frame.splitlines() if line.startswith("id: ")]
+    assert ids[0] == 4
+    assert ids == list(range(4, 4 + len(ids)))
+    assert frames[-1].startswith("event: finished")
+
+def test_event_stream_unknown_table():
+    assert client.get("/tables/missing/events").status_code == 404
+
+def test_event_stream_sees_moves_saved_by_another_worker(monkeypatch):
+    import threading
+    from src.models.action_log import ActionCode
+    from src.routers import tables as tables_router
+    from src.services.game import deal_hand
+    from src.services.state_store import MemoryStateStore
+    from src.services.tables import TableRegistry, registry
+
+    store = MemoryStateStore()
+    monkeypatch.setattr(registry, "store", store)
+    monkeypatch.setattr(tables_router, "EVENT_STREAM_STORE_POLL", 0.05)
+    gs = deal_hand(num_players=6)
+    registry.add(gs)
+    other_worker = TableRegistry(store=store)
+
+    def fold_elsewhere():
+        with other_worker.acquire(gs.id) as theirs:
+            theirs.actions_log.add(ActionCode.FOLD, 1)
+            theirs.status = "FINISHED"
+
+    timer = threading.Timer(0.3, fold_elsewhere)
+    timer.start()
+    try:
+        with client.stream("GET", f"/tables/{gs.id}/events", params={"since": len(gs.actions_log)}) as response:
+            body = "".join(response.iter_text())
+    finally:
+        timer.join()
+        registry.clear()
+
+    assert "Player 1 folds" in body
+    assert body.rstrip().split("\n\n")[-1].startswith("event: finished")
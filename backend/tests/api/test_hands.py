@@ -10,4 +10,81 @@ def test_start_game():
     data = response.json()
     assert "game_id" in data
     assert "log" in data
-    assert isinstance(data["log"], list)
\ No newline at end of file
+    assert isinstance(data["log"], list)
+
+def test_start_rejects_an_unsupported_table_size():
+    assert client.post("/hands/start", json={"num_players": 30}).status_code == 422
+    assert client.post("/hands/start", json={"num_players": 1}).status_code == 422
+
+def test_equity_waits_for_a_running_transition():
+    import threading
+    from src.services.tables import registry
+
+    game_id = client.post("/hands/start", json={"num_players": 6, "dealer_index": 0}).json()["game_id"]
+    responses = []
+    request = threading.Thread(target=lambda: responses.append(client.post("/hands/equity", json={"game_id": game_id})))
+    with registry.acquire(game_id):
+        request.start()
+        request.join(0.2)
+        assert request.is_alive()
+    request.join(10)
+
+    assert responses[0].status_code == 200
+    assert responses[0].json()["opponents"] == 5
+    assert client.post("/hands/equity", json={"game_id": "missing"}).status_code == 404
+
+def test_history_pages_with_a_cursor(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+    from src.models.hand import HandHistory
+    from src.repositories.async_hand_repo import AsyncHandRepository
+
+    now = datetime.now(timezone.utc)
+    stored = [
+        HandHistory(id=f"h{i}", mainInfo="", dealt="", actions="", result="", created_at=now - timedelta(seconds=i))
+        for i in range(5)
+    ]
+
+    async def list_page(limit, before=None):
+        rows = [h for h in stored if before is None or (h.created_at, h.id) < before]
+        return rows[:limit]
+
+    monkeypatch.setattr(AsyncHandRepository, "list_page", staticmethod(list_page))
+
+    first = client.get("/hands/", params={"limit": 3}).json()
+    assert [h.splitlines()[0] for h in first["hands"]] == ["Hand #h0", "Hand #h1", "Hand #h2"]
+
+    second = client.get("/hands/", params={"limit": 3, "cursor": first["next_cursor"]}).json()
+    assert [h.splitlines()[0] for h in second["hands"]] == ["Hand #h3", "Hand #h4"]
+    assert second["next_cursor"] is None
+
+def test_unchanged_history_is_not_modified(monkeypatch):
+    from datetime import datetime, timezone
+    from src.models.hand import HandHistory
+    from src.repositories.async_hand_repo import AsyncHandRepository
+    from src.services.response_cache import history_cache
+
+    calls = []
+    stored = [HandHistory(id="h0", mainInfo="", dealt="", actions="", result="", created_at=datetime.now(timezone.utc))]
+
+    async def list_page(limit, before=None):
+        calls.append(limit)
+        return stored[:limit]
+
+    monkeypatch.setattr(AsyncHandRepository, "list_page", staticmethod(list_page))
+    history_cache.bump()
+
+    first = client.get("/hands/", params={"limit": 2})
+    etag = first.headers["etag"]
+    again = client.get("/hands/", params={"limit": 2}, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert len(calls) == 1
+
+    history_cache.bump()
+    assert client.get("/hands/", params={"limit": 2}, headers={"If-None-Match": etag}).status_code == 304
+    assert len(calls) == 2
+
+    stored.insert(0, HandHistory(id="h1", mainInfo="", dealt="", actions="", result="", created_at=datetime.now(timezone.utc)))
+    history_cache.bump()
+    changed = client.get("/hands/", params={"limit": 2}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
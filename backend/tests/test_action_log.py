@@ -0,0 +1,21 @@
+from src.models.action_log import ActionCode, ActionLog
+
+def test_renders_lazily_and_tracks_streets():
+    log = ActionLog()
+    log.add(ActionCode.DEALT, 1, cards=("9h", "Kh"))
+    log.add(ActionCode.RAISE, 3, 120)
+    log.add(ActionCode.CALL, 1, 80)
+    log.add(ActionCode.BOARD, cards=("4c", "2s", "2c"))
+    log.add(ActionCode.BET_ALL_IN, 1, 500)
+    log.add(ActionCode.FOLD, 3)
+
+    assert log[0] == "Player 1 is dealt NINE OF HEARTS (9h), KING OF HEARTS (Kh)"
+    assert log.render(1) == [
+        "Player 3 raises to 120 chips",
+        "Player 1 calls 80 chips",
+        "4c2s2c",
+        "Player 1 bets all-in for 500 chips",
+        "Player 3 folds",
+    ]
+    assert log.seat_actions() == [(3, 0, "raise"), (1, 0, "call"), (1, 1, "raise"), (3, 1, "fold")]
+    assert log.events[-1].to_dict() == {"code": "fold", "seat": 3, "amount": 0, "street": 1, "cards": []}
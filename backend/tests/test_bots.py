@@ -0,0 +1,36 @@
+from src.services.bots import BotDecision, EquityPolicy
+from src.services.game import apply_bot_decision, deal_hand
+from src.services.preflop import hand_classes, load_table, preflop_equity
+
+
+def test_preflop_table_covers_every_class():
+    table = load_table()
+    assert len(hand_classes()) == 169
+    assert set(table) == set(hand_classes())
+    assert preflop_equity(["As", "Ah"], 1) > preflop_equity(["7c", "2d"], 1)
+
+
+def test_equity_policy_folds_trash_to_a_big_raise():
+    gs = deal_hand(num_players=6)
+    gs.poker_state.complete_bet_or_raise_to(2000)  # Player 3 opens big
+    gs.hole_cards[4] = "7h, 2s"
+
+    decision = EquityPolicy(bluff_rate=0).decide(gs, 3)
+    assert decision == BotDecision("fold")
+
+
+def test_illegal_raise_falls_back_to_a_legal_amount():
+    gs = deal_hand(num_players=6)
+    assert apply_bot_decision(gs, 2, BotDecision("raise", 1))
+    assert gs.actions_log[-1] == "Player 3 raises to 80 chips"
+
+
+def test_a_seeded_table_replays_the_same_bot_lines(monkeypatch):
+    from src.services import game
+    from src.services.simulator import play_hand
+
+    # A budget far below one batch would cut sampling short if the clock counted.
+    monkeypatch.setattr(game, "bot_policy", EquityPolicy(time_budget_ms=1e-6))
+    first = [play_hand(6, 0, seed=seed).actions for seed in range(8)]
+    monkeypatch.setattr(game, "bot_policy", EquityPolicy(time_budget_ms=1e-6))
+    assert [play_hand(6, 0, seed=seed).actions for seed in range(8)] == first
@@ -0,0 +1,16 @@
+import pytest
+from src.services.cards import canonical_hole, hand_class, parse_cards
+
+
+def test_parse_cards_accepts_log_and_board_formats():
+    assert parse_cards("Ad, 6s") == ["Ad", "6s"]
+    assert parse_cards("Js7d3s") == ["Js", "7d", "3s"]
+    with pytest.raises(ValueError):
+        parse_cards("Xx")
+
+
+def test_hole_cards_are_canonicalized_into_classes():
+    assert canonical_hole(["6s", "Ad"]) == "Ad6s"
+    assert hand_class(["6s", "Ad"]) == "A6o"
+    assert hand_class(["Kh", "Ah"]) == "AKs"
+    assert hand_class(["9c", "9d"]) == "99"
@@ -0,0 +1,36 @@
+import numpy as np
+from src.services.equity import estimate_equity
+from src.services.evaluator import cards_to_ints, category, evaluate, evaluate_batch
+
+
+def score(cards: str) -> int:
+    return evaluate(cards_to_ints(cards.split()))
+
+
+def test_hand_categories_are_ordered():
+    hands = [
+        "2c 3d 5h 7s 9c Jd Kh",  # high card
+        "2c 2d 5h 7s 9c Jd Kh",  # pair
+        "2c 2d 5h 5s 9c Jd Kh",  # two pair
+        "2c 2d 2h 7s 9c Jd Kh",  # trips
+        "Ac 2d 3h 4s 5c Jd Kh",  # wheel
+        "2h 4h 6h 8h Th Jd Kc",  # flush
+        "2c 2d 2h 5s 5c Jd Kh",  # full house
+        "2c 2d 2h 2s 9c Jd Kh",  # quads
+        "9h Th Jh Qh Kh 2c 3d",  # straight flush
+    ]
+    scores = [score(h) for h in hands]
+    assert scores == sorted(scores)
+    assert category(scores[4]) == "Straight"
+
+
+def test_batch_matches_scalar_path():
+    rng = np.random.default_rng(7)
+    cards = rng.random((2000, 52)).argsort(axis=1)[:, :7]
+    batch = evaluate_batch(cards)
+    assert [evaluate(row) for row in cards.tolist()] == batch.tolist()
+
+
+def test_pocket_aces_equity_against_one_opponent():
+    result = estimate_equity(["As", "Ah"], [], 1, samples=50000, rng=np.random.default_rng(1))
+    assert abs(result.equity - 0.85) < 0.01
@@ -0,0 +1,23 @@
+import re
+from datetime import datetime, timezone
+
+from src.services.hand_export import decode_cursor, encode_cursor, hand_from_dict, hand_to_dict, to_pokerstars
+from src.services.simulator import play_hand
+
+
+def test_ndjson_round_trip_and_cursor():
+    hand = play_hand(num_players=6, seed=3)
+    hand.created_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+    assert hand_from_dict(hand_to_dict(hand)) == hand
+    assert decode_cursor(encode_cursor(hand)) == (hand.created_at, hand.id)
+
+
+def test_pokerstars_text_pays_out_the_whole_pot():
+    for seed in range(40):
+        hand = play_hand(num_players=[2, 3, 6][seed % 3], stack=[10000, 300][seed % 2], seed=seed)
+        text = to_pokerstars(hand)
+
+        assert text.startswith(f"PokerStars Hand #{hand.id}:")
+        pot = int(re.search(r"Total pot (\d+)", text).group(1))
+        assert sum(int(x) for x in re.findall(r"collected (\d+) from pot", text)) == pot
@@ -0,0 +1,62 @@
+import time
+
+from src.services.game import deal_cards, seat_dealer
+from src.services.hand_pool import HandPool
+
+
+def wait_for(pool: HandPool, key, ready: int):
+    deadline = time.time() + 10
+    while pool.depths().get(key, 0) < ready:
+        assert time.time() < deadline, pool.depths()
+        time.sleep(0.01)
+
+
+def test_first_take_misses_then_producer_fills_the_pool():
+    pool = HandPool(deal_cards, depth=3)
+    pool.start()
+    try:
+        assert pool.take(6, 5000) is None
+        wait_for(pool, (6, 5000), 3)
+
+        gs = pool.take(6, 5000)
+        assert gs.starting_stack == 5000 and len(gs.players) == 6
+        seat_dealer(gs, 2)
+        assert gs.dealer_index == 2
+        assert "Player 3 is the dealer" in gs.actions_log.render()
+    finally:
+        pool.stop()
+
+
+def test_invalidate_drops_hands_dealt_at_the_old_stack():
+    pool = HandPool(deal_cards, depth=2)
+    pool.start()
+    try:
+        pool.warm(4, 1000)
+        wait_for(pool, (4, 1000), 2)
+        pool.invalidate(2000)
+        assert (4, 1000) not in pool.depths()
+
+        wait_for(pool, (4, 2000), 2)
+        assert pool.take(4, 2000).starting_stack == 2000
+    finally:
+        pool.stop()
+
+
+def test_a_configuration_that_cannot_be_dealt_is_dropped():
+    def deal(num_players, stack):
+        if num_players > 10:
+            raise ValueError("not enough cards")
+        return deal_cards(num_players, stack)
+
+    pool = HandPool(deal, depth=2)
+    pool.start()
+    try:
+        pool.warm(6, 1000)
+        assert pool.take(30, 1000) is None
+        wait_for(pool, (6, 1000), 2)
+        deadline = time.time() + 10
+        while (30, 1000) in pool.depths():
+            assert time.time() < deadline
+            time.sleep(0.01)
+    finally:
+        pool.stop()
@@ -0,0 +1,52 @@
+from dataclasses import replace
+
+from src.models.hand import HandHistory
+from src.repositories.sqlite_hand_repo import SQLiteHandStore
+from src.services.hand_record import FLAG_TEXT, decode_record, encode_hand, render_record
+from src.services.simulator import play_hand
+
+
+def texts(hand: HandHistory):
+    return hand.mainInfo, hand.dealt, hand.actions, hand.result
+
+
+def test_records_render_the_original_text():
+    for seed in range(40):
+        hand = play_hand(2 + seed % 8, seed % 3, seed=seed)
+        assert len(hand.record) < len(hand.actions) / 4
+        assert render_record(hand.record) == texts(hand)
+        # Parsing the text back packs to the same bytes as packing the log.
+        assert encode_hand(replace(hand, record=None)) == hand.record
+
+    packed = decode_record(hand.record)
+    assert [net for _, net in packed.seats] == [seat.net for seat in hand.seats]
+
+
+def test_text_the_renderer_cannot_reproduce_is_kept_verbatim():
+    hand = HandHistory(id="h", mainInfo="Stack 500", dealt="Hands: –", actions="Player 1 dances", result="Winnings:")
+    record = encode_hand(hand)
+    assert record[3] & FLAG_TEXT
+    assert render_record(record) == texts(hand)
+
+
+def test_read_hands_render_lazily_and_legacy_rows_get_packed(tmp_path):
+    store = SQLiteHandStore(str(tmp_path / "hands.sqlite3"))
+    try:
+        hand = play_hand(6, 0, seed=5)
+        store.save_hand(hand)
+        read = store.get(hand.id)
+        assert "actions" not in read.__dict__
+        assert texts(read) == texts(hand)
+
+        legacy = play_hand(3, 1, seed=6)
+        store._conn.execute(
+            "INSERT INTO hands (id, stack, hands, actions, result, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (legacy.id, *texts(legacy), legacy.created_at.isoformat()),
+        )
+        assert store.pack_records(10) == 1
+        assert store.pack_records(10) == 0
+        row = store._conn.execute("SELECT actions, record FROM hands WHERE id = ?", (legacy.id,)).fetchone()
+        assert row == ("", legacy.record)
+        assert texts(store.get(legacy.id)) == texts(legacy)
+    finally:
+        store.close()
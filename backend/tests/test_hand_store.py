@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from src.db import get_db_connection
+from src.models.hand import HandHistory, SeatResult
+from src.partitions import ensure_partitions
+from src.repositories.hand_repo import HandSearch, HandStore, PostgresHandStore, _cards_filter
+from src.repositories.memory_hand_repo import MemoryHandStore
+from src.repositories.sqlite_hand_repo import SQLiteHandStore
+
+
+@pytest.fixture(params=["memory", "sqlite", "postgres"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryHandStore()
+    elif request.param == "sqlite":
+        store = SQLiteHandStore(str(tmp_path / "hands.sqlite3"))
+        yield store
+        store.close()
+    else:
+        request.getfixturevalue("postgres")
+        store = PostgresHandStore()
+        store.init()
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                ensure_partitions(cur, datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 2, tzinfo=timezone.utc))
+            conn.commit()
+        yield store
+        store.close()
+
+
+def make_hands(count: int):
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        HandHistory(
+            id=f"h{i}", mainInfo="", dealt="", actions="", result="",
+            created_at=now + timedelta(seconds=i), starting_stack=1000, board=["Ah", "Kd", "7c"][: i % 4],
+            seed=i, operations=[f"p1 cbr {i}"],
+            seats=[SeatResult(seat=1, hole_cards="AsAh" if i % 2 else "7c2d", net=i), SeatResult(seat=2, hole_cards="KsQs", net=-i)],
+        )
+        for i in range(count)
+    ]
+
+
+def test_save_get_and_page(store):
+    store.save_hand(make_hands(1)[0])
+    store.save_hands(make_hands(5)[1:])
+
+    hand = store.get("h3")
+    assert hand.seed == 3 and hand.operations == ["p1 cbr 3"] and hand.board == ["Ah", "Kd", "7c"]
+    assert [(s.seat, s.hole_cards, s.net) for s in hand.seats] == [(1, "AsAh", 3), (2, "KsQs", -3)]
+    assert store.get("missing") is None
+
+    first = store.list_page(3)
+    assert [h.id for h in first] == ["h4", "h3", "h2"]
+    second = store.list_page(3, (first[-1].created_at, first[-1].id))
+    assert [h.id for h in second] == ["h1", "h0"]
+    assert [h.id for h in store.iter_all(batch_size=2)] == ["h4", "h3", "h2", "h1", "h0"]
+
+
+def test_search_and_resumable_bulk_insert(store):
+    hands = make_hands(6)
+    assert store.bulk_insert(hands[:4]) == 4
+    assert store.bulk_insert(hands) == 2
+
+    assert [h.id for h in store.search(HandSearch(cards="AA"), 10)] == ["h5", "h3", "h1"]
+    assert len(store.search(HandSearch(cards="QKs"), 10)) == len(store.search(HandSearch(cards="kq"), 10)) == 6
+    assert [h.id for h in store.search(HandSearch(seat=1, net_min=2, net_max=4), 10)] == ["h4", "h3", "h2"]
+    assert [h.id for h in store.search(HandSearch(board=["Kd", "Ah"]), 10)] == ["h3", "h2"]
+    # A naive bound is UTC, the same instant on every store.
+    naive = HandSearch(since=datetime(2024, 1, 1, 0, 0, 2), until=datetime(2024, 1, 1, 0, 0, 4))
+    assert [h.id for h in store.search(naive, 10)] == ["h3", "h2"]
+
+    exported = [h.id for h in store.iter_after((hands[2].created_at, hands[2].id))]
+    assert exported == ["h3", "h4", "h5"]
+
+
+def test_stats_rollup_adds_increments(store):
+    store.add_stats([(1, 1, 50, 1, 0, 0, 0, 1, 1), (2, 1, -50, 0, 0, 1, 1, 0, 0)])
+    store.add_stats([(1, 1, -20, 0, 0, 0, 0, 0, 0)])
+    assert [tuple(row) for row in store.load_stats()] == [(1, 2, 30, 1, 0, 0, 0, 1, 1), (2, 1, -50, 0, 0, 1, 1, 0, 0)]
+
+    store.replace_stats([(3, 1, 0, 0, 0, 0, 0, 0, 0)])
+    assert [tuple(row) for row in store.load_stats()] == [(3, 1, 0, 0, 0, 0, 0, 0, 0)]
+def test_cards_filters_are_canonical_and_validated():
+    assert _cards_filter("KA") == ("hand_class", ["AKs", "AKo"])
+    assert _cards_filter("tas") == ("hand_class", ["ATs"])
+    assert _cards_filter("6s Ad") == ("hole_cards", ["Ad6s"])
+    for bad in ("AKx", "ZZ", "AAs", "A", "AKQ", "AsAs"):
+        with pytest.raises(ValueError):
+            _cards_filter(bad)
+
+
+def test_an_incomplete_backend_fails_when_constructed():
+    class WriteOnlyStore(HandStore):
+        def save_hand(self, hand):
+            pass
+
+    with pytest.raises(TypeError, match="abstract"):
+        WriteOnlyStore()
@@ -0,0 +1,92 @@
+import threading
+import time
+
+from src.models.hand import HandHistory
+from src.services.hand_writer import HandWriter
+
+
+def make_hand() -> HandHistory:
+    return HandHistory.create(mainInfo="Stack 10000", dealt="Hands:", actions="", result="Winnings:")
+
+
+def wait_until(predicate, timeout: float = 10):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_stop_flushes_every_queued_hand_in_batches():
+    batches = []
+    writer = HandWriter(save_batch=batches.append, batch_size=10, flush_interval=5)
+    for _ in range(25):
+        writer.submit(make_hand())
+    writer.stop()
+
+    assert sum(len(b) for b in batches) == 25
+    assert all(len(b) <= 10 for b in batches)
+    assert writer.written == 25
+
+
+def test_full_queue_falls_back_to_inline_write():
+    release = threading.Event()
+    flushing = threading.Event()
+    saved = []
+
+    def save_batch(hands):
+        if threading.current_thread().name == "hand-writer":
+            flushing.set()
+            release.wait()
+        saved.extend(hands)
+
+    writer = HandWriter(save_batch=save_batch, max_queue=1, flush_interval=0.01, enqueue_timeout=0)
+    writer.submit(make_hand())
+    flushing.wait()  # the writer thread is now stuck on a slow database
+    writer.submit(make_hand())
+    writer.submit(make_hand())
+    assert writer.inline_writes == 1 and len(saved) == 1
+
+    release.set()
+    writer.stop()
+    assert len(saved) == 3 and writer.written == 3
+
+
+def test_an_outage_is_waited_out_without_losing_hands():
+    calls = []
+    saved = []
+
+    def save_batch(hands):
+        calls.append(len(hands))
+        if len(calls) <= 8:
+            raise ConnectionError("database is down")
+        saved.extend(hands)
+
+    writer = HandWriter(save_batch=save_batch, batch_size=10, flush_interval=0.01, retry_delay=0.001)
+    hands = [make_hand() for _ in range(10)]
+    for hand in hands:
+        writer.submit(hand)
+    wait_until(lambda: writer.written == 10)
+    writer.stop()
+
+    assert sorted(h.id for h in saved) == sorted(h.id for h in hands)
+    assert writer.failed == 0
+
+
+def test_only_the_hand_the_store_rejects_is_dropped():
+    hands = [make_hand() for _ in range(10)]
+    bad = hands[6]
+    saved = []
+
+    def save_batch(batch):
+        if bad in batch:
+            raise ValueError("value too long")
+        saved.extend(batch)
+
+    writer = HandWriter(save_batch=save_batch, batch_size=10, flush_interval=0.01, retry_delay=0.001)
+    for hand in hands:
+        writer.submit(hand)
+    wait_until(lambda: writer.written + writer.failed == 10)
+    writer.stop()
+
+    assert writer.failed == 1
+    assert sorted(h.id for h in saved) == sorted(h.id for h in hands if h is not bad)
@@ -5,4 +5,15 @@ client = TestClient(app)
 
 def test_root_redirect():
     response = client.get("/")
-    assert response.status_code in [200, 307, 308]
\ No newline at end of file
+    assert response.status_code in [200, 307, 308]
+
+
+def test_metrics_exposition():
+    client.post("/hands/start", json={"num_players": 6, "dealer_index": 0})
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE poker_hands_started_total counter" in body
+    assert 'poker_user_action_seconds_bucket{le="+Inf"}' in body
+    assert "poker_live_tables " in body
@@ -0,0 +1,138 @@
+import gzip
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from src.db import get_db_connection, init_db
+from src.jobs import archive_hands
+from src.jobs.import_hands import load
+from src.jobs.migrate_hands import migrate
+from src.models.hand import hand_id_time, new_hand_id
+from src.partitions import ensure_partitions, has_unpartitioned, list_partitions, partition_bounds
+from src.repositories.hand_repo import HandRepository, PostgresHandStore, _get_query, _seat_rows
+from src.services.simulator import play_hand
+
+
+class FakeCursor:
+    def __init__(self, attached):
+        self.attached = list(attached)
+        self.created = []
+        self._rows = []
+
+    def execute(self, query, params=None):
+        text = query if isinstance(query, str) else query.as_string(None)
+        if "pg_inherits i JOIN" in text:
+            self._rows = [(name,) for name in self.attached]
+        elif "FROM pg_class c" in text:
+            self._rows = []
+        elif "PARTITION OF" in text:
+            self.created.append(text)
+            self._rows = []
+
+    def fetchall(self):
+        return self._rows
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_partition_names_round_trip_to_bounds():
+    assert partition_bounds("hands", "hands_p20261231") == (utc(2026, 12, 31), utc(2027, 1, 1))
+    assert partition_bounds("hands", "hands_p202612") == (utc(2026, 12, 1), utc(2027, 1, 1))
+    assert partition_bounds("hands", "hands_unpartitioned") is None
+
+
+def test_switching_to_months_fills_around_existing_days():
+    cur = FakeCursor(["hands_p20261018", "hands_p20261019"])
+    created = ensure_partitions(cur, utc(2026, 10, 16, 12), utc(2026, 11, 2), unit="month")
+
+    assert created[:2] == ["hands_p20261001", "hands_p20261002"]
+    assert "hands_p20261018" not in created and "hands_p20261020" in created
+    assert created[-1] == "hands_p202611"
+    # One hands and one hand_seats partition per range.
+    assert len(cur.created) == 2 * len(created)
+    assert cur.created[-1].endswith("FROM ('2026-11-01 00:00:00+00:00'::timestamptz) TO ('2026-12-01 00:00:00+00:00'::timestamptz)")
+
+
+def test_time_ordered_ids_bound_the_partitions_a_lookup_reads():
+    hand_id = new_hand_id()
+    dealt_at = hand_id_time(hand_id)
+    assert abs((datetime.now(timezone.utc) - dealt_at).total_seconds()) < 5
+    assert _get_query(hand_id)[1] == (hand_id, dealt_at - timedelta(minutes=5))
+    assert _get_query("9b2f6c1e-8d3a-4f5b-9c7d-2e1f0a3b4c5d")[0].endswith("WHERE id = %s")
+
+
+# ---- against Postgres (DATABASE_URL) ----
+
+LEGACY_SCHEMA = [
+    "CREATE TABLE hands (id TEXT PRIMARY KEY, stack TEXT NOT NULL, hands TEXT NOT NULL, actions TEXT NOT NULL, "
+    "result TEXT NOT NULL, created_at TIMESTAMPTZ NOT NULL DEFAULT now())",
+    "CREATE INDEX hands_created_at_id_idx ON hands (created_at DESC, id DESC)",
+    "CREATE TABLE hand_seats (hand_id TEXT NOT NULL REFERENCES hands (id) ON DELETE CASCADE, seat SMALLINT NOT NULL, "
+    "hole_cards TEXT NOT NULL, hand_class TEXT NOT NULL, net INTEGER NOT NULL, PRIMARY KEY (hand_id, seat))",
+    "CREATE INDEX hand_seats_seat_net_idx ON hand_seats (seat, net)",
+]
+
+
+def test_workers_starting_together_migrate_a_legacy_table_once(postgres):
+    old = [play_hand(3, i, seed=i) for i in range(5)]
+    for i, hand in enumerate(old):
+        # Random ids, as before ids were time-ordered, so lookups by id do not bound created_at.
+        hand.id, hand.created_at = str(uuid.uuid4()), utc(2024, 1, 1 + i)
+    with get_db_connection() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(statement)
+        for hand in old:
+            conn.execute(
+                "INSERT INTO hands (id, stack, hands, actions, result, created_at) VALUES (%s, %s, %s, %s, %s, %s)",
+                (hand.id, hand.mainInfo, hand.dealt, hand.actions, hand.result, hand.created_at),
+            )
+            for row in _seat_rows(hand):
+                conn.execute("INSERT INTO hand_seats VALUES (%s, %s, %s, %s, %s)", row)
+        conn.commit()
+
+    with ThreadPoolExecutor(4) as pool:
+        for future in [pool.submit(init_db) for _ in range(4)]:
+            future.result()
+
+    store = PostgresHandStore()
+    assert store.get(old[0].id) is None
+    assert migrate(batch_size=2).rows == 5
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            assert not has_unpartitioned(cur)
+            assert "hands_p20240103" in [name for name, _, _ in list_partitions(cur)]
+
+    moved = store.get(old[2].id)
+    assert (moved.mainInfo, moved.actions) == (old[2].mainInfo, old[2].actions)
+    assert [(s.seat, s.net) for s in moved.seats] == [(s.seat, s.net) for s in old[2].seats]
+    assert store.pack_records(10) == 5
+    assert store.get(old[2].id).actions == old[2].actions
+
+
+def test_old_partitions_are_archived_and_load_back(postgres, tmp_path):
+    store = PostgresHandStore()
+    init_db()
+    hands = [play_hand(2, 0, seed=i) for i in range(4)]
+    for i, hand in enumerate(hands):
+        hand.id, hand.created_at = str(uuid.uuid4()), utc(2024, 1, 1 + i // 2, 12)
+    assert store.bulk_insert(hands) == 4
+    assert store.bulk_insert(hands) == 0
+
+    archived = archive_hands.run(keep_days=30, directory=str(tmp_path))
+    assert archived == ["hands_p20240101", "hands_p20240102"]
+    assert store.get(hands[0].id) is None
+    with gzip.open(tmp_path / "hands_p20240101.ndjson.gz", "rt") as f:
+        assert len(f.readlines()) == 2
+    assert archive_hands.run(keep_days=30, directory=str(tmp_path)) == []
+
+    HandRepository.use(store)
+    try:
+        with gzip.open(tmp_path / "hands_p20240102.ndjson.gz", "rt") as lines:
+            assert load(lines).rows == 2
+    finally:
+        HandRepository.use(None)
+    restored = store.get(hands[3].id)
+    assert restored.actions == hands[3].actions
+    assert [s.hole_cards for s in restored.seats] == [s.hole_cards for s in hands[3].seats]
@@ -0,0 +1,56 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.services.profiler import ProfileMiddleware, Sampler, profile_store
+
+client = TestClient(app)
+
+
+def spin(seconds: float):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_sampler_counts_busy_stacks():
+    sampler = Sampler(interval=0.001)
+    sampler.start()
+    spin(0.1)
+    sampler.stop()
+
+    assert sampler.samples > 10
+    stack, count = next((s, c) for s, c in sampler.stacks.items() if s.endswith("tests.test_profiler:spin"))
+    assert stack.startswith("MainThread;")
+    assert count > 10
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in sampler.collapsed().splitlines())
+
+
+def test_profiles_are_written_per_request_and_guarded(tmp_path, monkeypatch):
+    monkeypatch.setattr(profile_store, "directory", str(tmp_path))
+    monkeypatch.setattr(profile_store, "keep", 2)
+    profiled = TestClient(ProfileMiddleware(app, profile_store))
+
+    monkeypatch.setattr(profile_store, "sample_rate", 1.0)
+    profiled.get("/health")
+    assert len(profile_store.list()) == 1
+    # Sampling alone does not open the listing.
+    assert client.get("/debug/profiles").status_code == 404
+
+    monkeypatch.setattr(profile_store, "sample_rate", 0.0)
+    monkeypatch.setattr(profile_store, "token", "secret")
+    assert client.get("/debug/profiles", headers={"X-Profile": "secret"}).json()["profiles"] == profile_store.list()
+    for _ in range(3):
+        profiled.get("/health", headers={"X-Profile": "secret"})
+    profiled.get("/health", headers={"X-Profile": "wrong"})
+
+    assert client.get("/debug/profiles", headers={"X-Profile": "wrong"}).status_code == 403
+    profiles = client.get("/debug/profiles", headers={"X-Profile": "secret"}).json()["profiles"]
+    assert len(profiles) == 2
+    assert "-GET-health-" in profiles[0]["name"]
+
+    response = client.get(f"/debug/profiles/{profiles[0]['name']}", headers={"X-Profile": "secret"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert client.get("/debug/profiles/..", headers={"X-Profile": "secret"}).status_code == 404
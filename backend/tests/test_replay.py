@@ -0,0 +1,28 @@
+from src.jobs.audit_hands import audit
+from src.services.replay import replay_hand
+from src.services.simulator import play_hand
+
+
+def test_same_seed_deals_the_same_hand():
+    first = play_hand(num_players=6, seed=42)
+    second = play_hand(num_players=6, seed=42)
+    assert first.seed == 42
+    assert first.dealt == second.dealt
+    assert first.operations[:12] == second.operations[:12]
+
+
+def test_replay_matches_and_detects_tampering():
+    hand = play_hand(num_players=6, seed=7)
+    assert replay_hand(hand).ok
+
+    hand.result = hand.result.replace("Player 1: ", "Player 1: 1", 1)
+    result = replay_hand(hand)
+    assert not result.ok
+    assert "stored" in result.error
+
+
+def test_audit_over_a_process_pool():
+    hands = [play_hand(num_players=4, dealer_index=i % 4, seed=i) for i in range(30)]
+    report = audit(hands, workers=2, chunk_size=8)
+    assert report.checked == 30
+    assert report.mismatches == []
@@ -0,0 +1,80 @@
+import asyncio
+
+from src.repositories.hand_repo import HandRepository
+from src.repositories.memory_hand_repo import MemoryHandStore
+from src.services import game
+from src.services.scheduler import TableScheduler
+
+
+async def wait_until(predicate, timeout: float = 10):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+def test_scheduler_runs_bots_and_plays_for_an_idle_user():
+    async def scenario():
+        scheduler = TableScheduler(workers=2, action_timeout=0.05, sweep_interval=0)
+        scheduler.start()
+        try:
+            gs = game.start_hand(num_players=3, seed=7)
+            await wait_until(lambda: gs.status == "FINISHED")
+            return gs
+        finally:
+            scheduler.stop()
+
+    previous = HandRepository.use(MemoryHandStore())
+    try:
+        gs = asyncio.run(scenario())
+    finally:
+        HandRepository.use(previous)
+        game.registry.clear()
+
+    assert game.bot_scheduler is None
+    assert "Player 1 ran out of time" in gs.actions_log.render()
+    assert gs.hand is not None
+
+
+def test_a_failed_bot_run_is_retried_with_backoff(monkeypatch):
+    advance_table = game.advance_table
+    calls = []
+
+    def flaky(game_id):
+        calls.append(game_id)
+        if len(calls) <= 2:
+            raise RuntimeError("version conflict")
+        return advance_table(game_id)
+
+    async def scenario():
+        scheduler = TableScheduler(workers=1, action_timeout=0.05, sweep_interval=0, retry_delay=0.01)
+        scheduler.start()
+        try:
+            gs = game.start_hand(num_players=3, seed=7)
+            await wait_until(lambda: gs.status == "FINISHED")
+            return gs, scheduler.stats()
+        finally:
+            scheduler.stop()
+
+    monkeypatch.setattr(game, "advance_table", flaky)
+    previous = HandRepository.use(MemoryHandStore())
+    try:
+        gs, stats = asyncio.run(scenario())
+    finally:
+        HandRepository.use(previous)
+        game.registry.clear()
+
+    assert len(calls) > 2
+    assert stats["retrying"] == 0
+    assert "Player 1 ran out of time" in gs.actions_log.render()
+
+
+def test_auto_act_ignores_a_stale_clock():
+    gs = game.start_hand(num_players=2, seed=3)
+    try:
+        game.advance_table(gs.id)
+        assert not game.auto_act(gs.id, len(gs.actions_log) + 1)
+        assert game.auto_act(gs.id, len(gs.actions_log))
+        assert "Player 1 ran out of time" in gs.actions_log.render()
+    finally:
+        game.reset_game(game_id=gs.id)
@@ -0,0 +1,20 @@
+import re
+from src.services.simulator import main, play_hand
+from src.services.tables import registry
+
+
+def test_play_hand_runs_to_completion_without_registering_a_table():
+    tables_before = len(registry)
+    hand = play_hand(num_players=6)
+
+    nets = [int(n) for n in re.findall(r"Player \d+: ([+-]?\d+)", hand.result)]
+    assert len(nets) == 6
+    assert sum(nets) == 0
+    assert len(registry) == tables_before
+
+
+def test_output_file_is_complete_when_main_returns(tmp_path):
+    path = tmp_path / "hands.ndjson"
+    main(["--hands", "6", "--chunk", "2", "--workers", "1", "--seed", "1", "--output", str(path)])
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 6
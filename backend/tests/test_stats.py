@@ -0,0 +1,51 @@
+from src.repositories.hand_repo import HandRepository
+from src.repositories.sqlite_hand_repo import SQLiteHandStore
+from src.services.simulator import play_hand
+from src.services.stats import StatsAggregator, actions_from_text, compute_hand_stats, nets_from_text, stats_from_hand
+
+
+def test_stats_are_recovered_from_stored_text():
+    actions = (
+        "Player 1 is dealt ACE OF DIAMONDS (Ad), SIX OF SPADES (6s) --- "
+        "Player 3 calls 40 chips Player 1 raises to 160 chips Player 2 folds Player 3 calls 120 chips "
+        "Js7d3s Player 1 bets 200 chips Player 3 folds"
+    )
+    result = "Winnings: Player 1: +360; Player 2: -40; Player 3: -320"
+
+    p1, p2, p3 = compute_hand_stats(actions_from_text(actions), nets_from_text(result))
+
+    assert (p1.vpip, p1.pfr, p1.net) == (1, 1, 360)
+    assert (p2.vpip, p2.pfr) == (0, 0)
+    assert (p3.vpip, p3.pfr, p3.faced_bet, p3.folded_to_bet) == (1, 0, 1, 1)
+    assert p1.showdowns == 0
+
+
+def test_workers_share_totals_through_the_sqlite_rollup(tmp_path):
+    hands = [play_hand(4, i % 4, seed=i) for i in range(20)]
+
+    store = SQLiteHandStore(str(tmp_path / "hands.sqlite3"))
+    previous = HandRepository.use(store)
+    try:
+        worker_a = StatsAggregator(cache_ttl=60)
+        worker_b = StatsAggregator(cache_ttl=0)
+        for hand in hands:
+            worker_a.record(stats_from_hand(hand))
+        assert worker_b.all() == []
+        worker_a.flush()
+        shared = worker_b.all()
+
+        store.close()
+        store = SQLiteHandStore(str(tmp_path / "hands.sqlite3"))
+        HandRepository.use(store)
+        restarted = StatsAggregator()
+        restarted.load()
+        players = restarted.all()
+    finally:
+        HandRepository.use(previous)
+        store.close()
+
+    assert shared == players == worker_a.all()
+    assert [p.seat for p in players] == [1, 2, 3, 4]
+    assert all(p.hands == 20 for p in players)
+    assert [p.net for p in players] == [sum(h.seats[i].net for h in hands) for i in range(4)]
+    assert sum(p.vpip for p in players) > 0
@@ -0,0 +1,112 @@
+import pytest
+from src.models.game_state import GameState
+from src.services.tables import TableRegistry
+
+
+def make_game(game_id: str) -> GameState:
+    return GameState(id=game_id, players=[], dealer_index=0, stacks=[], poker_state=None)
+
+
+def test_tables_are_addressed_by_id():
+    reg = TableRegistry(max_tables=10, idle_ttl=60)
+    reg.add(make_game("a"))
+    reg.add(make_game("b"))
+
+    with reg.acquire("a") as gs:
+        assert gs.id == "a"
+    with pytest.raises(KeyError):
+        with reg.acquire("missing"):
+            pass
+
+
+def test_least_recently_used_table_is_evicted_over_cap():
+    reg = TableRegistry(max_tables=2, idle_ttl=60)
+    reg.add(make_game("a"))
+    reg.add(make_game("b"))
+    with reg.acquire("a"):
+        pass
+    reg.add(make_game("c"))
+
+    assert "a" in reg
+    assert "b" not in reg
+    assert "c" in reg
+
+
+def test_idle_tables_expire():
+    reg = TableRegistry(max_tables=10, idle_ttl=0)
+    reg.add(make_game("a"))
+    assert reg.evict_idle() == 1
+    assert len(reg) == 0
+
+
+def test_workers_sharing_a_store_see_each_others_transitions():
+    from src.services.game import deal_hand
+    from src.services.state_store import MemoryStateStore, VersionConflict
+
+    store = MemoryStateStore()
+    worker_a = TableRegistry(store=store)
+    worker_b = TableRegistry(store=store)
+    gs = deal_hand(num_players=6)
+    worker_a.add(gs)
+
+    with worker_b.acquire(gs.id) as loaded:
+        assert loaded.hole_cards == gs.hole_cards
+        loaded.status = "FINISHED"
+    assert worker_a.get(gs.id).status == "FINISHED"
+
+    with pytest.raises(VersionConflict):
+        with worker_a.acquire(gs.id) as mine:
+            with worker_b.acquire(gs.id) as theirs:
+                theirs.stacks = [1]
+            mine.stacks = [2]
+    with worker_a.acquire(gs.id) as current:
+        assert current.stacks == [1]
+
+
+def test_a_transition_that_loses_the_race_does_not_store_its_hand(monkeypatch):
+    from src.repositories.hand_repo import HandRepository
+    from src.repositories.memory_hand_repo import MemoryHandStore
+    from src.services import game
+    from src.services.state_store import MemoryStateStore, VersionConflict
+    from src.services.stats import StatsAggregator
+
+    stats = StatsAggregator()
+    monkeypatch.setattr(game, "stats_aggregator", stats)
+    monkeypatch.setattr(game, "WRITE_BEHIND", False)
+    store = MemoryStateStore()
+    worker_a = TableRegistry(store=store)
+    worker_b = TableRegistry(store=store)
+    gs = game.deal_hand(num_players=3, seed=5)
+    worker_a.add(gs)
+
+    previous = HandRepository.use(MemoryHandStore())
+    try:
+        with pytest.raises(VersionConflict):
+            with worker_a.acquire(gs.id) as mine:
+                with worker_b.acquire(gs.id) as theirs:
+                    game.finalize_hand(theirs)
+                game.finalize_hand(mine)
+        hands = HandRepository.list_all()
+        seat_1 = stats.get(1)
+    finally:
+        HandRepository.use(previous)
+
+    assert [hand.id for hand in hands] == [gs.id]
+    assert seat_1.hands == 1
+
+
+def test_sqlite_store_round_trips_a_live_hand(tmp_path):
+    from src.services.game import bots_act_until_user_turn, deal_hand
+    from src.services.state_store import SQLiteStateStore
+
+    store = SQLiteStateStore(str(tmp_path / "tables.sqlite3"))
+    gs = deal_hand(num_players=6, seed=3)
+    bots_act_until_user_turn(gs)
+    store.create(gs)
+
+    loaded, version = store.load(gs.id)
+    assert version == 1
+    assert list(loaded.actions_log) == list(gs.actions_log)
+    assert loaded.poker_state.actor_indices == gs.poker_state.actor_indices
+    assert store.save(loaded, 1) == 2
+    store.close()
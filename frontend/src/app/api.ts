@@ -8,8 +8,12 @@ export const startGame = async (num_players = 6, dealer_index = 0) => {
     return api.post("/hands/start", { num_players, dealer_index });
 }
 
-export const playerAction = async (action: string, amount?: number) => {
-    return api.post(`/hands/action`, { action, amount });
+export const playerAction = async (game_id: string, action: string, amount?: number, since?: number) => {
+    return api.post(`/hands/action`, { game_id, action, amount, since });
+};
+
+export const tableEvents = (game_id: string, since = 0) => {
+    return new EventSource(`${api.defaults.baseURL}/tables/${game_id}/events?since=${since}`);
 };
 
 export const getState = async (hand_id: string) => {
@@ -24,10 +28,10 @@ export const getHistory = async () => {
     return api.get("/hands/");
 };
 
-export const resetGame = async(stack: number) => {
-    return api.post("/reset/game", { stack })
+export const resetGame = async(stack: number, game_id?: string | null) => {
+    return api.post("/reset/game", { stack, game_id })
 }
 
-export const applyStacks = async (stack: number) => {
-  return api.post("/apply/stacks", { stack });
+export const applyStacks = async (stack: number, game_id?: string | null) => {
+  return api.post("/apply/stacks", { stack, game_id });
 };
\ No newline at end of file
@@ -1,6 +1,6 @@
 "use client";
-import { useState, useEffect } from "react";
-import { startGame, playerAction, getHistory, resetGame, applyStacks } from "./api";
+import { useState, useEffect, useRef } from "react";
+import { startGame, playerAction, getHistory, resetGame, applyStacks, tableEvents } from "./api";
 
 export default function Home() {
   const[log, setLog] = useState<string[]>([]);
@@ -10,11 +10,38 @@ export default function Home() {
   const [betAmount, setBetAmount] = useState(20);
   const [raiseAmount, setRaiseAmount] = useState(40);
   const [startingStack, setStartingStack] = useState(10000);
+  const events = useRef<EventSource | null>(null);
 
   useEffect(() => {
     loadHistory();
+    return () => closeEvents();
   }, []);
 
+  const closeEvents = () => {
+    events.current?.close();
+    events.current = null;
+  };
+
+  // Bots and the action clock move the table between our requests, so the
+  // log arrives over the table's event stream rather than in responses.
+  const followTable = (id: string, since: number) => {
+    closeEvents();
+    const source = tableEvents(id, since);
+    source.addEventListener("action", (e) => {
+      const data = JSON.parse((e as MessageEvent).data);
+      setLog((prevLog) => [...prevLog, data.text]);
+      setLastLength(data.seq);
+    });
+    source.addEventListener("finished", async () => {
+      closeEvents();
+      setGameId(null);
+      setLastLength(0);
+      await loadHistory();
+    });
+    source.addEventListener("closed", () => closeEvents());
+    events.current = source;
+  };
+
   const loadHistory = async () => {
     try {
       const response = await getHistory();
@@ -25,25 +52,9 @@ export default function Home() {
   };
 
   const handleAction = async (action: string, amount?: number) => {
+    if (!gameId) return;
     try {
-      const response = await playerAction(action, amount);
-      const actions = response.data.actions || [];
-      const newEntries = actions.slice(lastLength);
-      setLog((prevLog) => [
-        ...prevLog,
-        ...newEntries,
-      ]);
-      setLastLength(actions.length);
-
-      if (response.data.finished) {
-        await loadHistory();
-        setGameId(null);
-        setLastLength(0);
-        setLog((prevLog) => [
-          ...prevLog,
-          ...(response.data.hands || [])
-        ]);
-      }
+      await playerAction(gameId, action, amount, lastLength);
     } catch (error) {
       console.error("Error performing action:", error);
     }
@@ -52,6 +63,7 @@ export default function Home() {
   const handleStart = async () => {
     try {
       const response = await startGame();
+      setGameId(response.data.game_id);
       const log = response.data.log || [];
       const newEntry = log.slice(lastLength);
       setLog((prevLog) => [
@@ -59,6 +71,7 @@ export default function Home() {
         ...newEntry,
       ]);
       setLastLength(log.length);
+      followTable(response.data.game_id, log.length);
     } catch (error) {
       console.error("Error starting game:", error);
     }
@@ -66,8 +79,9 @@ export default function Home() {
 
   const handleReset = async() => {
     try {
-      const response = await resetGame(startingStack);
+      const response = await resetGame(startingStack, gameId);
       console.log(response.data.message);
+      closeEvents();
       setLog([]);
       setLastLength(0);
       setGameId(null);
@@ -80,7 +94,7 @@ export default function Home() {
 
   const handleApply = async () => {
     try {
-      const response = await applyStacks(startingStack);
+      const response = await applyStacks(startingStack, gameId);
       console.log(response.data.message);
       setLog((prev) => [...prev, `Stacks set to ${startingStack}`]);
     } catch (error) {
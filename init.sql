@@ -1,7 +1,48 @@
+-- Same schema as backend/src/db.py SCHEMA. The backend creates the hands and
+-- hand_seats partitions (src/partitions.py) when it starts.
+
 CREATE TABLE IF NOT EXISTS hands (
-                id TEXT PRIMARY KEY,
-                stack TEXT NOT NULL,
-                hands TEXT NOT NULL,
-                actions TEXT NOT NULL,
-                result TEXT NOT NULL
-            );
\ No newline at end of file
+    id TEXT NOT NULL,
+    stack TEXT NOT NULL,
+    hands TEXT NOT NULL,
+    actions TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    starting_stack INTEGER,
+    dealer_seat SMALLINT,
+    board TEXT[] NOT NULL DEFAULT '{}',
+    seed BIGINT,
+    operations TEXT[] NOT NULL DEFAULT '{}',
+    record BYTEA,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE INDEX IF NOT EXISTS hands_created_at_id_idx ON hands (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS hands_board_idx ON hands USING GIN (board);
+CREATE INDEX IF NOT EXISTS hands_unpacked_idx ON hands (id) WHERE record IS NULL;
+
+CREATE TABLE IF NOT EXISTS hand_seats (
+    hand_id TEXT NOT NULL,
+    seat SMALLINT NOT NULL,
+    hole_cards TEXT NOT NULL,
+    hand_class TEXT NOT NULL,
+    net INTEGER NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (hand_id, seat, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE INDEX IF NOT EXISTS hand_seats_seat_net_idx ON hand_seats (seat, net);
+CREATE INDEX IF NOT EXISTS hand_seats_class_idx ON hand_seats (hand_class, seat);
+CREATE INDEX IF NOT EXISTS hand_seats_cards_idx ON hand_seats (hole_cards, seat);
+
+CREATE TABLE IF NOT EXISTS player_stats (
+    seat SMALLINT PRIMARY KEY,
+    hands BIGINT NOT NULL DEFAULT 0,
+    net BIGINT NOT NULL DEFAULT 0,
+    vpip BIGINT NOT NULL DEFAULT 0,
+    pfr BIGINT NOT NULL DEFAULT 0,
+    faced_bet BIGINT NOT NULL DEFAULT 0,
+    folded_to_bet BIGINT NOT NULL DEFAULT 0,
+    showdowns BIGINT NOT NULL DEFAULT 0,
+    showdowns_won BIGINT NOT NULL DEFAULT 0
+);